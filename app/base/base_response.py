@@ -11,3 +11,11 @@ class BaseResponse(BaseModel, Generic[TData]):
     status_code: int = Field(..., description="HTTP status code for the response")
     detail: str = Field(..., description="Human readable message with extra details")
     data: TData | None = Field(default=None, description="Payload returned by the endpoint")
+
+
+class PageResponse(BaseResponse[TData], Generic[TData]):
+    """Response envelope for keyset-paginated listings."""
+
+    next_cursor: str | None = Field(
+        default=None, description="Opaque cursor for the next page, null on the last page"
+    )
@@ -0,0 +1,25 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response that encodes a response envelope exactly once.
+
+    Returning this from an endpoint makes FastAPI skip the ``response_model``
+    re-validation and ``jsonable_encoder`` pass; keep ``response_model`` on the
+    route so the OpenAPI schema is unchanged. Pydantic models are encoded by
+    pydantic-core directly, other payloads use orjson when it is installed.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel) or orjson is None:
+            return to_json(content)
+        return orjson.dumps(content)
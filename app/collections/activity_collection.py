@@ -1,21 +1,35 @@
 ﻿from dataclasses import asdict
+from datetime import datetime
 from typing import Any
 
 from bson import ObjectId
 
 from app.db.mongo_db import db
 from app.documents.activity_document import ActivityDocument
-from app.utils.mongo_helpers import serialize_document
+from app.utils.mongo_helpers import drop_indexes, ensure_ttl_index
+from app.utils.pagination import SortSpec, find_page
+
+
+def _next_month(moment: datetime) -> datetime:
+    if moment.month == 12:
+        return moment.replace(year=moment.year + 1, month=1)
+    return moment.replace(month=moment.month + 1)
 
 
 class ActivityCollection:
     _collection = db["activities"]
+    _FEED_SORT: SortSpec = [("occurred_at", -1), ("_id", -1)]
+    # The single-field indexes are prefixes of the feed indexes below.
+    _LEGACY_INDEXES = ("project_id_1", "task_id_1")
 
     @classmethod
-    async def create_indexes(cls) -> None:
-        await cls._collection.create_index("project_id")
-        await cls._collection.create_index("task_id")
-        await cls._collection.create_index("occurred_at")
+    async def create_indexes(cls, *, expire_after_seconds: int | None = None) -> None:
+        """Create the feed indexes; ``expire_after_seconds`` turns on TTL expiry of old entries."""
+        await drop_indexes(cls._collection, cls._LEGACY_INDEXES)
+        await cls._collection.create_index([("project_id", 1), *cls._FEED_SORT])
+        await cls._collection.create_index([("task_id", 1), *cls._FEED_SORT])
+        await cls._collection.create_index(cls._FEED_SORT)
+        await ensure_ttl_index(cls._collection, "occurred_at", expire_after_seconds)
 
     @classmethod
     async def insert(cls, document: ActivityDocument) -> ObjectId:
@@ -23,18 +37,66 @@ class ActivityCollection:
         result = await cls._collection.insert_one(payload)
         return result.inserted_id
 
+    @classmethod
+    async def insert_many(cls, documents: list[ActivityDocument]) -> None:
+        if documents:
+            await cls._collection.insert_many(
+                [asdict(document) for document in documents], ordered=False
+            )
+
     @classmethod
     async def recent_for_project(cls, project_id: str, limit: int = 20) -> list[dict[str, Any]]:
         cursor = (
             cls._collection.find({"project_id": ObjectId(project_id)})
-            .sort("occurred_at", -1)
+            .sort(cls._FEED_SORT)
             .limit(limit)
         )
         items = await cursor.to_list(length=limit)
-        return [serialize_document(item) for item in items]
+        return items
+
+    @classmethod
+    async def find_by_task(
+        cls, task_id: str, *, limit: int = 50, cursor: str | None = None
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        items, next_cursor = await find_page(
+            cls._collection,
+            {"task_id": ObjectId(task_id)},
+            cls._FEED_SORT,
+            limit=limit,
+            cursor=cursor,
+        )
+        return items, next_cursor
 
     @classmethod
     async def recent_global(cls, limit: int = 20) -> list[dict[str, Any]]:
-        cursor = cls._collection.find().sort("occurred_at", -1).limit(limit)
+        cursor = cls._collection.find().sort(cls._FEED_SORT).limit(limit)
         items = await cursor.to_list(length=limit)
-        return [serialize_document(item) for item in items]
+        return items
+
+    @classmethod
+    async def archive_before(cls, cutoff: datetime) -> int:
+        """Move entries older than ``cutoff`` into ``activities_archive_YYYYMM``; return the count.
+
+        Each month is copied with ``$merge`` (keeping already archived copies)
+        before it is deleted, so an interrupted run can simply be repeated.
+        """
+        moved = 0
+        while True:
+            oldest = await cls._collection.find_one(
+                {"occurred_at": {"$lt": cutoff}},
+                projection={"occurred_at": 1},
+                sort=[("occurred_at", 1)],
+            )
+            if oldest is None:
+                return moved
+            start = oldest["occurred_at"].replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            window = {"occurred_at": {"$gte": start, "$lt": min(_next_month(start), cutoff)}}
+            merge = {
+                "into": f"{cls._collection.name}_archive_{start:%Y%m}",
+                "on": "_id",
+                "whenMatched": "keepExisting",
+                "whenNotMatched": "insert",
+            }
+            await cls._collection.aggregate([{"$match": window}, {"$merge": merge}]).to_list(length=None)
+            result = await cls._collection.delete_many(window)
+            moved += result.deleted_count
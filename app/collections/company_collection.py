@@ -2,42 +2,62 @@
 from typing import Any
 
 from bson import ObjectId
+from pymongo import ReturnDocument
 
+from app.db.event_bus import event_bus
 from app.db.mongo_db import db
 from app.documents.company_document import CompanyDocument
-from app.utils.mongo_helpers import serialize_document
+from app.utils.pagination import SortSpec, find_page
 
 
 class CompanyCollection:
     _collection = db["companies"]
+    _LIST_SORT: SortSpec = [("created_at", -1), ("_id", -1)]
 
     @classmethod
     async def create_indexes(cls) -> None:
         await cls._collection.create_index("name", unique=True)
+        await cls._collection.create_index(cls._LIST_SORT)
 
     @classmethod
-    async def insert(cls, document: CompanyDocument) -> ObjectId:
+    async def insert(cls, document: CompanyDocument) -> dict[str, Any]:
+        """Insert ``document`` and return the stored payload, ready for the mappers."""
         payload = asdict(document)
-        result = await cls._collection.insert_one(payload)
-        return result.inserted_id
+        await cls._collection.insert_one(payload)
+        await event_bus.publish(event_bus.change("company", None, payload))
+        return payload
 
     @classmethod
     async def find_by_id(cls, company_id: str) -> dict[str, Any] | None:
         document = await cls._collection.find_one({"_id": ObjectId(company_id)})
-        return serialize_document(document) if document else None
+        return document
 
     @classmethod
-    async def find_many(cls) -> list[dict[str, Any]]:
-        cursor = cls._collection.find().sort("created_at", -1)
-        items = await cursor.to_list(length=500)
-        return [serialize_document(item) for item in items]
+    async def find_many(
+        cls, *, limit: int = 500, cursor: str | None = None
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        items, next_cursor = await find_page(
+            cls._collection, {}, cls._LIST_SORT, limit=limit, cursor=cursor
+        )
+        return items, next_cursor
 
     @classmethod
-    async def update(cls, company_id: str, data: dict[str, Any]) -> bool:
-        result = await cls._collection.update_one({"_id": ObjectId(company_id)}, {"$set": data})
-        return result.modified_count > 0
+    async def update(cls, company_id: str, data: dict[str, Any]) -> dict[str, Any] | None:
+        """Apply ``data`` and return the updated document, or ``None`` if missing."""
+        document = await cls._collection.find_one_and_update(
+            {"_id": ObjectId(company_id)}, {"$set": data}, return_document=ReturnDocument.AFTER
+        )
+        if document is not None:
+            await event_bus.publish(
+                event_bus.event(
+                    "company", "updated", document["_id"], document=document, changed=sorted(data)
+                )
+            )
+        return document
 
     @classmethod
     async def delete(cls, company_id: str) -> bool:
         result = await cls._collection.delete_one({"_id": ObjectId(company_id)})
+        if result.deleted_count:
+            await event_bus.publish(event_bus.event("company", "deleted", ObjectId(company_id)))
         return result.deleted_count > 0
@@ -0,0 +1,99 @@
+from typing import Any
+
+from pymongo import DeleteOne, UpdateOne
+
+from app.db.mongo_db import db
+
+
+class CounterCollection:
+    """Pre-aggregated counts keyed by ``(kind, scope, key)``.
+
+    ``kind`` names the distribution (``project_status``, ``task_status`` ...),
+    ``scope`` narrows it (``global``, ``company:<id>``, ``project:<id>`` ...)
+    and ``key`` is the bucket being counted (a status, a department id ...).
+    """
+
+    _collection = db["counters"]
+
+    @staticmethod
+    def _counter_id(kind: str, scope: str, key: str) -> str:
+        return f"{kind}:{scope}:{key}"
+
+    @classmethod
+    async def create_indexes(cls) -> None:
+        await cls._collection.create_index([("kind", 1), ("scope", 1)])
+
+    @classmethod
+    async def is_empty(cls) -> bool:
+        return await cls._collection.find_one({}, {"_id": 1}) is None
+
+    @classmethod
+    async def has_scope_prefix(cls, kind: str, prefix: str) -> bool:
+        document = await cls._collection.find_one(
+            {"kind": kind, "scope": {"$regex": f"^{prefix}"}}, {"_id": 1}
+        )
+        return document is not None
+
+    @classmethod
+    async def increment(cls, deltas: dict[tuple[str, str, str], int]) -> None:
+        operations = [
+            UpdateOne(
+                {"_id": cls._counter_id(kind, scope, key)},
+                {
+                    "$inc": {"count": delta},
+                    "$setOnInsert": {"kind": kind, "scope": scope, "key": key},
+                },
+                upsert=True,
+            )
+            for (kind, scope, key), delta in deltas.items()
+            if delta
+        ]
+        if operations:
+            await cls._collection.bulk_write(operations, ordered=False)
+
+    @classmethod
+    async def find(cls, kind: str, scope: str = "global") -> list[dict[str, Any]]:
+        cursor = cls._collection.find(
+            {"kind": kind, "scope": scope, "count": {"$gt": 0}},
+            {"_id": 0, "key": 1, "count": 1},
+        )
+        return await cursor.to_list(length=None)
+
+    @classmethod
+    async def find_scopes(cls, scopes: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        cursor = cls._collection.find(
+            {
+                "$or": [{"kind": kind, "scope": scope} for kind, scope in scopes],
+                "count": {"$gt": 0},
+            },
+            {"_id": 0, "kind": 1, "scope": 1, "key": 1, "count": 1},
+        )
+        return await cursor.to_list(length=None)
+
+    @classmethod
+    async def find_all(cls) -> dict[tuple[str, str, str], int]:
+        cursor = cls._collection.find({}, {"kind": 1, "scope": 1, "key": 1, "count": 1})
+        return {
+            (item["kind"], item["scope"], item["key"]): item.get("count", 0)
+            async for item in cursor
+        }
+
+    @classmethod
+    async def replace_all(
+        cls,
+        expected: dict[tuple[str, str, str], int],
+        stale: list[tuple[str, str, str]],
+    ) -> None:
+        operations: list[UpdateOne | DeleteOne] = [
+            UpdateOne(
+                {"_id": cls._counter_id(kind, scope, key)},
+                {"$set": {"kind": kind, "scope": scope, "key": key, "count": count}},
+                upsert=True,
+            )
+            for (kind, scope, key), count in expected.items()
+        ]
+        operations.extend(
+            DeleteOne({"_id": cls._counter_id(kind, scope, key)}) for kind, scope, key in stale
+        )
+        if operations:
+            await cls._collection.bulk_write(operations, ordered=False)
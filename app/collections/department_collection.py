@@ -2,57 +2,92 @@
 from typing import Any
 
 from bson import ObjectId
+from pymongo import ReturnDocument
 
+from app.db.event_bus import event_bus
 from app.db.mongo_db import db
 from app.documents.department_document import DepartmentDocument
-from app.utils.mongo_helpers import serialize_document
+from app.utils.pagination import SortSpec, find_page
 
 
 class DepartmentCollection:
     _collection = db["departments"]
+    _LIST_SORT: SortSpec = [("name", 1), ("_id", 1)]
 
     @classmethod
     async def create_indexes(cls) -> None:
         await cls._collection.create_index(
             [("company_id", 1), ("name", 1)], unique=True
         )
+        await cls._collection.create_index(cls._LIST_SORT)
+        await cls._collection.create_index([("company_id", 1), *cls._LIST_SORT])
 
     @classmethod
-    async def insert(cls, document: DepartmentDocument) -> ObjectId:
+    async def insert(cls, document: DepartmentDocument) -> dict[str, Any]:
+        """Insert ``document`` and return the stored payload, ready for the mappers."""
         payload = asdict(document)
-        result = await cls._collection.insert_one(payload)
-        return result.inserted_id
+        await cls._collection.insert_one(payload)
+        await event_bus.publish(event_bus.change("department", None, payload))
+        return payload
 
     @classmethod
     async def find_by_id(cls, department_id: str) -> dict[str, Any] | None:
         document = await cls._collection.find_one({"_id": ObjectId(department_id)})
-        return serialize_document(document)
+        return document
 
     @classmethod
-    async def find_by_company(cls, company_id: str) -> list[dict[str, Any]]:
-        cursor = (
-            cls._collection.find({"company_id": ObjectId(company_id)})
-            .sort("name", 1)
+    async def find_by_company(
+        cls, company_id: str, *, limit: int = 500, cursor: str | None = None
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        items, next_cursor = await find_page(
+            cls._collection,
+            {"company_id": ObjectId(company_id)},
+            cls._LIST_SORT,
+            limit=limit,
+            cursor=cursor,
         )
-        items = await cursor.to_list(length=500)
-        return [serialize_document(item) for item in items]
+        return items, next_cursor
 
     @classmethod
-    async def find_all(cls) -> list[dict[str, Any]]:
-        cursor = cls._collection.find().sort("name", 1)
-        items = await cursor.to_list(length=1000)
-        return [serialize_document(item) for item in items]
+    async def find_all(
+        cls, *, limit: int = 1000, cursor: str | None = None
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        items, next_cursor = await find_page(
+            cls._collection, {}, cls._LIST_SORT, limit=limit, cursor=cursor
+        )
+        return items, next_cursor
+
+    @classmethod
+    async def ids_for_company(cls, company_id: str) -> list[ObjectId]:
+        cursor = cls._collection.find({"company_id": ObjectId(company_id)}, {"_id": 1})
+        return [document["_id"] async for document in cursor]
+
+    @classmethod
+    async def company_map(cls) -> dict[str, str]:
+        cursor = cls._collection.find({}, {"company_id": 1})
+        return {str(item["_id"]): str(item["company_id"]) async for item in cursor}
 
     @classmethod
-    async def update(cls, department_id: str, data: dict[str, Any]) -> bool:
+    async def update(cls, department_id: str, data: dict[str, Any]) -> dict[str, Any] | None:
+        """Apply ``data`` and return the updated document, or ``None`` if missing."""
         if "lead_id" in data:
             data["lead_id"] = ObjectId(data["lead_id"]) if data["lead_id"] else None
-        result = await cls._collection.update_one(
-            {"_id": ObjectId(department_id)}, {"$set": data}
+        document = await cls._collection.find_one_and_update(
+            {"_id": ObjectId(department_id)},
+            {"$set": data},
+            return_document=ReturnDocument.AFTER,
         )
-        return result.modified_count > 0
+        if document is not None:
+            await event_bus.publish(
+                event_bus.event(
+                    "department", "updated", document["_id"], document=document, changed=sorted(data)
+                )
+            )
+        return document
 
     @classmethod
     async def delete(cls, department_id: str) -> bool:
         result = await cls._collection.delete_one({"_id": ObjectId(department_id)})
+        if result.deleted_count:
+            await event_bus.publish(event_bus.event("department", "deleted", ObjectId(department_id)))
         return result.deleted_count > 0
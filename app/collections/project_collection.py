@@ -3,31 +3,68 @@ from datetime import datetime
 from typing import Any
 
 from bson import ObjectId
+from pymongo import ReturnDocument
 
+from app.collections.tombstone_collection import TombstoneCollection
 from app.db.mongo_db import db
 from app.documents.project_document import ProjectDocument
-from app.utils.mongo_helpers import serialize_document
+from app.schemas.enums import PROJECT_PRIORITY_RANKS
+from app.utils.mongo_helpers import count_tags, drop_indexes, rank_expression, to_projection
+from app.utils.pagination import SortSpec, find_changed, find_page
+from app.utils.text_search import create_text_index, search_page
 
 
 class ProjectCollection:
     _collection = db["projects"]
+    _COUNTED_FIELDS = {"status": 1, "department_id": 1}
+    _LIST_SORT: SortSpec = [("priority_rank", -1), ("start_date", 1), ("_id", 1)]
+    SYNC_SORT: SortSpec = [("updated_at", 1), ("_id", 1)]
+    SEARCH_WEIGHTS = {"title": 10, "tags": 5, "description": 2, "content": 1}
+    # Indexes on the string ``priority`` sort, which ordered projects alphabetically,
+    # and the bare ``tags`` index, now a prefix of the tag-filtered list index.
+    _LEGACY_INDEXES = (
+        "priority_-1_start_date_1__id_1",
+        "department_id_1_priority_-1_start_date_1__id_1",
+        "tags_1",
+    )
 
     @classmethod
     async def create_indexes(cls) -> None:
+        await drop_indexes(cls._collection, cls._LEGACY_INDEXES)
+        await cls.backfill_priority_ranks()
         await cls._collection.create_index("department_id")
         await cls._collection.create_index("status")
-        await cls._collection.create_index("tags")
+        # One index per filter combination of find_many, each ending in the list sort.
+        await cls._collection.create_index(cls._LIST_SORT)
+        await cls._collection.create_index([("department_id", 1), *cls._LIST_SORT])
+        await cls._collection.create_index([("status", 1), *cls._LIST_SORT])
+        await cls._collection.create_index([("department_id", 1), ("status", 1), *cls._LIST_SORT])
+        # Tag filters and tag facets, globally and per department.
+        await cls._collection.create_index([("tags", 1), *cls._LIST_SORT])
+        await cls._collection.create_index([("department_id", 1), ("tags", 1), *cls._LIST_SORT])
+        await cls._collection.create_index(cls.SYNC_SORT)
+        await create_text_index(cls._collection, cls.SEARCH_WEIGHTS)
 
     @classmethod
-    async def insert(cls, document: ProjectDocument) -> ObjectId:
+    async def backfill_priority_ranks(cls) -> int:
+        """Store ``priority_rank`` on projects written before it existed."""
+        result = await cls._collection.update_many(
+            {"priority_rank": {"$exists": False}},
+            [{"$set": {"priority_rank": rank_expression("priority", PROJECT_PRIORITY_RANKS)}}],
+        )
+        return result.modified_count
+
+    @classmethod
+    async def insert(cls, document: ProjectDocument) -> dict[str, Any]:
+        """Insert ``document`` and return the stored payload, ready for the mappers."""
         payload = asdict(document)
-        result = await cls._collection.insert_one(payload)
-        return result.inserted_id
+        await cls._collection.insert_one(payload)
+        return payload
 
     @classmethod
     async def find_by_id(cls, project_id: str) -> dict[str, Any] | None:
         document = await cls._collection.find_one({"_id": ObjectId(project_id)})
-        return serialize_document(document)
+        return document
 
     @classmethod
     async def find_many(
@@ -35,23 +72,37 @@ class ProjectCollection:
         *,
         department_id: str | None = None,
         statuses: list[str] | None = None,
+        tags: list[str] | None = None,
         limit: int = 100,
-    ) -> list[dict[str, Any]]:
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
         query: dict[str, Any] = {}
         if department_id:
             query["department_id"] = ObjectId(department_id)
         if statuses:
             query["status"] = {"$in": statuses}
-        cursor = (
-            cls._collection.find(query)
-            .sort([("priority", -1), ("start_date", 1)])
-            .limit(limit)
+        if tags:
+            query["tags"] = {"$all": tags}
+        items, next_cursor = await find_page(
+            cls._collection,
+            query,
+            cls._LIST_SORT,
+            limit=limit,
+            cursor=cursor,
+            projection=to_projection(fields, include=(key for key, _ in cls._LIST_SORT)),
         )
-        items = await cursor.to_list(length=limit)
-        return [serialize_document(item) for item in items]
+        return items, next_cursor
 
     @classmethod
-    async def update(cls, project_id: str, data: dict[str, Any]) -> bool:
+    async def update(
+        cls, project_id: str, data: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        """Apply ``data`` and return ``(pre-image, post-image)``, or ``None`` if missing.
+
+        The post-image is the pre-image with the ``$set`` applied in memory, so
+        one round trip feeds both the counters and the PATCH response.
+        """
         if "member_ids" in data and data["member_ids"] is not None:
             data["member_ids"] = [ObjectId(member) for member in data["member_ids"] if member]
         if "watcher_ids" in data and data["watcher_ids"] is not None:
@@ -59,37 +110,97 @@ class ProjectCollection:
         if "assignee_id" in data:
             data["assignee_id"] = ObjectId(data["assignee_id"]) if data["assignee_id"] else None
         data["updated_at"] = datetime.utcnow()
-        result = await cls._collection.update_one(
+        previous = await cls._collection.find_one_and_update(
             {"_id": ObjectId(project_id)},
             {"$set": data},
+            return_document=ReturnDocument.BEFORE,
         )
-        return result.modified_count > 0
+        if previous is None:
+            return None
+        current = {**previous, **data}
+        return previous, current
 
     @classmethod
-    async def delete(cls, project_id: str) -> bool:
-        result = await cls._collection.delete_one({"_id": ObjectId(project_id)})
-        return result.deleted_count > 0
+    async def delete(cls, project_id: str) -> dict[str, Any] | None:
+        document = await cls._collection.find_one_and_delete(
+            {"_id": ObjectId(project_id)}, projection=cls._COUNTED_FIELDS
+        )
+        if document is not None:
+            await TombstoneCollection.record("project", document["_id"])
+        return document
 
     @classmethod
-    async def count(cls, query: dict[str, Any] | None = None) -> int:
-        return await cls._collection.count_documents(query or {})
+    async def find_changed(
+        cls, *, after: list[Any] | None, until: datetime, limit: int
+    ) -> list[dict[str, Any]]:
+        """Documents created or updated after the sync position ``after``, oldest first."""
+        return await find_changed(cls._collection, cls.SYNC_SORT, after=after, until=until, limit=limit)
 
     @classmethod
-    async def stats_by_status(cls) -> list[dict[str, Any]]:
-        pipeline = [
-            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
-            {"$project": {"status": "$_id", "count": 1, "_id": 0}},
-        ]
-        cursor = cls._collection.aggregate(pipeline)
-        return [item async for item in cursor]
+    async def ids_for_department(cls, department_id: str) -> list[ObjectId]:
+        return await cls.ids_for_departments([ObjectId(department_id)])
+
+    @classmethod
+    async def department_map(cls) -> dict[str, str]:
+        cursor = cls._collection.find({}, {"department_id": 1})
+        return {str(item["_id"]): str(item["department_id"]) async for item in cursor}
+
+    @classmethod
+    async def ids_for_departments(cls, department_ids: list[ObjectId]) -> list[ObjectId]:
+        cursor = cls._collection.find({"department_id": {"$in": department_ids}}, {"_id": 1})
+        return [document["_id"] async for document in cursor]
+
+    @classmethod
+    async def tag_counts(cls, query: dict[str, Any]) -> dict[str, int]:
+        """Projects per tag among those matching ``query`` (``_id`` or ``department_id`` scoped)."""
+        return await count_tags(cls._collection, query)
+
+    @classmethod
+    async def search(
+        cls,
+        text: str,
+        *,
+        kind: int,
+        department_id: str | None = None,
+        statuses: list[str] | None = None,
+        tags: list[str] | None = None,
+        after: list[Any] | None = None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        match: dict[str, Any] = {}
+        if department_id:
+            match["department_id"] = ObjectId(department_id)
+        if statuses:
+            match["status"] = {"$in": statuses}
+        if tags:
+            match["tags"] = {"$all": tags}
+        return await search_page(
+            cls._collection,
+            kind,
+            text,
+            match=match,
+            after=after,
+            limit=limit,
+            projection={"title": 1, "status": 1, "department_id": 1},
+        )
 
     @classmethod
-    async def stats_by_department(cls) -> list[dict[str, Any]]:
+    async def count(cls, query: dict[str, Any] | None = None) -> int:
+        return await cls._collection.count_documents(query or {})
+
+    @classmethod
+    async def count_by_department_status(cls) -> list[dict[str, Any]]:
         pipeline = [
-            {"$group": {"_id": "$department_id", "count": {"$sum": 1}}},
+            {
+                "$group": {
+                    "_id": {"department_id": "$department_id", "status": "$status"},
+                    "count": {"$sum": 1},
+                }
+            },
             {
                 "$project": {
-                    "department_id": {"$toString": "$_id"},
+                    "department_id": {"$toString": "$_id.department_id"},
+                    "status": "$_id.status",
                     "count": 1,
                     "_id": 0,
                 }
@@ -3,60 +3,330 @@ from datetime import datetime
 from typing import Any
 
 from bson import ObjectId
+from pymongo import InsertOne, ReturnDocument, UpdateOne
 
+from app.collections.tombstone_collection import TombstoneCollection
+from app.db.event_bus import event_bus
 from app.db.mongo_db import db
 from app.documents.subtask_document import SubtaskDocument
-from app.utils.mongo_helpers import serialize_document
+from app.utils.mongo_helpers import bulk_set_by_id, bulk_write_errors, drop_indexes
+from app.utils.pagination import SortSpec, find_changed, find_page
+from app.utils.rank import spread_ranks
+from app.utils.text_search import create_text_index, search_page
 
 
 class SubtaskCollection:
     _collection = db["subtasks"]
+    _COUNTED_FIELDS = {"task_id": 1, "status": 1}
+    _TASK_SORT: SortSpec = [("rank", 1), ("_id", 1)]
+    _LEGACY_SORT: SortSpec = [("order", 1), ("_id", 1)]
+    SYNC_SORT: SortSpec = [("updated_at", 1), ("_id", 1)]
+    SEARCH_WEIGHTS = {"title": 10, "content": 1}
+    # Ordering used to live in a unique (task_id, order) index that every
+    # reorder had to rewrite around; ranks replace it.
+    _LEGACY_INDEXES = ("task_id_1_order_1", "task_id_1_order_1__id_1")
 
     @classmethod
     async def create_indexes(cls) -> None:
+        await drop_indexes(cls._collection, cls._LEGACY_INDEXES)
         await cls._collection.create_index("task_id")
-        await cls._collection.create_index([("task_id", 1), ("order", 1)], unique=True)
+        await cls._collection.create_index([("task_id", 1), *cls._TASK_SORT])
+        await cls._collection.create_index(cls.SYNC_SORT)
+        await create_text_index(cls._collection, cls.SEARCH_WEIGHTS)
+        await cls.backfill_ranks()
 
     @classmethod
-    async def insert(cls, document: SubtaskDocument) -> ObjectId:
+    async def backfill_ranks(cls) -> None:
+        """Give subtasks created before ranks existed a rank following their old ``order``."""
+        task_ids = await cls._collection.distinct("task_id", {"rank": {"$exists": False}})
+        for task_id in task_ids:
+            await cls.rebalance(str(task_id), sort=cls._LEGACY_SORT)
+
+    @classmethod
+    async def insert(cls, document: SubtaskDocument) -> dict[str, Any]:
+        """Insert ``document`` and return the stored payload, ready for the mappers."""
         payload = asdict(document)
-        result = await cls._collection.insert_one(payload)
-        return result.inserted_id
+        await cls._collection.insert_one(payload)
+        await event_bus.publish(event_bus.change("subtask", None, payload))
+        return payload
+
+    @classmethod
+    async def search(
+        cls,
+        text: str,
+        *,
+        kind: int,
+        project_ids: list[ObjectId] | None = None,
+        statuses: list[str] | None = None,
+        after: list[Any] | None = None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        match: dict[str, Any] = {}
+        if statuses:
+            match["status"] = {"$in": statuses}
+        stages: list[dict[str, Any]] = []
+        if project_ids is not None:
+            # Subtasks only know their task, so the project scope is checked on the
+            # text matches through the task instead of expanding every task id.
+            stages = [
+                {
+                    "$lookup": {
+                        "from": "tasks",
+                        "localField": "task_id",
+                        "foreignField": "_id",
+                        "pipeline": [{"$project": {"project_id": 1}}],
+                        "as": "task",
+                    }
+                },
+                {"$match": {"task.project_id": {"$in": project_ids}}},
+            ]
+        return await search_page(
+            cls._collection,
+            kind,
+            text,
+            match=match,
+            stages=stages,
+            after=after,
+            limit=limit,
+            projection={"title": 1, "status": 1, "task_id": 1},
+        )
 
     @classmethod
     async def find_by_id(cls, subtask_id: str) -> dict[str, Any] | None:
         document = await cls._collection.find_one({"_id": ObjectId(subtask_id)})
-        return serialize_document(document)
+        return document
 
     @classmethod
-    async def find_by_task(cls, task_id: str) -> list[dict[str, Any]]:
-        cursor = (
-            cls._collection.find({"task_id": ObjectId(task_id)}).sort("order", 1)
+    async def find_by_task(
+        cls, task_id: str, *, limit: int = 1000, cursor: str | None = None
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        items, next_cursor = await find_page(
+            cls._collection,
+            {"task_id": ObjectId(task_id)},
+            cls._TASK_SORT,
+            limit=limit,
+            cursor=cursor,
         )
-        items = await cursor.to_list(length=1000)
-        return [serialize_document(item) for item in items]
+        return items, next_cursor
 
     @classmethod
-    async def update(cls, subtask_id: str, data: dict[str, Any]) -> bool:
+    async def find_by_tasks(cls, task_ids: list[str]) -> list[dict[str, Any]]:
+        if not task_ids:
+            return []
+        cursor = cls._collection.find(
+            {"task_id": {"$in": [ObjectId(task_id) for task_id in task_ids]}}
+        ).sort([("task_id", 1), *cls._TASK_SORT])
+        items = await cursor.to_list(length=None)
+        return items
+
+    @classmethod
+    async def insert_many(
+        cls, documents: list[SubtaskDocument]
+    ) -> tuple[list[dict[str, Any]], dict[int, str]]:
+        """Insert ``documents`` unordered; return the payloads and ``{index: error}`` for failures."""
+        payloads = [asdict(document) for document in documents]
+        errors = await bulk_write_errors(
+            cls._collection, [InsertOne(payload) for payload in payloads]
+        )
+        await event_bus.publish(
+            *(
+                event_bus.change("subtask", None, payload)
+                for index, payload in enumerate(payloads)
+                if index not in errors
+            )
+        )
+        return payloads, errors
+
+    @staticmethod
+    def _prepare_update(data: dict[str, Any]) -> None:
         if "assignee_id" in data and data["assignee_id"]:
             data["assignee_id"] = ObjectId(data["assignee_id"])
         elif "assignee_id" in data and data["assignee_id"] is None:
             data["assignee_id"] = None
         data["updated_at"] = datetime.utcnow()
-        result = await cls._collection.update_one(
-            {"_id": ObjectId(subtask_id)}, {"$set": data}
+
+    @classmethod
+    async def update(
+        cls, subtask_id: str, data: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        """Apply ``data`` and return ``(pre-image, post-image)``, or ``None`` if missing.
+
+        The post-image is the pre-image with the ``$set`` applied in memory, so
+        one round trip feeds both the counters and the PATCH response.
+        """
+        cls._prepare_update(data)
+        previous = await cls._collection.find_one_and_update(
+            {"_id": ObjectId(subtask_id)},
+            {"$set": data},
+            return_document=ReturnDocument.BEFORE,
+        )
+        if previous is None:
+            return None
+        current = {**previous, **data}
+        await event_bus.publish(event_bus.change("subtask", previous, current))
+        return previous, current
+
+    @classmethod
+    async def bulk_update(
+        cls, updates: list[tuple[str, dict[str, Any]]]
+    ) -> list[tuple[dict[str, Any], dict[str, Any]] | str]:
+        """Bulk variant of :meth:`update`: ``(pre-image, post-image)`` or an error per item."""
+        for _, data in updates:
+            cls._prepare_update(data)
+        outcomes = await bulk_set_by_id(cls._collection, updates)
+        await event_bus.publish(
+            *(
+                event_bus.change("subtask", *outcome)
+                for outcome in outcomes
+                if isinstance(outcome, tuple)
+            )
+        )
+        return outcomes
+
+    @classmethod
+    async def delete(cls, subtask_id: str) -> dict[str, Any] | None:
+        document = await cls._collection.find_one_and_delete(
+            {"_id": ObjectId(subtask_id)}, projection=cls._COUNTED_FIELDS
         )
-        return result.modified_count > 0
+        if document is not None:
+            await TombstoneCollection.record("subtask", document["_id"])
+            await event_bus.publish(event_bus.change("subtask", document, None))
+        return document
 
     @classmethod
-    async def delete(cls, subtask_id: str) -> bool:
-        result = await cls._collection.delete_one({"_id": ObjectId(subtask_id)})
-        return result.deleted_count > 0
+    async def find_changed(
+        cls, *, after: list[Any] | None, until: datetime, limit: int
+    ) -> list[dict[str, Any]]:
+        """Documents created or updated after the sync position ``after``, oldest first."""
+        return await find_changed(cls._collection, cls.SYNC_SORT, after=after, until=until, limit=limit)
+
+    @classmethod
+    async def count_by_task_status(cls) -> list[dict[str, Any]]:
+        pipeline = [
+            {
+                "$group": {
+                    "_id": {"task_id": "$task_id", "status": "$status"},
+                    "count": {"$sum": 1},
+                }
+            },
+            {
+                "$project": {
+                    "task_id": {"$toString": "$_id.task_id"},
+                    "status": "$_id.status",
+                    "count": 1,
+                    "_id": 0,
+                }
+            },
+        ]
+        cursor = cls._collection.aggregate(pipeline)
+        return [item async for item in cursor]
+
+    @classmethod
+    async def last_ranks(cls, task_ids: list[str]) -> dict[str, str]:
+        """Return the highest rank of each task that already has subtasks."""
+        pipeline = [
+            {"$match": {"task_id": {"$in": [ObjectId(task_id) for task_id in task_ids]}}},
+            {"$group": {"_id": "$task_id", "rank": {"$max": "$rank"}}},
+        ]
+        return {
+            str(item["_id"]): item["rank"]
+            async for item in cls._collection.aggregate(pipeline)
+            if item["rank"]
+        }
+
+    @classmethod
+    async def find_ranks(cls, subtask_ids: list[str]) -> dict[str, dict[str, Any]]:
+        cursor = cls._collection.find(
+            {"_id": {"$in": [ObjectId(subtask_id) for subtask_id in subtask_ids]}},
+            {"task_id": 1, "rank": 1},
+        )
+        return {str(item["_id"]): item async for item in cursor}
+
+    @classmethod
+    async def adjacent_rank(
+        cls, task_id: ObjectId, rank: str, *, above: bool, exclude: ObjectId
+    ) -> str | None:
+        """Return the rank right after (``above``) or before ``rank`` in the task, if any."""
+        document = await cls._collection.find_one(
+            {"task_id": task_id, "rank": {"$gt" if above else "$lt": rank}, "_id": {"$ne": exclude}},
+            {"rank": 1},
+            sort=[("rank", 1 if above else -1)],
+        )
+        return document["rank"] if document else None
+
+    @classmethod
+    async def set_rank(cls, subtask_id: str, rank: str) -> dict[str, Any] | None:
+        document = await cls._collection.find_one_and_update(
+            {"_id": ObjectId(subtask_id)},
+            {"$set": {"rank": rank, "updated_at": datetime.utcnow()}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if document is not None:
+            await event_bus.publish(
+                event_bus.event(
+                    "subtask",
+                    "updated",
+                    document["_id"],
+                    document=document,
+                    changed=["rank", "updated_at"],
+                )
+            )
+        return document
+
+    @classmethod
+    async def _publish_ranks(cls, task_id: str, ranks: dict[str, str]) -> None:
+        """Announce a batch of new ranks in one ``reordered`` event keyed by the task."""
+        if ranks:
+            await event_bus.publish(
+                event_bus.event(
+                    "subtask",
+                    "reordered",
+                    ObjectId(task_id),
+                    document={"task_id": ObjectId(task_id), "ranks": ranks},
+                )
+            )
 
     @classmethod
     async def reorder(cls, task_id: str, ordered_ids: list[str]) -> None:
-        for order, subtask_id in enumerate(ordered_ids):
-            await cls._collection.update_one(
+        """Rank ``ordered_ids`` in the given order with a single ``bulk_write``."""
+        if not ordered_ids:
+            return
+        now = datetime.utcnow()
+        ranks = dict(zip(ordered_ids, spread_ranks(len(ordered_ids))))
+        operations = [
+            UpdateOne(
                 {"_id": ObjectId(subtask_id), "task_id": ObjectId(task_id)},
-                {"$set": {"order": order, "updated_at": datetime.utcnow()}},
+                {"$set": {"rank": rank, "order": order, "updated_at": now}},
             )
+            for order, (subtask_id, rank) in enumerate(ranks.items())
+        ]
+        await cls._collection.bulk_write(operations, ordered=False)
+        await cls._publish_ranks(task_id, ranks)
+
+    @classmethod
+    async def rebalance(cls, task_id: str, *, sort: SortSpec | None = None) -> int:
+        """Rewrite the task's ranks as short, evenly spaced keys; returns the number moved.
+
+        Each write is conditional on the rank read, so a subtask moved meanwhile
+        keeps its new position (and may be picked up by the next rebalance).
+        """
+        cursor = cls._collection.find({"task_id": ObjectId(task_id)}, {"rank": 1}).sort(
+            sort or cls._TASK_SORT
+        )
+        documents = await cursor.to_list(length=None)
+        now = datetime.utcnow()
+        ranks: dict[str, str] = {}
+        operations = []
+        for document, rank in zip(documents, spread_ranks(len(documents))):
+            if document.get("rank") != rank:
+                ranks[str(document["_id"])] = rank
+                operations.append(
+                    UpdateOne(
+                        {"_id": document["_id"], "rank": document.get("rank")},
+                        {"$set": {"rank": rank, "updated_at": now}},
+                    )
+                )
+        if operations:
+            await cls._collection.bulk_write(operations, ordered=False)
+            await cls._publish_ranks(task_id, ranks)
+        return len(operations)
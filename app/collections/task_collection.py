@@ -3,128 +3,355 @@ from datetime import datetime
 from typing import Any
 
 from bson import ObjectId
+from pymongo import InsertOne, ReturnDocument
 
+from app.collections.tombstone_collection import TombstoneCollection
 from app.db.mongo_db import db
 from app.documents.task_document import TaskDocument
-from app.utils.mongo_helpers import serialize_document
+from app.schemas.enums import TASK_PRIORITY_RANKS, TaskStatus
+from app.utils.mongo_helpers import (
+    bulk_set_by_id,
+    bulk_write_errors,
+    count_tags,
+    drop_indexes,
+    rank_expression,
+    serialize_document,
+    to_projection,
+)
+from app.utils.pagination import SortSpec, find_changed, find_page
+from app.utils.text_search import create_text_index, search_page
+
+
+def _scanned_indexes(plan: Any) -> set[str]:
+    """Collect the ``indexName`` of every IXSCAN stage under the winning plan(s) of an explain."""
+    found: set[str] = set()
+    if isinstance(plan, dict):
+        if plan.get("stage") == "IXSCAN" and "indexName" in plan:
+            found.add(plan["indexName"])
+        for key, value in plan.items():
+            if key != "rejectedPlans":
+                found |= _scanned_indexes(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            found |= _scanned_indexes(item)
+    return found
 
 
 class TaskCollection:
     _collection = db["tasks"]
+    _COUNTED_FIELDS = {"project_id": 1, "status": 1, "priority": 1}
+    _PROJECT_SORT: SortSpec = [("priority_rank", -1), ("due_date", 1), ("_id", 1)]
+    _CALENDAR_SORT: SortSpec = [("due_date", 1), ("_id", 1)]
+    SYNC_SORT: SortSpec = [("updated_at", 1), ("_id", 1)]
+    SEARCH_WEIGHTS = {"title": 10, "tags": 5, "description": 2, "content": 1}
+    # Only open (not done) tasks have deadlines worth scanning; the partial index
+    # keeps the finished history out of the overdue/upcoming queries.
+    OPEN_DUE_INDEX = "due_date_open"
+    # The string ``priority`` sort index ordered tasks alphabetically, and the
+    # plain ``due_date`` index is covered by the calendar sort index.
+    _LEGACY_INDEXES = ("project_id_1_priority_-1_due_date_1__id_1", "due_date_1")
 
     @classmethod
     async def create_indexes(cls) -> None:
+        await drop_indexes(cls._collection, cls._LEGACY_INDEXES)
+        await cls.backfill_priority_ranks()
+        await cls.backfill_open_flags()
         await cls._collection.create_index("project_id")
         await cls._collection.create_index("status")
         await cls._collection.create_index("assignee_id")
-        await cls._collection.create_index("due_date")
+        await cls._collection.create_index(
+            "due_date", name=cls.OPEN_DUE_INDEX, partialFilterExpression={"is_open": True}
+        )
+        await cls._collection.create_index([("project_id", 1), *cls._PROJECT_SORT])
+        # Tag filters on a project's list and tag facets, globally and per project.
+        await cls._collection.create_index("tags")
+        await cls._collection.create_index([("project_id", 1), ("tags", 1), *cls._PROJECT_SORT])
+        await cls._collection.create_index(cls._CALENDAR_SORT)
+        await cls._collection.create_index(cls.SYNC_SORT)
+        await create_text_index(cls._collection, cls.SEARCH_WEIGHTS)
+
+    @classmethod
+    async def backfill_priority_ranks(cls) -> int:
+        """Store ``priority_rank`` on tasks written before it existed."""
+        result = await cls._collection.update_many(
+            {"priority_rank": {"$exists": False}},
+            [{"$set": {"priority_rank": rank_expression("priority", TASK_PRIORITY_RANKS)}}],
+        )
+        return result.modified_count
+
+    @classmethod
+    async def backfill_open_flags(cls) -> int:
+        """Store ``is_open`` on tasks written before it existed."""
+        result = await cls._collection.update_many(
+            {"is_open": {"$exists": False}},
+            [{"$set": {"is_open": {"$ne": ["$status", TaskStatus.done.value]}}}],
+        )
+        return result.modified_count
+
+    @staticmethod
+    def _open_due(condition: dict[str, Any]) -> dict[str, Any]:
+        # ``is_open: True`` must appear verbatim for the planner to pick the partial index.
+        return {"is_open": True, "due_date": condition}
 
     @classmethod
-    async def insert(cls, document: TaskDocument) -> ObjectId:
+    async def insert(cls, document: TaskDocument) -> dict[str, Any]:
+        """Insert ``document`` and return the stored payload, ready for the mappers."""
         payload = asdict(document)
-        result = await cls._collection.insert_one(payload)
-        return result.inserted_id
+        await cls._collection.insert_one(payload)
+        return payload
 
     @classmethod
     async def find_by_id(cls, task_id: str) -> dict[str, Any] | None:
         document = await cls._collection.find_one({"_id": ObjectId(task_id)})
-        return serialize_document(document)
+        return document
 
     @classmethod
-    async def find_by_project(cls, project_id: str) -> list[dict[str, Any]]:
-        cursor = (
-            cls._collection.find({"project_id": ObjectId(project_id)})
-            .sort([("priority", -1), ("due_date", 1)])
+    async def project_ids(cls, task_ids: list[str]) -> dict[str, ObjectId]:
+        """Map each existing task id to its project id."""
+        cursor = cls._collection.find(
+            {"_id": {"$in": [ObjectId(task_id) for task_id in task_ids]}}, {"project_id": 1}
         )
-        items = await cursor.to_list(length=1000)
-        return [serialize_document(item) for item in items]
+        return {str(document["_id"]): document["project_id"] async for document in cursor}
 
     @classmethod
-    async def find_for_calendar(cls, start: datetime, end: datetime) -> list[dict[str, Any]]:
-        cursor = cls._collection.find(
-            {"due_date": {"$gte": start, "$lte": end}}
-        ).sort("due_date", 1)
-        items = await cursor.to_list(length=1000)
-        return [serialize_document(item) for item in items]
+    async def tag_counts(cls, query: dict[str, Any]) -> dict[str, int]:
+        """Tasks per tag among those matching ``query`` (``project_id`` scoped)."""
+        return await count_tags(cls._collection, query)
+
+    @classmethod
+    async def search(
+        cls,
+        text: str,
+        *,
+        kind: int,
+        project_ids: list[ObjectId] | None = None,
+        statuses: list[str] | None = None,
+        tags: list[str] | None = None,
+        after: list[Any] | None = None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        match: dict[str, Any] = {}
+        if project_ids is not None:
+            match["project_id"] = {"$in": project_ids}
+        if statuses:
+            match["status"] = {"$in": statuses}
+        if tags:
+            match["tags"] = {"$all": tags}
+        return await search_page(
+            cls._collection,
+            kind,
+            text,
+            match=match,
+            after=after,
+            limit=limit,
+            projection={"title": 1, "status": 1, "project_id": 1},
+        )
+
+    @classmethod
+    async def find_by_project(
+        cls,
+        project_id: str,
+        *,
+        tags: list[str] | None = None,
+        limit: int = 1000,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        query: dict[str, Any] = {"project_id": ObjectId(project_id)}
+        if tags:
+            query["tags"] = {"$all": tags}
+        items, next_cursor = await find_page(
+            cls._collection,
+            query,
+            cls._PROJECT_SORT,
+            limit=limit,
+            cursor=cursor,
+            projection=to_projection(fields, include=(key for key, _ in cls._PROJECT_SORT)),
+        )
+        return items, next_cursor
+
+    @classmethod
+    async def find_for_calendar(
+        cls,
+        start: datetime,
+        end: datetime,
+        *,
+        limit: int = 1000,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        items, next_cursor = await find_page(
+            cls._collection,
+            {"due_date": {"$gte": start, "$lte": end}},
+            cls._CALENDAR_SORT,
+            limit=limit,
+            cursor=cursor,
+            projection=to_projection(fields, include=(key for key, _ in cls._CALENDAR_SORT)),
+        )
+        return items, next_cursor
 
     @classmethod
     async def find_overdue(cls, now: datetime, limit: int = 10) -> list[dict[str, Any]]:
         cursor = (
-            cls._collection.find(
-                {
-                    "due_date": {"$lt": now},
-                    "status": {"$nin": ["done"]},
-                }
-            )
+            cls._collection.find(cls._open_due({"$lt": now}))
             .sort("due_date", 1)
             .limit(limit)
         )
         items = await cursor.to_list(length=limit)
-        return [serialize_document(item) for item in items]
+        return items
 
     @classmethod
     async def find_upcoming(cls, now: datetime, limit: int = 10) -> list[dict[str, Any]]:
         cursor = (
-            cls._collection.find(
-                {
-                    "due_date": {"$gte": now},
-                    "status": {"$nin": ["done"]},
-                }
-            )
+            cls._collection.find(cls._open_due({"$gte": now}))
             .sort("due_date", 1)
             .limit(limit)
         )
         items = await cursor.to_list(length=limit)
-        return [serialize_document(item) for item in items]
+        return items
 
     @classmethod
-    async def update(cls, task_id: str, data: dict[str, Any]) -> bool:
+    async def insert_many(
+        cls, documents: list[TaskDocument]
+    ) -> tuple[list[dict[str, Any]], dict[int, str]]:
+        """Insert ``documents`` unordered; return the payloads and ``{index: error}`` for failures."""
+        payloads = [asdict(document) for document in documents]
+        errors = await bulk_write_errors(
+            cls._collection, [InsertOne(payload) for payload in payloads]
+        )
+        return payloads, errors
+
+    @staticmethod
+    def _prepare_update(data: dict[str, Any]) -> None:
         if "assignee_id" in data and data["assignee_id"]:
             data["assignee_id"] = ObjectId(data["assignee_id"])
         elif "assignee_id" in data and data["assignee_id"] is None:
             data["assignee_id"] = None
         data["updated_at"] = datetime.utcnow()
-        result = await cls._collection.update_one(
-            {"_id": ObjectId(task_id)}, {"$set": data}
+
+    @classmethod
+    async def update(
+        cls, task_id: str, data: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, Any]] | None:
+        """Apply ``data`` and return ``(pre-image, post-image)``, or ``None`` if missing.
+
+        The post-image is the pre-image with the ``$set`` applied in memory, so
+        one round trip feeds both the counters and the PATCH response.
+        """
+        cls._prepare_update(data)
+        previous = await cls._collection.find_one_and_update(
+            {"_id": ObjectId(task_id)},
+            {"$set": data},
+            return_document=ReturnDocument.BEFORE,
         )
-        return result.modified_count > 0
+        if previous is None:
+            return None
+        current = {**previous, **data}
+        return previous, current
 
     @classmethod
-    async def delete(cls, task_id: str) -> bool:
-        result = await cls._collection.delete_one({"_id": ObjectId(task_id)})
-        return result.deleted_count > 0
+    async def bulk_update(
+        cls, updates: list[tuple[str, dict[str, Any]]]
+    ) -> list[tuple[dict[str, Any], dict[str, Any]] | str]:
+        """Bulk variant of :meth:`update`: ``(pre-image, post-image)`` or an error per item."""
+        for _, data in updates:
+            cls._prepare_update(data)
+        return await bulk_set_by_id(cls._collection, updates)
 
     @classmethod
-    async def stats_by_status(cls, project_id: str) -> list[dict[str, Any]]:
-        pipeline = [
-            {"$match": {"project_id": ObjectId(project_id)}},
-            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
-            {"$project": {"status": "$_id", "count": 1, "_id": 0}},
-        ]
-        cursor = cls._collection.aggregate(pipeline)
-        return [item async for item in cursor]
+    async def delete(cls, task_id: str) -> dict[str, Any] | None:
+        document = await cls._collection.find_one_and_delete(
+            {"_id": ObjectId(task_id)}, projection=cls._COUNTED_FIELDS
+        )
+        if document is not None:
+            await TombstoneCollection.record("task", document["_id"])
+        return document
 
     @classmethod
-    async def stats_by_priority(cls, project_id: str) -> list[dict[str, Any]]:
-        pipeline = [
-            {"$match": {"project_id": ObjectId(project_id)}},
-            {"$group": {"_id": "$priority", "count": {"$sum": 1}}},
-            {"$project": {"priority": "$_id", "count": 1, "_id": 0}},
-        ]
-        cursor = cls._collection.aggregate(pipeline)
-        return [item async for item in cursor]
+    async def find_changed(
+        cls, *, after: list[Any] | None, until: datetime, limit: int
+    ) -> list[dict[str, Any]]:
+        """Documents created or updated after the sync position ``after``, oldest first."""
+        return await find_changed(cls._collection, cls.SYNC_SORT, after=after, until=until, limit=limit)
 
     @classmethod
-    async def stats_all_status(cls) -> list[dict[str, Any]]:
+    async def count_by_project(cls, field: str) -> list[dict[str, Any]]:
         pipeline = [
-            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
-            {"$project": {"status": "$_id", "count": 1, "_id": 0}},
+            {
+                "$group": {
+                    "_id": {"project_id": "$project_id", field: f"${field}"},
+                    "count": {"$sum": 1},
+                }
+            },
+            {
+                "$project": {
+                    "project_id": {"$toString": "$_id.project_id"},
+                    field: f"$_id.{field}",
+                    "count": 1,
+                    "_id": 0,
+                }
+            },
         ]
         cursor = cls._collection.aggregate(pipeline)
         return [item async for item in cursor]
 
     @classmethod
     async def count_overdue(cls, now: datetime) -> int:
-        return await cls._collection.count_documents(
-            {"due_date": {"$lt": now}, "status": {"$nin": ["done"]}}
-        )
+        return await cls._collection.count_documents(cls._open_due({"$lt": now}))
+
+    @classmethod
+    def _dashboard_pipeline(cls, now: datetime, upcoming_limit: int) -> list[dict[str, Any]]:
+        # $facet cannot use indexes, so the open tasks with a deadline are first
+        # read in due_date order from the partial index and only then split.
+        return [
+            {"$match": cls._open_due({"$ne": None})},
+            {"$sort": {"due_date": 1}},
+            {
+                "$facet": {
+                    "overdue": [{"$match": {"due_date": {"$lt": now}}}, {"$count": "count"}],
+                    "upcoming": [
+                        {"$match": {"due_date": {"$gte": now}}},
+                        {"$limit": upcoming_limit},
+                    ],
+                }
+            },
+        ]
+
+    @classmethod
+    async def dashboard_summary(cls, now: datetime, upcoming_limit: int = 10) -> dict[str, Any]:
+        """Compute the deadline-relative dashboard figures in a single ``$facet`` pass."""
+        cursor = cls._collection.aggregate(cls._dashboard_pipeline(now, upcoming_limit))
+        facets = (await cursor.to_list(length=1))[0]
+        return {
+            "overdue": facets["overdue"][0]["count"] if facets["overdue"] else 0,
+            "upcoming": [serialize_document(item) for item in facets["upcoming"]],
+        }
+
+    @classmethod
+    async def index_names(cls) -> set[str]:
+        return set(await cls._collection.index_information())
+
+    @classmethod
+    async def explain_deadline_queries(cls, now: datetime) -> dict[str, set[str]]:
+        """Return the indexes each deadline query's winning plan scans, keyed by query name."""
+        plans = {
+            "find_overdue": await cls._collection.find(cls._open_due({"$lt": now}))
+            .sort("due_date", 1)
+            .limit(10)
+            .explain(),
+            "find_upcoming": await cls._collection.find(cls._open_due({"$gte": now}))
+            .sort("due_date", 1)
+            .limit(10)
+            .explain(),
+            "count_overdue": await cls._collection.database.command(
+                "explain",
+                {"count": cls._collection.name, "query": cls._open_due({"$lt": now})},
+            ),
+            "dashboard_summary": await cls._collection.database.command(
+                "aggregate",
+                cls._collection.name,
+                pipeline=cls._dashboard_pipeline(now, 10),
+                explain=True,
+            ),
+        }
+        return {name: _scanned_indexes(plan) for name, plan in plans.items()}
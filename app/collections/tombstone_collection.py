@@ -0,0 +1,32 @@
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+
+from app.db.mongo_db import db
+from app.documents.tombstone_document import TombstoneDocument
+from app.utils.mongo_helpers import ensure_ttl_index
+from app.utils.pagination import SortSpec, find_changed
+
+
+class TombstoneCollection:
+    """Records deletions so delta sync can report them after the document is gone."""
+
+    _collection = db["tombstones"]
+    SYNC_SORT: SortSpec = [("deleted_at", 1), ("_id", 1)]
+
+    @classmethod
+    async def create_indexes(cls, *, expire_after_seconds: int) -> None:
+        await cls._collection.create_index(cls.SYNC_SORT)
+        await ensure_ttl_index(cls._collection, "deleted_at", expire_after_seconds)
+
+    @classmethod
+    async def record(cls, entity: str, entity_id: ObjectId) -> None:
+        await cls._collection.insert_one(asdict(TombstoneDocument(entity=entity, entity_id=entity_id)))
+
+    @classmethod
+    async def find_changed(
+        cls, *, after: list[Any] | None, until: datetime, limit: int
+    ) -> list[dict[str, Any]]:
+        return await find_changed(cls._collection, cls.SYNC_SORT, after=after, until=until, limit=limit)
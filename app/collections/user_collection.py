@@ -1,84 +1,126 @@
-﻿from dataclasses import asdict
+﻿import logging
+from collections import Counter
+from dataclasses import asdict
 from typing import Any
 
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
+from app.db.event_bus import event_bus
 from app.db.mongo_db import db
 from app.documents.user_document import UserDocument
-from app.utils.mongo_helpers import serialize_document
+from app.utils.pagination import SortSpec, find_page
+
+logger = logging.getLogger(__name__)
 
 
 class UserCollection:
     _collection = db["users"]
+    _LIST_SORT: SortSpec = [("name", 1), ("_id", 1)]
 
     @classmethod
     async def create_indexes(cls) -> None:
         existing_indexes = await cls._collection.index_information()
         if "email_1" in existing_indexes:
             await cls._collection.drop_index("email_1")
+        await cls.backfill_login_ids()
         await cls._collection.create_index("login_id", unique=True, sparse=True)
         await cls._collection.create_index("department_id")
+        await cls._collection.create_index(cls._LIST_SORT)
+        await cls._collection.create_index([("department_id", 1), *cls._LIST_SORT])
 
     @classmethod
-    async def insert(cls, document: UserDocument) -> ObjectId:
+    async def backfill_login_ids(cls) -> int:
+        """Move legacy ``email`` identifiers into ``login_id`` so logins need one indexed lookup.
+
+        An ``email`` that is already another user's ``login_id``, or that several
+        legacy users share, cannot become a unique ``login_id``. Those users keep
+        ``email`` and are logged for manual cleanup instead of failing startup.
+        """
+        legacy = await cls._collection.find(
+            {"email": {"$exists": True}}, {"email": 1, "login_id": 1}
+        ).to_list(length=None)
+        if not legacy:
+            return 0
+        pending = [document for document in legacy if document.get("login_id") is None]
+        emails = Counter(document["email"] for document in pending)
+        taken = {
+            document["login_id"]
+            async for document in cls._collection.find(
+                {"login_id": {"$in": list(emails)}}, {"login_id": 1}
+            )
+        }
+        conflicts = [
+            document["_id"]
+            for document in pending
+            if emails[document["email"]] > 1 or document["email"] in taken
+        ]
+        if conflicts:
+            logger.warning(
+                "Kept legacy email on %d users whose email is not a unique login_id: %s",
+                len(conflicts),
+                ", ".join(str(user_id) for user_id in conflicts),
+            )
+        try:
+            result = await cls._collection.update_many(
+                {"email": {"$exists": True}, "_id": {"$nin": conflicts}},
+                [
+                    {"$set": {"login_id": {"$ifNull": ["$login_id", "$email"]}}},
+                    {"$unset": "email"},
+                ],
+            )
+        except DuplicateKeyError:
+            # A login_id registered since the scan above; the rest is retried on the next start.
+            logger.warning("Legacy email backfill hit a duplicate login_id; retrying on next start")
+            return 0
+        return result.modified_count
+
+    @classmethod
+    async def insert(cls, document: UserDocument) -> dict[str, Any]:
+        """Insert ``document`` and return the stored payload, ready for the mappers."""
         payload = asdict(document)
-        result = await cls._collection.insert_one(payload)
-        return result.inserted_id
+        await cls._collection.insert_one(payload)
+        await event_bus.publish(event_bus.change("user", None, payload, with_document=False))
+        return payload
 
     @classmethod
     async def find_raw_by_login_id(cls, login_id: str) -> dict[str, Any] | None:
-        query = {"$or": [{"login_id": login_id}, {"email": login_id}]}
-        return await cls._collection.find_one(query)
+        return await cls._collection.find_one({"login_id": login_id})
 
     @classmethod
     async def find_raw_by_id(cls, user_id: str) -> dict[str, Any] | None:
         return await cls._collection.find_one({"_id": ObjectId(user_id)})
 
-    @classmethod
-    @staticmethod
-    def _normalize(document: dict[str, Any] | None) -> dict[str, Any] | None:
-        if document is None:
-            return None
-        normalized = document.copy()
-        login_id = normalized.get("login_id") or normalized.get("email")
-        if login_id is not None:
-            normalized["login_id"] = login_id
-        normalized.pop("email", None)
-        return normalized
-
     @classmethod
     async def find_by_login_id(cls, login_id: str) -> dict[str, Any] | None:
         document = await cls.find_raw_by_login_id(login_id)
-        normalized = cls._normalize(document)
-        return serialize_document(normalized) if normalized else None
+        return document
 
     @classmethod
     async def find_by_id(cls, user_id: str) -> dict[str, Any] | None:
         document = await cls.find_raw_by_id(user_id)
-        normalized = cls._normalize(document)
-        return serialize_document(normalized) if normalized else None
+        return document
 
     @classmethod
     async def find_many(
-        cls, *, department_id: str | None = None
-    ) -> list[dict[str, Any]]:
+        cls,
+        *,
+        department_id: str | None = None,
+        limit: int = 1000,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
         query: dict[str, Any] = {}
         if department_id:
             query["department_id"] = ObjectId(department_id)
-        cursor = cls._collection.find(query).sort("name", 1)
-        items = await cursor.to_list(length=1000)
-        results: list[dict[str, Any]] = []
-        for item in items:
-            normalized = cls._normalize(item)
-            if not normalized:
-                continue
-            serialized = serialize_document(normalized)
-            if serialized:
-                results.append(serialized)
-        return results
+        items, next_cursor = await find_page(
+            cls._collection, query, cls._LIST_SORT, limit=limit, cursor=cursor
+        )
+        return items, next_cursor
 
     @classmethod
-    async def update(cls, user_id: str, data: dict[str, Any]) -> bool:
+    async def update(cls, user_id: str, data: dict[str, Any]) -> dict[str, Any] | None:
+        """Apply ``data`` and return the updated document, or ``None`` if missing."""
         data = data.copy()
         if "email" in data and "login_id" not in data:
             data["login_id"] = data.pop("email")
@@ -88,12 +130,21 @@ class UserCollection:
             data["department_id"] = (
                 ObjectId(data["department_id"]) if data["department_id"] else None
             )
-        result = await cls._collection.update_one(
-            {"_id": ObjectId(user_id)}, {"$set": data}
+        document = await cls._collection.find_one_and_update(
+            {"_id": ObjectId(user_id)},
+            {"$set": data},
+            return_document=ReturnDocument.AFTER,
         )
-        return result.modified_count > 0
+        if document is not None:
+            # User events never carry the document, which holds the password hash.
+            await event_bus.publish(
+                event_bus.event("user", "updated", document["_id"], changed=sorted(data))
+            )
+        return document
 
     @classmethod
     async def delete(cls, user_id: str) -> bool:
         result = await cls._collection.delete_one({"_id": ObjectId(user_id)})
+        if result.deleted_count:
+            await event_bus.publish(event_bus.event("user", "deleted", ObjectId(user_id)))
         return result.deleted_count > 0
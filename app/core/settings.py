@@ -1,4 +1,5 @@
 ﻿from pathlib import Path
+from typing import Literal
 
 from pydantic import ConfigDict, Field
 from pydantic_settings import BaseSettings
@@ -13,6 +14,90 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = Field(..., description="Secret key used to sign JWT tokens")
     JWT_ALGORITHM: str = Field(default="HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=60)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = Field(
+        default=30, description="Seconds an authenticated user stays cached (0 disables the cache)"
+    )
+    PRINCIPAL_CACHE_MAX_SIZE: int = Field(
+        default=1024, description="Maximum number of authenticated users kept in the cache"
+    )
+    DASHBOARD_CACHE_MAX_AGE_SECONDS: int = Field(
+        default=30, description="Maximum staleness of the cached dashboard summary (0 disables)"
+    )
+    DASHBOARD_ACTIVITY_MAX_AGE_SECONDS: int = Field(
+        default=5, description="Maximum staleness of the dashboard's recent activity feed (0 disables)"
+    )
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = Field(
+        default="thread", description="Worker pool type used for password hashing"
+    )
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=4, description="Maximum number of password hashes computed concurrently"
+    )
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: float = Field(
+        default=5.0, description="Seconds a hashing job may wait for a free worker"
+    )
+    ACTIVITY_QUEUE_MAX_SIZE: int = Field(
+        default=10000, description="Maximum number of activity log entries waiting to be written"
+    )
+    ACTIVITY_FLUSH_BATCH_SIZE: int = Field(
+        default=200, description="Activity log entries written per insert_many"
+    )
+    ACTIVITY_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=0.5, description="Maximum seconds an activity log entry waits before being written"
+    )
+    ACTIVITY_QUEUE_OVERFLOW: Literal["block", "drop", "sync"] = Field(
+        default="block",
+        description="What to do when the activity queue is full: wait, discard, or write inline",
+    )
+    ACTIVITY_RETENTION_DAYS: int = Field(
+        default=0, description="Days activity log entries stay in the live collection (0 keeps them forever)"
+    )
+    ACTIVITY_RETENTION_MODE: Literal["archive", "ttl"] = Field(
+        default="archive",
+        description="Move expired activity entries to monthly archive collections, or let a TTL index delete them",
+    )
+    ACTIVITY_ARCHIVE_INTERVAL_SECONDS: float = Field(
+        default=3600, description="Seconds between archive runs while the application is up"
+    )
+    TASK_PROJECT_CACHE_MAX_SIZE: int = Field(
+        default=10000, description="Maximum number of task to project mappings cached for the activity log"
+    )
+    TASK_PROJECT_CACHE_TTL_SECONDS: int = Field(
+        default=3600, description="Seconds a task to project mapping stays cached (0 disables the cache)"
+    )
+    EVENT_BUS_TRANSPORT: Literal["mongo", "memory"] = Field(
+        default="mongo",
+        description="How entity-changed events reach other workers: a tailed capped collection, or not at all",
+    )
+    EVENT_BUS_COLLECTION: str = Field(
+        default="entity_events", description="Capped collection carrying entity-changed events between workers"
+    )
+    EVENT_BUS_CAPPED_SIZE_BYTES: int = Field(
+        default=16 * 1024 * 1024, description="Size of the event bus capped collection"
+    )
+    EVENT_BUS_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=0.05, description="Maximum seconds an event waits before being written to the bus collection"
+    )
+    EVENT_STREAM_QUEUE_SIZE: int = Field(
+        default=256, description="Events buffered per live-update subscriber before it is disconnected"
+    )
+    EVENT_STREAM_HEARTBEAT_SECONDS: float = Field(
+        default=15, description="Seconds of silence after which a keep-alive comment is sent on event streams"
+    )
+    SYNC_SETTLE_SECONDS: float = Field(
+        default=2, description="Sync skips writes newer than this, so writes still in flight are not missed"
+    )
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = Field(
+        default=30, description="Days deletions are kept for sync; older watermarks require a full resync"
+    )
+    TAG_FACET_CACHE_MAX_SIZE: int = Field(
+        default=1000, description="Maximum number of company/department/project scopes with cached tag counts"
+    )
+    TAG_FACET_CACHE_TTL_SECONDS: int = Field(
+        default=300, description="Seconds tag counts stay cached between writes (0 disables the cache)"
+    )
+    SUBTASK_RANK_MAX_LENGTH: int = Field(
+        default=24, description="Rank length that triggers a background rebalance of a task's subtasks"
+    )
     CORS_ALLOW_ORIGINS: list[str] = Field(
         default=["http://localhost:5173", "http://127.0.0.1:5173"],
         description="Allowed origins for cross-origin requests",
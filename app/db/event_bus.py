@@ -0,0 +1,16 @@
+from app.core.settings import settings
+from app.db.mongo_db import db
+from app.utils.event_bus import EventBus, EventTransport, MemoryTransport, MongoCappedTransport
+
+
+def _transport() -> EventTransport:
+    if settings.EVENT_BUS_TRANSPORT == "memory":
+        return MemoryTransport()
+    return MongoCappedTransport(
+        db[settings.EVENT_BUS_COLLECTION],
+        size_bytes=settings.EVENT_BUS_CAPPED_SIZE_BYTES,
+        flush_interval_seconds=settings.EVENT_BUS_FLUSH_INTERVAL_SECONDS,
+    )
+
+
+event_bus = EventBus(_transport())
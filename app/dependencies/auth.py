@@ -19,7 +19,7 @@ async def get_current_user(token: str = Depends(get_bearer_token)) -> UserDTO:
     user_id = payload.get("sub")
     if not user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    user = await UserService.get_user(user_id)
+    user = await UserService.get_principal(user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     return user
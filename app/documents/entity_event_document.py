@@ -0,0 +1,18 @@
+import dataclasses
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+
+from app.base.base_document import BaseDocument
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class EntityEventDocument(BaseDocument):
+    origin: str
+    entity: str
+    op: str
+    entity_id: ObjectId
+    document: dict[str, Any] | None = None
+    changed: list[str] | None = None
+    occurred_at: datetime = dataclasses.field(default_factory=datetime.utcnow)
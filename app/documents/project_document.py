@@ -4,7 +4,12 @@ from datetime import datetime
 from bson import ObjectId
 
 from app.base.base_document import AuditDocument
-from app.schemas.enums import ProjectPriority, ProjectRisk, ProjectStatus
+from app.schemas.enums import (
+    PROJECT_PRIORITY_RANKS,
+    ProjectPriority,
+    ProjectRisk,
+    ProjectStatus,
+)
 
 
 @dataclasses.dataclass(kw_only=True, frozen=True)
@@ -14,6 +19,7 @@ class ProjectDocument(AuditDocument):
     department_id: ObjectId
     status: ProjectStatus = ProjectStatus.planned
     priority: ProjectPriority = ProjectPriority.medium
+    priority_rank: int = PROJECT_PRIORITY_RANKS[ProjectPriority.medium]
     risk_level: ProjectRisk = ProjectRisk.low
     progress: float = 0.0
     start_date: datetime | None = None
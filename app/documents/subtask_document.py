@@ -15,4 +15,5 @@ class SubtaskDocument(AuditDocument):
     status: SubtaskStatus = SubtaskStatus.todo
     assignee_id: ObjectId | None = None
     order: int = 0
+    rank: str = ""
     due_date: datetime | None = None
@@ -4,7 +4,7 @@ from datetime import datetime
 from bson import ObjectId
 
 from app.base.base_document import AuditDocument
-from app.schemas.enums import TaskPriority, TaskStatus
+from app.schemas.enums import TASK_PRIORITY_RANKS, TaskPriority, TaskStatus
 
 
 @dataclasses.dataclass(kw_only=True, frozen=True)
@@ -14,6 +14,8 @@ class TaskDocument(AuditDocument):
     description: str | None = None
     status: TaskStatus = TaskStatus.todo
     priority: TaskPriority = TaskPriority.medium
+    priority_rank: int = TASK_PRIORITY_RANKS[TaskPriority.medium]
+    is_open: bool = True
     progress: float = 0.0
     start_date: datetime | None = None
     due_date: datetime | None = None
@@ -0,0 +1,13 @@
+import dataclasses
+from datetime import datetime
+
+from bson import ObjectId
+
+from app.base.base_document import BaseDocument
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class TombstoneDocument(BaseDocument):
+    entity: str
+    entity_id: ObjectId
+    deleted_at: datetime = dataclasses.field(default_factory=datetime.utcnow)
@@ -8,21 +8,32 @@ from fastapi.responses import JSONResponse
 from app.base.base_response import BaseResponse
 from app.collections.activity_collection import ActivityCollection
 from app.collections.company_collection import CompanyCollection
+from app.collections.counter_collection import CounterCollection
 from app.collections.department_collection import DepartmentCollection
 from app.collections.project_collection import ProjectCollection
 from app.collections.subtask_collection import SubtaskCollection
 from app.collections.task_collection import TaskCollection
+from app.collections.tombstone_collection import TombstoneCollection
 from app.collections.user_collection import UserCollection
 from app.core.settings import settings
+from app.db.event_bus import event_bus
 from app.routers.activity_router import router as activity_router
 from app.routers.auth_router import router as auth_router
 from app.routers.company_router import router as company_router
 from app.routers.department_router import router as department_router
 from app.routers.health_router import router as health_router
 from app.routers.project_router import router as project_router
+from app.routers.search_router import router as search_router
 from app.routers.subtask_router import router as subtask_router
+from app.routers.sync_router import router as sync_router
+from app.routers.tag_router import router as tag_router
 from app.routers.task_router import router as task_router
 from app.routers.user_router import router as user_router
+from app.services.activity_service import ActivityService
+from app.services.counter_service import CounterService
+from app.services.sync_service import SyncService
+from app.utils.pagination import InvalidCursorError
+from app.utils.security import PasswordHasherBusyError, shutdown_password_hasher
 
 
 @asynccontextmanager
@@ -33,8 +44,26 @@ async def lifespan(app: FastAPI):
     await ProjectCollection.create_indexes()
     await TaskCollection.create_indexes()
     await SubtaskCollection.create_indexes()
-    await ActivityCollection.create_indexes()
+    await ActivityCollection.create_indexes(
+        expire_after_seconds=ActivityService.retention_ttl_seconds()
+    )
+    await CounterCollection.create_indexes()
+    await TombstoneCollection.create_indexes(
+        expire_after_seconds=SyncService.tombstone_ttl_seconds()
+    )
+    # Per-department task counters were added later; rebuild once when missing.
+    if await CounterCollection.is_empty() or not await CounterCollection.has_scope_prefix(
+        "task_status", "department:"
+    ):
+        await CounterService.reconcile()
+    await event_bus.start()
+    ActivityService.start_writer()
+    ActivityService.start_archiver()
     yield
+    await ActivityService.stop_archiver()
+    await ActivityService.stop_writer()
+    await event_bus.stop()
+    shutdown_password_hasher()
 
 
 app = FastAPI(title="N3 Todo Platform", version="1.0.0", lifespan=lifespan)
@@ -58,6 +87,9 @@ app.include_router(project_router)
 app.include_router(task_router)
 app.include_router(subtask_router)
 app.include_router(activity_router)
+app.include_router(sync_router)
+app.include_router(search_router)
+app.include_router(tag_router)
 
 
 @app.get("/")
@@ -65,6 +97,31 @@ async def root() -> dict[str, str]:
     return {"message": "N3 Todo platform API"}
 
 
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_handler(
+    request: Request, exc: PasswordHasherBusyError
+) -> JSONResponse:
+    """Shed login/registration load instead of queueing it indefinitely."""
+    response_body = BaseResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+    )
+    return JSONResponse(
+        content=response_body.model_dump(),
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError) -> JSONResponse:
+    response_body = BaseResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"잘못된 페이지 커서입니다: {exc}",
+    )
+    return JSONResponse(content=response_body.model_dump(), status_code=status.HTTP_400_BAD_REQUEST)
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
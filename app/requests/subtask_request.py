@@ -1,6 +1,6 @@
 ﻿from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.schemas.enums import SubtaskStatus
 
@@ -22,3 +22,24 @@ class SubtaskUpdateRequest(BaseModel):
     assignee_id: str | None = None
     order: int | None = None
     due_date: datetime | None = None
+
+
+class SubtaskMoveRequest(BaseModel):
+    before_id: str | None = Field(
+        default=None, description="Subtask that should end up right before the moved one"
+    )
+    after_id: str | None = Field(
+        default=None, description="Subtask that should end up right after the moved one"
+    )
+
+
+class SubtaskBulkCreateRequest(BaseModel):
+    items: list[SubtaskCreateRequest] = Field(..., min_length=1, max_length=500)
+
+
+class SubtaskBulkUpdateItem(SubtaskUpdateRequest):
+    id: str
+
+
+class SubtaskBulkUpdateRequest(BaseModel):
+    items: list[SubtaskBulkUpdateItem] = Field(..., min_length=1, max_length=500)
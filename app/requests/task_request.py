@@ -34,3 +34,15 @@ class TaskUpdateRequest(BaseModel):
     references: list[str] | None = None
     tags: list[str] | None = None
     checklist: list[str] | None = None
+
+
+class TaskBulkCreateRequest(BaseModel):
+    items: list[TaskCreateRequest] = Field(..., min_length=1, max_length=500)
+
+
+class TaskBulkUpdateItem(TaskUpdateRequest):
+    id: str
+
+
+class TaskBulkUpdateRequest(BaseModel):
+    items: list[TaskBulkUpdateItem] = Field(..., min_length=1, max_length=500)
@@ -1,6 +1,6 @@
 ﻿from typing import List
 
-from app.base.base_response import BaseResponse
+from app.base.base_response import BaseResponse, PageResponse
 from app.schemas.models import CompanyDTO
 
 
@@ -10,7 +10,7 @@ class CompanyResponse(BaseResponse[CompanyDTO]):
     pass
 
 
-class CompanyListResponse(BaseResponse[List[CompanyDTO]]):
+class CompanyListResponse(PageResponse[List[CompanyDTO]]):
     """Response envelope for company collections"""
 
     pass
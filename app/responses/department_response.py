@@ -1,6 +1,6 @@
 ﻿from typing import List
 
-from app.base.base_response import BaseResponse
+from app.base.base_response import BaseResponse, PageResponse
 from app.schemas.models import DepartmentDTO
 
 
@@ -8,5 +8,5 @@ class DepartmentResponse(BaseResponse[DepartmentDTO]):
     pass
 
 
-class DepartmentListResponse(BaseResponse[List[DepartmentDTO]]):
+class DepartmentListResponse(PageResponse[List[DepartmentDTO]]):
     pass
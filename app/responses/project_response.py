@@ -1,6 +1,6 @@
 ﻿from typing import List
 
-from app.base.base_response import BaseResponse
+from app.base.base_response import BaseResponse, PageResponse
 from app.schemas.models import ActivityDTO, ProjectDTO, TaskDTO
 
 
@@ -8,7 +8,7 @@ class ProjectResponse(BaseResponse[ProjectDTO]):
     pass
 
 
-class ProjectListResponse(BaseResponse[List[ProjectDTO]]):
+class ProjectListResponse(PageResponse[List[ProjectDTO]]):
     pass
 
 
@@ -20,5 +20,9 @@ class ActivityListResponse(BaseResponse[List[ActivityDTO]]):
     pass
 
 
-class TaskListResponse(BaseResponse[List[TaskDTO]]):
+class ActivityPageResponse(PageResponse[List[ActivityDTO]]):
+    pass
+
+
+class TaskListResponse(PageResponse[List[TaskDTO]]):
     pass
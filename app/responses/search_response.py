@@ -0,0 +1,8 @@
+from typing import List
+
+from app.base.base_response import PageResponse
+from app.schemas.models import SearchHitDTO
+
+
+class SearchResponse(PageResponse[List[SearchHitDTO]]):
+    pass
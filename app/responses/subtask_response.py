@@ -1,6 +1,12 @@
-﻿from app.base.base_response import BaseResponse
-from app.schemas.models import SubtaskDTO
+﻿from typing import List
+
+from app.base.base_response import BaseResponse
+from app.schemas.models import BulkItemResultDTO, SubtaskDTO
 
 
 class SubtaskResponse(BaseResponse[SubtaskDTO]):
     pass
+
+
+class SubtaskBulkResponse(BaseResponse[List[BulkItemResultDTO[SubtaskDTO]]]):
+    pass
@@ -0,0 +1,6 @@
+from app.base.base_response import BaseResponse
+from app.schemas.models import SyncDTO
+
+
+class SyncResponse(BaseResponse[SyncDTO]):
+    pass
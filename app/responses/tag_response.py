@@ -0,0 +1,8 @@
+from typing import List
+
+from app.base.base_response import BaseResponse
+from app.schemas.models import TagFacetDTO
+
+
+class TagFacetResponse(BaseResponse[List[TagFacetDTO]]):
+    pass
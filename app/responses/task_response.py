@@ -1,16 +1,20 @@
 ﻿from typing import List
 
-from app.base.base_response import BaseResponse
-from app.schemas.models import SubtaskDTO, TaskDTO
+from app.base.base_response import BaseResponse, PageResponse
+from app.schemas.models import BulkItemResultDTO, SubtaskDTO, TaskDTO
 
 
 class TaskResponse(BaseResponse[TaskDTO]):
     pass
 
 
-class TaskListResponse(BaseResponse[List[TaskDTO]]):
+class TaskBulkResponse(BaseResponse[List[BulkItemResultDTO[TaskDTO]]]):
     pass
 
 
-class SubtaskListResponse(BaseResponse[List[SubtaskDTO]]):
+class TaskListResponse(PageResponse[List[TaskDTO]]):
+    pass
+
+
+class SubtaskListResponse(PageResponse[List[SubtaskDTO]]):
     pass
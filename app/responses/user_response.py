@@ -1,6 +1,6 @@
 ﻿from typing import List
 
-from app.base.base_response import BaseResponse
+from app.base.base_response import BaseResponse, PageResponse
 from app.schemas.models import UserDTO
 
 
@@ -8,5 +8,5 @@ class UserResponse(BaseResponse[UserDTO]):
     pass
 
 
-class UserListResponse(BaseResponse[List[UserDTO]]):
+class UserListResponse(PageResponse[List[UserDTO]]):
     pass
@@ -1,4 +1,4 @@
-﻿from fastapi import APIRouter, Depends, HTTPException, Path, status
+﻿from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
 
 from app.base.base_response import BaseResponse
 from app.dependencies.auth import get_current_user
@@ -20,9 +20,14 @@ async def create_company(
 
 
 @router.get("", response_model=CompanyListResponse)
-async def list_companies() -> CompanyListResponse:
-    companies = await CompanyService.list_companies()
-    return CompanyListResponse(status_code=status.HTTP_200_OK, detail="Company list", data=companies)
+async def list_companies(
+    limit: int = Query(default=500, ge=1, le=500),
+    cursor: str | None = Query(default=None),
+) -> CompanyListResponse:
+    companies, next_cursor = await CompanyService.list_companies(limit=limit, cursor=cursor)
+    return CompanyListResponse(
+        status_code=status.HTTP_200_OK, detail="Company list", data=companies, next_cursor=next_cursor
+    )
 
 
 @router.get("/{company_id}", response_model=CompanyResponse)
@@ -39,10 +44,7 @@ async def update_company(
     company_id: str = Path(...),
     current_user: UserDTO = Depends(get_current_user),
 ) -> CompanyResponse:
-    success = await CompanyService.update_company(company_id, request, actor_id=current_user.id)
-    if not success:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Company not found")
-    company = await CompanyService.get_company(company_id)
+    company = await CompanyService.update_company(company_id, request, actor_id=current_user.id)
     if not company:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Company not found")
     return CompanyResponse(status_code=status.HTTP_200_OK, detail="Company updated", data=company)
@@ -26,9 +26,20 @@ async def create_department(
 
 
 @router.get("", response_model=DepartmentListResponse)
-async def list_departments(company_id: str | None = Query(default=None)) -> DepartmentListResponse:
-    departments = await DepartmentService.list_departments(company_id=company_id)
-    return DepartmentListResponse(status_code=status.HTTP_200_OK, detail="Department list", data=departments)
+async def list_departments(
+    company_id: str | None = Query(default=None),
+    limit: int = Query(default=1000, ge=1, le=1000),
+    cursor: str | None = Query(default=None),
+) -> DepartmentListResponse:
+    departments, next_cursor = await DepartmentService.list_departments(
+        company_id=company_id, limit=limit, cursor=cursor
+    )
+    return DepartmentListResponse(
+        status_code=status.HTTP_200_OK,
+        detail="Department list",
+        data=departments,
+        next_cursor=next_cursor,
+    )
 
 
 @router.patch("/{department_id}", response_model=DepartmentResponse)
@@ -37,10 +48,7 @@ async def update_department(
     department_id: str = Path(...),
     current_user: UserDTO = Depends(get_current_user),
 ) -> DepartmentResponse:
-    success = await DepartmentService.update_department(department_id, request, actor_id=current_user.id)
-    if not success:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Department not found")
-    department = await DepartmentService.get_department(department_id)
+    department = await DepartmentService.update_department(department_id, request, actor_id=current_user.id)
     if not department:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Department not found")
     return DepartmentResponse(status_code=status.HTTP_200_OK, detail="Department updated", data=department)
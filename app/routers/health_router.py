@@ -2,7 +2,11 @@
 from starlette.status import HTTP_200_OK
 
 from app.base.base_response import BaseResponse
+from app.db.event_bus import event_bus
 from app.db.mongo_db import db
+from app.services.activity_service import ActivityService
+from app.services.event_service import EventService
+from app.utils.cache import cache_stats
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
@@ -19,3 +23,24 @@ async def health_check_db() -> BaseResponse[dict[str, str]]:
         return BaseResponse(status_code=HTTP_200_OK, detail="Database reachable", data={"status": "healthy"})
     except Exception as exc:  # pragma: no cover - diagnostic path
         return BaseResponse(status_code=500, detail="Database unreachable", data={"error": str(exc)})
+
+
+@router.get("/cache", tags=["Health"])
+async def health_check_cache() -> BaseResponse[dict[str, dict]]:
+    return BaseResponse(status_code=HTTP_200_OK, detail="Cache statistics", data=cache_stats())
+
+
+@router.get("/activity-writer", tags=["Health"])
+async def health_check_activity_writer() -> BaseResponse[dict[str, int | str]]:
+    return BaseResponse(
+        status_code=HTTP_200_OK, detail="Activity writer statistics", data=ActivityService.writer_stats()
+    )
+
+
+@router.get("/events", tags=["Health"])
+async def health_check_events() -> BaseResponse[dict[str, dict]]:
+    return BaseResponse(
+        status_code=HTTP_200_OK,
+        detail="Event bus and stream statistics",
+        data={"bus": event_bus.stats(), "streams": EventService.stats()},
+    )
@@ -1,6 +1,11 @@
-﻿from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+﻿from typing import AsyncIterator
 
-from app.base.base_response import BaseResponse
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.base.base_response import BaseResponse, PageResponse
+from app.base.fast_response import FastJSONResponse
+from app.core.settings import settings
 from app.dependencies.auth import get_current_user
 from app.requests.project_request import ProjectCreateRequest, ProjectUpdateRequest
 from app.responses.dashboard_response import DashboardResponse
@@ -10,8 +15,9 @@ from app.responses.project_response import (
     ProjectWithTasksResponse,
     TaskListResponse,
 )
-from app.schemas.models import UserDTO
+from app.schemas.models import ProjectDTO, TaskDTO, UserDTO, parse_fields
 from app.services.dashboard_service import DashboardService
+from app.services.event_service import EventService
 from app.services.project_service import ProjectService
 from app.services.task_service import TaskService
 
@@ -27,13 +33,35 @@ async def create_project(
     return ProjectResponse(status_code=status.HTTP_201_CREATED, detail="Project created", data=project)
 
 
-@router.get("", response_model=ProjectListResponse)
+@router.get("", response_model=ProjectListResponse, response_class=FastJSONResponse)
 async def list_projects(
     department_id: str | None = Query(default=None),
     statuses: list[str] | None = Query(default=None),
-) -> ProjectListResponse:
-    projects = await ProjectService.list_projects(department_id=department_id, statuses=statuses)
-    return ProjectListResponse(status_code=status.HTTP_200_OK, detail="Project list", data=projects)
+    tags: list[str] | None = Query(default=None, description="Only projects carrying all of these tags"),
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    fields: str | None = Query(
+        default=None, description="Comma-separated DTO fields to return, e.g. id,title,status"
+    ),
+) -> FastJSONResponse:
+    try:
+        selected = parse_fields(fields, ProjectDTO)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    projects, next_cursor = await ProjectService.list_projects(
+        department_id=department_id,
+        statuses=statuses,
+        tags=tags,
+        limit=limit,
+        cursor=cursor,
+        fields=selected,
+    )
+    envelope_type = PageResponse if selected else ProjectListResponse
+    return FastJSONResponse(
+        envelope_type(
+            status_code=status.HTTP_200_OK, detail="Project list", data=projects, next_cursor=next_cursor
+        )
+    )
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
@@ -44,10 +72,39 @@ async def get_project(project_id: str = Path(...)) -> ProjectResponse:
     return ProjectResponse(status_code=status.HTTP_200_OK, detail="Project detail", data=project)
 
 
-@router.get("/{project_id}/full", response_model=ProjectWithTasksResponse)
-async def get_project_full(project_id: str = Path(...)) -> ProjectWithTasksResponse:
+@router.get("/{project_id}/full", response_model=ProjectWithTasksResponse, response_class=FastJSONResponse)
+async def get_project_full(project_id: str = Path(...)) -> FastJSONResponse:
     detail = await ProjectService.get_project_detail(project_id)
-    return ProjectWithTasksResponse(status_code=status.HTTP_200_OK, detail="Project full detail", data=detail)
+    return FastJSONResponse(
+        ProjectWithTasksResponse(status_code=status.HTTP_200_OK, detail="Project full detail", data=detail)
+    )
+
+
+@router.get("/{project_id}/events", response_class=StreamingResponse)
+async def project_events(project_id: str = Path(...)) -> StreamingResponse:
+    """Server-sent events for the project's tasks and subtasks.
+
+    Only changes are sent (``<entity>.created`` with the DTO, ``.updated`` with
+    the changed fields, ``.deleted`` with the id). A client that falls too far
+    behind is disconnected and should refetch once ``EventSource`` reconnects.
+    """
+    subscription = EventService.subscribe(project_id)
+
+    async def stream() -> AsyncIterator[str]:
+        try:
+            yield "retry: 3000\n\n"
+            async for frame in subscription.messages(
+                idle_timeout=settings.EVENT_STREAM_HEARTBEAT_SECONDS
+            ):
+                yield frame if frame is not None else ": keep-alive\n\n"
+        finally:
+            EventService.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
@@ -56,10 +113,7 @@ async def update_project(
     project_id: str = Path(...),
     current_user: UserDTO = Depends(get_current_user),
 ) -> ProjectResponse:
-    success = await ProjectService.update_project(project_id, request, actor_id=current_user.id)
-    if not success:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
-    project = await ProjectService.get_project(project_id)
+    project = await ProjectService.update_project(project_id, request, actor_id=current_user.id)
     if not project:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
     return ProjectResponse(status_code=status.HTTP_200_OK, detail="Project updated", data=project)
@@ -76,10 +130,29 @@ async def delete_project(
     return BaseResponse(status_code=status.HTTP_200_OK, detail="Project deleted", data={"deleted": True})
 
 
-@router.get("/{project_id}/tasks", response_model=TaskListResponse)
-async def list_project_tasks(project_id: str = Path(...)) -> TaskListResponse:
-    tasks = await TaskService.list_tasks(project_id)
-    return TaskListResponse(status_code=status.HTTP_200_OK, detail="Project tasks", data=tasks)
+@router.get("/{project_id}/tasks", response_model=TaskListResponse, response_class=FastJSONResponse)
+async def list_project_tasks(
+    project_id: str = Path(...),
+    tags: list[str] | None = Query(default=None, description="Only tasks carrying all of these tags"),
+    limit: int = Query(default=1000, ge=1, le=1000),
+    cursor: str | None = Query(default=None),
+    fields: str | None = Query(
+        default=None, description="Comma-separated DTO fields to return, e.g. id,title,status"
+    ),
+) -> FastJSONResponse:
+    try:
+        selected = parse_fields(fields, TaskDTO)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    tasks, next_cursor = await TaskService.list_tasks(
+        project_id, tags=tags, limit=limit, cursor=cursor, fields=selected
+    )
+    envelope_type = PageResponse if selected else TaskListResponse
+    return FastJSONResponse(
+        envelope_type(
+            status_code=status.HTTP_200_OK, detail="Project tasks", data=tasks, next_cursor=next_cursor
+        )
+    )
 
 
 @router.get("/{project_id}/stats")
@@ -88,7 +161,9 @@ async def project_stats(project_id: str = Path(...)) -> BaseResponse[dict]:
     return BaseResponse(status_code=status.HTTP_200_OK, detail="Project stats", data=stats)
 
 
-@router.get("/dashboard/summary", response_model=DashboardResponse)
-async def dashboard_summary() -> DashboardResponse:
+@router.get("/dashboard/summary", response_model=DashboardResponse, response_class=FastJSONResponse)
+async def dashboard_summary() -> FastJSONResponse:
     summary = await DashboardService.get_summary()
-    return DashboardResponse(status_code=status.HTTP_200_OK, detail="Dashboard summary", data=summary)
+    return FastJSONResponse(
+        DashboardResponse(status_code=status.HTTP_200_OK, detail="Dashboard summary", data=summary)
+    )
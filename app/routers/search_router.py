@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Query, status
+
+from app.base.fast_response import FastJSONResponse
+from app.responses.search_response import SearchResponse
+from app.schemas.enums import SearchType
+from app.services.search_service import SearchService
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@router.get("", response_model=SearchResponse, response_class=FastJSONResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find; quote phrases, prefix - to exclude"),
+    types: list[SearchType] | None = Query(default=None),
+    department_id: str | None = Query(default=None),
+    statuses: list[str] | None = Query(default=None),
+    tags: list[str] | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+) -> FastJSONResponse:
+    hits, next_cursor = await SearchService.search(
+        q,
+        types=types,
+        department_id=department_id,
+        statuses=statuses,
+        tags=tags,
+        limit=limit,
+        cursor=cursor,
+    )
+    return FastJSONResponse(
+        SearchResponse(status_code=status.HTTP_200_OK, detail="Search results", data=hits, next_cursor=next_cursor)
+    )
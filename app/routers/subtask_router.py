@@ -1,11 +1,18 @@
 ﻿from typing import List
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, status
 
 from app.base.base_response import BaseResponse
+from app.base.fast_response import FastJSONResponse
 from app.dependencies.auth import get_current_user
-from app.requests.subtask_request import SubtaskCreateRequest, SubtaskUpdateRequest
-from app.responses.subtask_response import SubtaskResponse
+from app.requests.subtask_request import (
+    SubtaskBulkCreateRequest,
+    SubtaskBulkUpdateRequest,
+    SubtaskCreateRequest,
+    SubtaskMoveRequest,
+    SubtaskUpdateRequest,
+)
+from app.responses.subtask_response import SubtaskBulkResponse, SubtaskResponse
 from app.responses.task_response import SubtaskListResponse
 from app.schemas.models import UserDTO
 from app.services.subtask_service import SubtaskService
@@ -22,10 +29,46 @@ async def create_subtask(
     return SubtaskResponse(status_code=status.HTTP_201_CREATED, detail="Subtask created", data=subtask)
 
 
-@router.get("/task/{task_id}", response_model=SubtaskListResponse)
-async def list_subtasks(task_id: str = Path(...)) -> SubtaskListResponse:
-    subtasks = await SubtaskService.list_subtasks(task_id)
-    return SubtaskListResponse(status_code=status.HTTP_200_OK, detail="Subtask list", data=subtasks)
+@router.post("/bulk", response_model=SubtaskBulkResponse)
+async def create_subtasks_bulk(
+    request: SubtaskBulkCreateRequest,
+    current_user: UserDTO = Depends(get_current_user),
+) -> SubtaskBulkResponse:
+    results = await SubtaskService.create_subtasks(request.items, actor_id=current_user.id)
+    succeeded = sum(1 for result in results if result.error is None)
+    return SubtaskBulkResponse(
+        status_code=status.HTTP_200_OK,
+        detail=f"{succeeded} of {len(results)} subtasks created",
+        data=results,
+    )
+
+
+@router.patch("/bulk", response_model=SubtaskBulkResponse)
+async def update_subtasks_bulk(
+    request: SubtaskBulkUpdateRequest,
+    current_user: UserDTO = Depends(get_current_user),
+) -> SubtaskBulkResponse:
+    results = await SubtaskService.update_subtasks(request.items, actor_id=current_user.id)
+    succeeded = sum(1 for result in results if result.error is None)
+    return SubtaskBulkResponse(
+        status_code=status.HTTP_200_OK,
+        detail=f"{succeeded} of {len(results)} subtasks updated",
+        data=results,
+    )
+
+
+@router.get("/task/{task_id}", response_model=SubtaskListResponse, response_class=FastJSONResponse)
+async def list_subtasks(
+    task_id: str = Path(...),
+    limit: int = Query(default=1000, ge=1, le=1000),
+    cursor: str | None = Query(default=None),
+) -> FastJSONResponse:
+    subtasks, next_cursor = await SubtaskService.list_subtasks(task_id, limit=limit, cursor=cursor)
+    return FastJSONResponse(
+        SubtaskListResponse(
+            status_code=status.HTTP_200_OK, detail="Subtask list", data=subtasks, next_cursor=next_cursor
+        )
+    )
 
 
 @router.patch("/{subtask_id}", response_model=SubtaskResponse)
@@ -34,10 +77,7 @@ async def update_subtask(
     subtask_id: str = Path(...),
     current_user: UserDTO = Depends(get_current_user),
 ) -> SubtaskResponse:
-    success = await SubtaskService.update_subtask(subtask_id, request, actor_id=current_user.id)
-    if not success:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subtask not found")
-    subtask = await SubtaskService.get_subtask(subtask_id)
+    subtask = await SubtaskService.update_subtask(subtask_id, request, actor_id=current_user.id)
     if not subtask:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subtask not found")
     return SubtaskResponse(status_code=status.HTTP_200_OK, detail="Subtask updated", data=subtask)
@@ -54,6 +94,26 @@ async def delete_subtask(
     return BaseResponse(status_code=status.HTTP_200_OK, detail="Subtask deleted", data={"deleted": True})
 
 
+@router.post("/{subtask_id}/move", response_model=SubtaskResponse)
+async def move_subtask(
+    request: SubtaskMoveRequest,
+    subtask_id: str = Path(...),
+    current_user: UserDTO = Depends(get_current_user),
+) -> SubtaskResponse:
+    try:
+        subtask = await SubtaskService.move_subtask(
+            subtask_id,
+            before_id=request.before_id,
+            after_id=request.after_id,
+            actor_id=current_user.id,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if not subtask:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subtask not found")
+    return SubtaskResponse(status_code=status.HTTP_200_OK, detail="Subtask moved", data=subtask)
+
+
 @router.post("/{task_id}/reorder")
 async def reorder_subtasks(
     task_id: str = Path(...),
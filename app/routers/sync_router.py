@@ -0,0 +1,21 @@
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.base.fast_response import FastJSONResponse
+from app.responses.sync_response import SyncResponse
+from app.services.sync_service import SyncExpiredError, SyncService
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+
+@router.get("", response_model=SyncResponse, response_class=FastJSONResponse)
+async def sync_changes(
+    since: str | None = Query(default=None, description="next_since from the previous call; omit for a full load"),
+    limit: int = Query(default=500, ge=1, le=1000, description="Maximum items returned per kind"),
+) -> FastJSONResponse:
+    try:
+        changes = await SyncService.changes(since, limit=limit)
+    except SyncExpiredError as exc:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(exc)) from exc
+    return FastJSONResponse(
+        SyncResponse(status_code=status.HTTP_200_OK, detail="Changes since watermark", data=changes)
+    )
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.base.fast_response import FastJSONResponse
+from app.responses.tag_response import TagFacetResponse
+from app.services.tag_service import TagService
+
+router = APIRouter(prefix="/tags", tags=["Tags"])
+
+
+@router.get("/facets", response_model=TagFacetResponse, response_class=FastJSONResponse)
+async def tag_facets(
+    company_id: str | None = Query(default=None),
+    department_id: str | None = Query(default=None),
+    project_id: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=500),
+) -> FastJSONResponse:
+    """Project and task counts per tag, most used first, optionally within one scope."""
+    if sum(scope is not None for scope in (company_id, department_id, project_id)) > 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pass at most one of company_id, department_id and project_id",
+        )
+    facets = await TagService.facets(
+        company_id=company_id, department_id=department_id, project_id=project_id, limit=limit
+    )
+    return FastJSONResponse(
+        TagFacetResponse(status_code=status.HTTP_200_OK, detail="Tag facets", data=facets)
+    )
@@ -2,11 +2,19 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
 
-from app.base.base_response import BaseResponse
+from app.base.base_response import BaseResponse, PageResponse
+from app.base.fast_response import FastJSONResponse
 from app.dependencies.auth import get_current_user
-from app.requests.task_request import TaskCreateRequest, TaskUpdateRequest
-from app.responses.task_response import TaskListResponse, TaskResponse
-from app.schemas.models import UserDTO
+from app.requests.task_request import (
+    TaskBulkCreateRequest,
+    TaskBulkUpdateRequest,
+    TaskCreateRequest,
+    TaskUpdateRequest,
+)
+from app.responses.project_response import ActivityPageResponse
+from app.responses.task_response import TaskBulkResponse, TaskListResponse, TaskResponse
+from app.schemas.models import TaskDTO, UserDTO, parse_fields
+from app.services.activity_service import ActivityService
 from app.services.task_service import TaskService
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
@@ -21,13 +29,57 @@ async def create_task(
     return TaskResponse(status_code=status.HTTP_201_CREATED, detail="Task created", data=task)
 
 
-@router.get("/calendar", response_model=TaskListResponse)
+@router.post("/bulk", response_model=TaskBulkResponse)
+async def create_tasks_bulk(
+    request: TaskBulkCreateRequest,
+    current_user: UserDTO = Depends(get_current_user),
+) -> TaskBulkResponse:
+    results = await TaskService.create_tasks(request.items, actor_id=current_user.id)
+    succeeded = sum(1 for result in results if result.error is None)
+    return TaskBulkResponse(
+        status_code=status.HTTP_200_OK,
+        detail=f"{succeeded} of {len(results)} tasks created",
+        data=results,
+    )
+
+
+@router.patch("/bulk", response_model=TaskBulkResponse)
+async def update_tasks_bulk(
+    request: TaskBulkUpdateRequest,
+    current_user: UserDTO = Depends(get_current_user),
+) -> TaskBulkResponse:
+    results = await TaskService.update_tasks(request.items, actor_id=current_user.id)
+    succeeded = sum(1 for result in results if result.error is None)
+    return TaskBulkResponse(
+        status_code=status.HTTP_200_OK,
+        detail=f"{succeeded} of {len(results)} tasks updated",
+        data=results,
+    )
+
+
+@router.get("/calendar", response_model=TaskListResponse, response_class=FastJSONResponse)
 async def calendar_tasks(
     start: datetime = Query(...),
     end: datetime = Query(...),
-) -> TaskListResponse:
-    tasks = await TaskService.calendar(start, end)
-    return TaskListResponse(status_code=status.HTTP_200_OK, detail="Calendar tasks", data=tasks)
+    limit: int = Query(default=1000, ge=1, le=1000),
+    cursor: str | None = Query(default=None),
+    fields: str | None = Query(
+        default=None, description="Comma-separated DTO fields to return, e.g. id,title,status"
+    ),
+) -> FastJSONResponse:
+    try:
+        selected = parse_fields(fields, TaskDTO)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    tasks, next_cursor = await TaskService.calendar(
+        start, end, limit=limit, cursor=cursor, fields=selected
+    )
+    envelope_type = PageResponse if selected else TaskListResponse
+    return FastJSONResponse(
+        envelope_type(
+            status_code=status.HTTP_200_OK, detail="Calendar tasks", data=tasks, next_cursor=next_cursor
+        )
+    )
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
@@ -38,16 +90,28 @@ async def get_task(task_id: str = Path(...)) -> TaskResponse:
     return TaskResponse(status_code=status.HTTP_200_OK, detail="Task detail", data=task)
 
 
+@router.get("/{task_id}/activities", response_model=ActivityPageResponse)
+async def task_activities(
+    task_id: str = Path(...),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None),
+) -> ActivityPageResponse:
+    activities, next_cursor = await ActivityService.list_for_task(task_id, limit=limit, cursor=cursor)
+    return ActivityPageResponse(
+        status_code=status.HTTP_200_OK,
+        detail="Task activities",
+        data=activities,
+        next_cursor=next_cursor,
+    )
+
+
 @router.patch("/{task_id}", response_model=TaskResponse)
 async def update_task(
     request: TaskUpdateRequest,
     task_id: str = Path(...),
     current_user: UserDTO = Depends(get_current_user),
 ) -> TaskResponse:
-    success = await TaskService.update_task(task_id, request, actor_id=current_user.id)
-    if not success:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
-    task = await TaskService.get_task(task_id)
+    task = await TaskService.update_task(task_id, request, actor_id=current_user.id)
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
     return TaskResponse(status_code=status.HTTP_200_OK, detail="Task updated", data=task)
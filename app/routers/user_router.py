@@ -1,6 +1,7 @@
 ﻿from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
 
 from app.base.base_response import BaseResponse
+from app.base.fast_response import FastJSONResponse
 from app.dependencies.auth import get_current_user
 from app.requests.user_request import (
     UserCreateRequest,
@@ -23,10 +24,20 @@ async def create_user(
     return UserResponse(status_code=status.HTTP_201_CREATED, detail="User created", data=user)
 
 
-@router.get("", response_model=UserListResponse)
-async def list_users(department_id: str | None = Query(default=None)) -> UserListResponse:
-    users = await UserService.list_users(department_id=department_id)
-    return UserListResponse(status_code=status.HTTP_200_OK, detail="User list", data=users)
+@router.get("", response_model=UserListResponse, response_class=FastJSONResponse)
+async def list_users(
+    department_id: str | None = Query(default=None),
+    limit: int = Query(default=1000, ge=1, le=1000),
+    cursor: str | None = Query(default=None),
+) -> FastJSONResponse:
+    users, next_cursor = await UserService.list_users(
+        department_id=department_id, limit=limit, cursor=cursor
+    )
+    return FastJSONResponse(
+        UserListResponse(
+            status_code=status.HTTP_200_OK, detail="User list", data=users, next_cursor=next_cursor
+        )
+    )
 
 
 @router.get("/me", response_model=UserResponse)
@@ -48,10 +59,7 @@ async def update_user(
     user_id: str = Path(...),
     current_user: UserDTO = Depends(get_current_user),
 ) -> UserResponse:
-    success = await UserService.update_user(user_id, request, actor_id=current_user.id)
-    if not success:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    user = await UserService.get_user(user_id)
+    user = await UserService.update_user(user_id, request, actor_id=current_user.id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return UserResponse(status_code=status.HTTP_200_OK, detail="User updated", data=user)
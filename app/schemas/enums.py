@@ -16,6 +16,16 @@ class ProjectPriority(str, Enum):
     critical = "critical"
 
 
+# Stored next to ``priority`` as ``priority_rank`` so lists can sort by
+# importance with an index instead of by the enum's spelling.
+PROJECT_PRIORITY_RANKS: dict[ProjectPriority, int] = {
+    ProjectPriority.low: 1,
+    ProjectPriority.medium: 2,
+    ProjectPriority.high: 3,
+    ProjectPriority.critical: 4,
+}
+
+
 class ProjectRisk(str, Enum):
     low = "low"
     medium = "medium"
@@ -37,6 +47,14 @@ class TaskPriority(str, Enum):
     urgent = "urgent"
 
 
+TASK_PRIORITY_RANKS: dict[TaskPriority, int] = {
+    TaskPriority.low: 1,
+    TaskPriority.medium: 2,
+    TaskPriority.high: 3,
+    TaskPriority.urgent: 4,
+}
+
+
 class SubtaskStatus(str, Enum):
     todo = "todo"
     in_progress = "in_progress"
@@ -44,6 +62,12 @@ class SubtaskStatus(str, Enum):
     blocked = "blocked"
 
 
+class SearchType(str, Enum):
+    project = "project"
+    task = "task"
+    subtask = "subtask"
+
+
 class UserRole(str, Enum):
     admin = "admin"
     manager = "manager"
@@ -1,13 +1,15 @@
 ﻿from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model
 
 from app.schemas.enums import (
     ActivityAction,
     ProjectPriority,
     ProjectRisk,
     ProjectStatus,
+    SearchType,
     SubtaskStatus,
     TaskPriority,
     TaskStatus,
@@ -101,6 +103,7 @@ class SubtaskDTO(BaseModel):
     status: SubtaskStatus
     assignee_id: str | None = None
     order: int
+    rank: str | None = None
     due_date: datetime | None = None
     created_at: datetime
     updated_at: datetime
@@ -118,6 +121,71 @@ class ActivityDTO(BaseModel):
     updated_at: datetime
 
 
+class SearchHitDTO(BaseModel):
+    type: SearchType
+    id: str
+    title: str
+    status: str
+    score: float
+    project_id: str | None = None
+    task_id: str | None = None
+    department_id: str | None = None
+
+
+class TagFacetDTO(BaseModel):
+    tag: str
+    count: int
+    projects: int
+    tasks: int
+
+
+class TombstoneDTO(BaseModel):
+    entity: str
+    id: str
+    deleted_at: datetime
+
+
+class SyncDTO(BaseModel):
+    projects: list[ProjectDTO]
+    tasks: list[TaskDTO]
+    subtasks: list[SubtaskDTO]
+    deleted: list[TombstoneDTO]
+    next_since: str
+    has_more: bool
+
+
+TItem = TypeVar("TItem")
+
+
+class BulkItemResultDTO(BaseModel, Generic[TItem]):
+    index: int
+    id: str | None = None
+    error: str | None = None
+    data: TItem | None = None
+
+
+def parse_fields(raw: str | None, model: type[BaseModel]) -> frozenset[str] | None:
+    """Parse a comma-separated ``fields=`` value into a field set of ``model`` (always with ``id``)."""
+    if not raw:
+        return None
+    fields = {field.strip() for field in raw.split(",") if field.strip()}
+    unknown = fields - set(model.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return frozenset(fields | {"id"})
+
+
+@lru_cache(maxsize=128)
+def partial_model(model: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """Return a DTO class exposing only ``fields`` of ``model``."""
+    definitions: dict[str, Any] = {
+        name: (info.annotation, info)
+        for name, info in model.model_fields.items()
+        if name in fields
+    }
+    return create_model(f"{model.__name__}Partial", **definitions)
+
+
 class DashboardSummaryDTO(BaseModel):
     project_total: int
     active_projects: int
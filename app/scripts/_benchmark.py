@@ -0,0 +1,58 @@
+"""Helpers shared by the ``benchmark_*`` scripts that drive the services end to end.
+
+Those scripts seed and drop whole collections, so they only run against a
+database whose name ends in ``_bench``::
+
+    MONGO_DB_NAME=n3_todo_bench python -m app.scripts.benchmark_project_detail
+"""
+
+import statistics
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+from app.core.settings import settings
+from app.db.mongo_db import client
+from app.main import app, lifespan
+
+BENCH_SUFFIX = "_bench"
+
+
+@asynccontextmanager
+async def bench_database(*, keep: bool = False) -> AsyncIterator[None]:
+    """Start the application against an empty ``*_bench`` database and drop it afterwards."""
+    if not settings.MONGO_DB_NAME.endswith(BENCH_SUFFIX):
+        raise SystemExit(
+            f"refusing to seed {settings.MONGO_DB_NAME!r}; set MONGO_DB_NAME to a name ending in {BENCH_SUFFIX!r}"
+        )
+    await client.drop_database(settings.MONGO_DB_NAME)
+    try:
+        async with lifespan(app):
+            yield
+    finally:
+        if not keep:
+            await client.drop_database(settings.MONGO_DB_NAME)
+
+
+async def timed(call: Callable[[], Awaitable[object]], rounds: int) -> list[float]:
+    """Run ``call`` ``rounds`` times one after another; return each duration in milliseconds."""
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def summary(samples: list[float]) -> str:
+    if not samples:
+        return "-"
+    return (
+        f"p50={statistics.median(samples):8.2f}ms "
+        f"p95={percentile(samples, 0.95):8.2f}ms p99={percentile(samples, 0.99):8.2f}ms"
+    )
@@ -0,0 +1,23 @@
+"""Move activity log entries past ``ACTIVITY_RETENTION_DAYS`` into the monthly archives.
+
+Usage::
+
+    python -m app.scripts.archive_activities
+
+Does nothing unless ``ACTIVITY_RETENTION_DAYS`` is set and
+``ACTIVITY_RETENTION_MODE`` is ``archive``; the running application performs
+the same move every ``ACTIVITY_ARCHIVE_INTERVAL_SECONDS``.
+"""
+
+import asyncio
+
+from app.services.activity_service import ActivityService
+
+
+async def main() -> None:
+    moved = await ActivityService.archive_expired()
+    print(f"archived {moved} activity entries")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+"""Compare task throughput of the bulk endpoints' services with the single-item path.
+
+Usage::
+
+    MONGO_DB_NAME=n3_todo_bench python -m app.scripts.benchmark_bulk
+    MONGO_DB_NAME=n3_todo_bench python -m app.scripts.benchmark_bulk --items 5000 --batch 500
+
+Creates ``--items`` tasks and then moves every one of them to another status:
+once item by item through ``TaskService.create_task``/``update_task``
+(``--concurrency`` in flight, like a client firing parallel requests), and once
+in ``--batch``-sized calls to ``create_tasks``/``update_tasks``. The ``*_bench``
+database is dropped afterwards unless ``--keep``.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable
+
+from bson import ObjectId
+
+from app.requests.project_request import ProjectCreateRequest
+from app.requests.task_request import TaskBulkUpdateItem, TaskCreateRequest, TaskUpdateRequest
+from app.schemas.enums import TaskStatus
+from app.scripts._benchmark import bench_database
+from app.services.project_service import ProjectService
+from app.services.task_service import TaskService
+
+
+async def _rate(calls: list[Awaitable[object]], *, items: int, concurrency: int) -> float:
+    slots = asyncio.Semaphore(concurrency)
+
+    async def run(call: Awaitable[object]) -> None:
+        async with slots:
+            await call
+
+    started = time.perf_counter()
+    await asyncio.gather(*(run(call) for call in calls))
+    return items / (time.perf_counter() - started)
+
+
+async def main(*, items: int, batch: int, concurrency: int, keep: bool) -> None:
+    async with bench_database(keep=keep):
+        project = await ProjectService.create_project(
+            ProjectCreateRequest(title="Bench", department_id=str(ObjectId()))
+        )
+        requests = [TaskCreateRequest(project_id=project.id, title=f"Task {index}") for index in range(items)]
+        batches = [requests[offset : offset + batch] for offset in range(0, items, batch)]
+
+        single_ids: list[str] = []
+
+        async def create_one(request: TaskCreateRequest) -> None:
+            single_ids.append((await TaskService.create_task(request)).id)
+
+        single = await _rate([create_one(request) for request in requests], items=items, concurrency=concurrency)
+        bulk_ids: list[str] = []
+
+        async def create_batch(chunk: list[TaskCreateRequest]) -> None:
+            bulk_ids.extend(result.id for result in await TaskService.create_tasks(chunk) if result.id)
+
+        bulk = await _rate([create_batch(chunk) for chunk in batches], items=items, concurrency=1)
+        print(f"create  single {single:8.1f} items/s   bulk {bulk:8.1f} items/s   {bulk / single:5.1f}x")
+
+        status = TaskStatus.in_progress
+        single = await _rate(
+            [TaskService.update_task(task_id, TaskUpdateRequest(status=status)) for task_id in single_ids],
+            items=items,
+            concurrency=concurrency,
+        )
+        bulk = await _rate(
+            [
+                TaskService.update_tasks([TaskBulkUpdateItem(id=task_id, status=status) for task_id in chunk])
+                for chunk in (bulk_ids[offset : offset + batch] for offset in range(0, items, batch))
+            ],
+            items=items,
+            concurrency=1,
+        )
+        print(f"update  single {single:8.1f} items/s   bulk {bulk:8.1f} items/s   {bulk / single:5.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000, help="tasks created and then updated")
+    parser.add_argument("--batch", type=int, default=200, help="items per bulk call (at most 500)")
+    parser.add_argument("--concurrency", type=int, default=16, help="single-item calls in flight")
+    parser.add_argument("--keep", action="store_true", help="keep the bench database")
+    args = parser.parse_args()
+    asyncio.run(main(items=args.items, batch=args.batch, concurrency=args.concurrency, keep=args.keep))
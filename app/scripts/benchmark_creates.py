@@ -0,0 +1,90 @@
+"""Measure create throughput with and without the read-back after each insert.
+
+Usage::
+
+    MONGO_DB_NAME=n3_todo_bench python -m app.scripts.benchmark_creates
+    MONGO_DB_NAME=n3_todo_bench python -m app.scripts.benchmark_creates --creates 5000 --concurrency 1,32
+
+Creates ``--creates`` projects and tasks through ``ProjectService`` and
+``TaskService`` at each ``--concurrency``, once as the services do now (the DTO
+is mapped from the inserted payload) and once followed by the ``find_by_id``
+they used to issue. The ``*_bench`` database is dropped afterwards unless ``--keep``.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from bson import ObjectId
+
+from app.collections.project_collection import ProjectCollection
+from app.collections.task_collection import TaskCollection
+from app.requests.project_request import ProjectCreateRequest
+from app.requests.task_request import TaskCreateRequest
+from app.scripts._benchmark import bench_database
+from app.services.project_service import ProjectService
+from app.services.task_service import TaskService
+
+
+async def _throughput(create: Callable[[int], Awaitable[object]], *, creates: int, concurrency: int) -> float:
+    slots = asyncio.Semaphore(concurrency)
+
+    async def one(index: int) -> None:
+        async with slots:
+            await create(index)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(creates)))
+    return creates / (time.perf_counter() - started)
+
+
+async def main(*, creates: int, levels: list[int], keep: bool) -> None:
+    async with bench_database(keep=keep):
+        department_id = str(ObjectId())
+        project = await ProjectService.create_project(
+            ProjectCreateRequest(title="Bench", department_id=department_id)
+        )
+
+        async def project_create(index: int) -> object:
+            return await ProjectService.create_project(
+                ProjectCreateRequest(title=f"Project {index}", department_id=department_id)
+            )
+
+        async def project_refetch(index: int) -> object:
+            created = await project_create(index)
+            return await ProjectCollection.find_by_id(created.id)
+
+        async def task_create(index: int) -> object:
+            return await TaskService.create_task(TaskCreateRequest(project_id=project.id, title=f"Task {index}"))
+
+        async def task_refetch(index: int) -> object:
+            created = await task_create(index)
+            return await TaskCollection.find_by_id(created.id)
+
+        for concurrency in levels:
+            for name, current, refetch in (
+                ("project", project_create, project_refetch),
+                ("task", task_create, task_refetch),
+            ):
+                after = await _throughput(current, creates=creates, concurrency=concurrency)
+                before = await _throughput(refetch, creates=creates, concurrency=concurrency)
+                print(
+                    f"{name:<8} concurrency={concurrency:<3} "
+                    f"with read-back {before:8.1f}/s   without {after:8.1f}/s"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--creates", type=int, default=2000, help="creates per variant")
+    parser.add_argument("--concurrency", default="1,16", help="comma-separated requests in flight")
+    parser.add_argument("--keep", action="store_true", help="keep the bench database")
+    args = parser.parse_args()
+    asyncio.run(
+        main(
+            creates=args.creates,
+            levels=[int(level) for level in args.concurrency.split(",")],
+            keep=args.keep,
+        )
+    )
@@ -0,0 +1,128 @@
+"""Compare dashboard summary latency: sequential queries, concurrent aggregations, cached.
+
+Usage::
+
+    MONGO_DB_NAME=n3_todo_bench python -m app.scripts.benchmark_dashboard
+    MONGO_DB_NAME=n3_todo_bench python -m app.scripts.benchmark_dashboard --projects 5000 --tasks 200000
+
+Seeds projects, tasks with deadlines and activity entries, then times:
+
+- ``sequential``: the eight queries the summary awaited one after another
+  before the ``$facet`` rewrite;
+- ``concurrent``: today's uncached computation (counters, the task ``$facet``
+  and the recent feed, run concurrently);
+- ``cached``: ``DashboardService.get_summary`` as the endpoint calls it.
+
+The ``*_bench`` database is dropped afterwards unless ``--keep``.
+"""
+
+import argparse
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+
+from app.collections.activity_collection import ActivityCollection
+from app.collections.project_collection import ProjectCollection
+from app.collections.task_collection import TaskCollection
+from app.db.mongo_db import db
+from app.documents.project_document import ProjectDocument
+from app.documents.task_document import TaskDocument
+from app.schemas.enums import ActivityAction, ProjectStatus, TaskStatus
+from app.scripts._benchmark import bench_database, summary, timed
+from app.services.activity_service import ActivityService
+from app.services.counter_service import CounterService
+from app.services.dashboard_service import DashboardService
+
+_BATCH = 5000
+
+
+async def _seed(*, projects: int, tasks: int, activities: int) -> None:
+    rng = random.Random(7)
+    now = datetime.now(tz=timezone.utc)
+    departments = [ObjectId() for _ in range(20)]
+    project_ids = []
+    for _ in range(projects):
+        project = await ProjectCollection.insert(
+            ProjectDocument(
+                title="Project",
+                description=None,
+                department_id=rng.choice(departments),
+                status=rng.choice(list(ProjectStatus)),
+            )
+        )
+        project_ids.append(project["_id"])
+    for offset in range(0, tasks, _BATCH):
+        batch = []
+        for _ in range(min(_BATCH, tasks - offset)):
+            status = rng.choice(list(TaskStatus))
+            batch.append(
+                TaskDocument(
+                    project_id=rng.choice(project_ids),
+                    title="Task",
+                    status=status,
+                    is_open=status != TaskStatus.done,
+                    due_date=now + timedelta(days=rng.randint(-60, 60)),
+                )
+            )
+        await TaskCollection.insert_many(batch)
+    for offset in range(0, activities, _BATCH):
+        await ActivityCollection.insert_many(
+            [
+                ActivityService.entry(
+                    project_id=str(rng.choice(project_ids)), action=ActivityAction.updated, detail="Seeded"
+                )
+                for _ in range(min(_BATCH, activities - offset))
+            ]
+        )
+    await CounterService.reconcile()
+
+
+async def _sequential_summary() -> None:
+    """The summary's reads before the ``$facet`` rewrite, awaited one by one."""
+    now = datetime.now(tz=timezone.utc)
+    active = [ProjectStatus.planned.value, ProjectStatus.in_progress.value]
+    await ProjectCollection.count()
+    await ProjectCollection.count({"status": {"$in": active}})
+    await TaskCollection.count_overdue(now)
+    await TaskCollection.find_upcoming(now, limit=10)
+    await db["projects"].aggregate([{"$group": {"_id": "$status", "count": {"$sum": 1}}}]).to_list(None)
+    await db["tasks"].aggregate([{"$group": {"_id": "$status", "count": {"$sum": 1}}}]).to_list(None)
+    await db["projects"].aggregate([{"$group": {"_id": "$department_id", "count": {"$sum": 1}}}]).to_list(None)
+    await ActivityService.recent(limit=15)
+
+
+async def _concurrent_summary() -> None:
+    await asyncio.gather(DashboardService._compute_summary(), ActivityService.recent(limit=15))
+
+
+async def main(*, projects: int, tasks: int, activities: int, rounds: int, keep: bool) -> None:
+    async with bench_database(keep=keep):
+        await _seed(projects=projects, tasks=tasks, activities=activities)
+        print(f"{projects} projects, {tasks} tasks, {activities} activities")
+        for name, call in (
+            ("sequential", _sequential_summary),
+            ("concurrent", _concurrent_summary),
+            ("cached", DashboardService.get_summary),
+        ):
+            print(f"{name:<12} {summary(await timed(call, rounds))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=1000, help="projects to seed")
+    parser.add_argument("--tasks", type=int, default=50_000, help="tasks to seed")
+    parser.add_argument("--activities", type=int, default=20_000, help="activity entries to seed")
+    parser.add_argument("--rounds", type=int, default=50, help="timed runs per variant")
+    parser.add_argument("--keep", action="store_true", help="keep the bench database")
+    args = parser.parse_args()
+    asyncio.run(
+        main(
+            projects=args.projects,
+            tasks=args.tasks,
+            activities=args.activities,
+            rounds=args.rounds,
+            keep=args.keep,
+        )
+    )
@@ -0,0 +1,109 @@
+"""Measure the per-document cost of turning raw BSON documents into DTOs.
+
+Usage::
+
+    python -m app.scripts.benchmark_mappers
+    python -m app.scripts.benchmark_mappers --documents 50000
+
+Compares the single-pass mappers in ``app.services.mappers`` with the path
+they replaced: ``serialize_document``, a filtering copy of the payload and full
+pydantic validation. Documents are built in memory; no database is needed.
+"""
+
+import argparse
+import random
+import time
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from bson import ObjectId
+from pydantic import BaseModel
+
+from app.documents.project_document import ProjectDocument
+from app.documents.task_document import TaskDocument
+from app.schemas.enums import ProjectStatus, TaskStatus
+from app.schemas.models import ProjectDTO, TaskDTO
+from app.services import mappers
+from app.utils.mongo_helpers import serialize_document
+
+
+def _tasks(count: int, rng: random.Random) -> list[dict[str, Any]]:
+    now = datetime.now(tz=timezone.utc)
+    return [
+        asdict(
+            TaskDocument(
+                project_id=ObjectId(),
+                title=f"Task {index}",
+                description="Imported from the sprint plan",
+                status=rng.choice(list(TaskStatus)),
+                progress=rng.randint(0, 100),
+                due_date=now + timedelta(days=rng.randint(-30, 30)),
+                assignee_id=ObjectId(),
+                tags=["backend", "sprint-12"],
+                checklist=["spec", "review"],
+            )
+        )
+        for index in range(count)
+    ]
+
+
+def _projects(count: int, rng: random.Random) -> list[dict[str, Any]]:
+    return [
+        asdict(
+            ProjectDocument(
+                title=f"Project {index}",
+                description="Quarterly roadmap item",
+                department_id=ObjectId(),
+                status=rng.choice(list(ProjectStatus)),
+                progress=rng.randint(0, 100),
+                assignee_id=ObjectId(),
+                tags=["roadmap"],
+                member_ids=[ObjectId() for _ in range(5)],
+                watcher_ids=[ObjectId() for _ in range(2)],
+            )
+        )
+        for index in range(count)
+    ]
+
+
+def _validated(model: type[BaseModel]) -> Callable[[dict[str, Any]], BaseModel]:
+    """The mapping before the fast path: serialize, copy the known fields, validate."""
+    allowed = set(model.model_fields)
+
+    def convert(raw: dict[str, Any]) -> BaseModel:
+        payload = serialize_document(raw) or {}
+        return model(**{key: value for key, value in payload.items() if key in allowed})
+
+    return convert
+
+
+def _per_document_us(convert: Callable[[dict[str, Any]], Any], documents: list[dict[str, Any]], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for document in documents:
+            convert(document)
+        best = min(best, time.perf_counter() - started)
+    return best / len(documents) * 1_000_000
+
+
+def main(*, documents: int, rounds: int) -> None:
+    rng = random.Random(3)
+    cases = (
+        ("task", _tasks(documents, rng), _validated(TaskDTO), mappers.map_task),
+        ("project", _projects(documents, rng), _validated(ProjectDTO), mappers.map_project),
+    )
+    for name, raw, legacy, fast in cases:
+        assert legacy(raw[0]).model_dump(mode="json") == fast(raw[0]).model_dump(mode="json")
+        before = _per_document_us(legacy, raw, rounds)
+        after = _per_document_us(fast, raw, rounds)
+        print(f"{name:<8} validated {before:7.2f}us/doc   fast path {after:7.2f}us/doc   {before / after:5.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=10_000, help="documents per collection")
+    parser.add_argument("--rounds", type=int, default=5, help="passes per variant; the fastest is reported")
+    args = parser.parse_args()
+    main(documents=args.documents, rounds=args.rounds)
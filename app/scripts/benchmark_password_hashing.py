@@ -0,0 +1,118 @@
+"""Measure login throughput and unrelated-request latency during a login burst.
+
+Usage::
+
+    python -m app.scripts.benchmark_password_hashing
+    python -m app.scripts.benchmark_password_hashing --logins 64 --concurrency 16
+
+Verifies ``--logins`` passwords, ``--concurrency`` at a time, first inline on the
+event loop (what the handlers did before the hashing pool) and then through
+``verify_password_async``. Meanwhile ``GET /health`` is called through the ASGI
+app every ``--probe-interval`` seconds. The pool's size and type come from the
+``PASSWORD_HASH_*`` settings. No database is needed.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from app.main import app
+from app.scripts._benchmark import summary
+from app.utils.security import hash_password, verify_password, verify_password_async
+
+_PASSWORD = "correct horse battery staple"
+
+
+async def _get(path: str) -> int:
+    """Call ``path`` on the ASGI app in-process and return the response status."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 80),
+    }
+    status = 0
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def _burst(
+    verify: Callable[[], Awaitable[bool]], *, logins: int, concurrency: int, probe_interval: float
+) -> tuple[float, list[float]]:
+    """Run the logins; return logins per second and the probe latencies seen meanwhile."""
+    slots = asyncio.Semaphore(concurrency)
+    probes: list[float] = []
+    done = asyncio.Event()
+
+    async def login() -> None:
+        async with slots:
+            assert await verify()
+
+    async def probe() -> None:
+        # Requests are due on a fixed schedule and timed from when they were due,
+        # so time spent waiting for a blocked event loop counts as latency.
+        due = time.perf_counter()
+        while not done.is_set():
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await _get("/health")
+            probes.append((time.perf_counter() - due) * 1000)
+            due += probe_interval
+
+    prober = asyncio.create_task(probe())
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await prober
+    return logins / elapsed, probes
+
+
+async def main(*, logins: int, concurrency: int, probe_interval: float) -> None:
+    encoded = hash_password(_PASSWORD)
+
+    async def inline() -> bool:
+        return verify_password(_PASSWORD, encoded)
+
+    async def pooled() -> bool:
+        return await verify_password_async(_PASSWORD, encoded)
+
+    await _get("/health")  # builds the middleware stack
+    # Half a second of probing with nothing else running.
+    _, baseline = await _burst(
+        lambda: asyncio.sleep(0.5, True), logins=1, concurrency=1, probe_interval=probe_interval
+    )
+    print(f"{'idle':<8} {'':>14}   /health {summary(baseline)}")
+    for name, verify in (("inline", inline), ("pool", pooled)):
+        throughput, probes = await _burst(
+            verify, logins=logins, concurrency=concurrency, probe_interval=probe_interval
+        )
+        print(f"{name:<8} {throughput:8.1f} logins/s   /health {summary(probes)}  max={max(probes):8.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=32, help="password verifications per run")
+    parser.add_argument("--concurrency", type=int, default=8, help="logins in flight at once")
+    parser.add_argument("--probe-interval", type=float, default=0.01, help="seconds between /health calls")
+    args = parser.parse_args()
+    asyncio.run(main(logins=args.logins, concurrency=args.concurrency, probe_interval=args.probe_interval))
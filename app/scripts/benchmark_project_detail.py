@@ -0,0 +1,88 @@
+"""Time the project detail view against the task count, batched versus per-task subtask reads.
+
+Usage::
+
+    MONGO_DB_NAME=n3_todo_bench python -m app.scripts.benchmark_project_detail
+    MONGO_DB_NAME=n3_todo_bench python -m app.scripts.benchmark_project_detail --tasks 10,100,1000
+
+Seeds one project per ``--tasks`` size, each task with ``--subtasks`` subtasks,
+then times ``ProjectService.get_project_detail`` (one ``$in`` subtask read,
+fetches run concurrently) against the sequential one-query-per-task load it
+replaced. The ``*_bench`` database is dropped afterwards unless ``--keep``.
+"""
+
+import argparse
+import asyncio
+
+from bson import ObjectId
+
+from app.collections.project_collection import ProjectCollection
+from app.collections.subtask_collection import SubtaskCollection
+from app.collections.task_collection import TaskCollection
+from app.documents.project_document import ProjectDocument
+from app.documents.subtask_document import SubtaskDocument
+from app.documents.task_document import TaskDocument
+from app.scripts._benchmark import bench_database, summary, timed
+from app.services import mappers
+from app.services.activity_service import ActivityService
+from app.services.project_service import ProjectService
+from app.services.subtask_service import SubtaskService
+from app.utils.rank import spread_ranks
+
+
+async def _seed(task_count: int, subtask_count: int) -> str:
+    project = await ProjectCollection.insert(
+        ProjectDocument(title=f"{task_count} tasks", description=None, department_id=ObjectId())
+    )
+    tasks, _ = await TaskCollection.insert_many(
+        [TaskDocument(project_id=project["_id"], title=f"Task {index}") for index in range(task_count)]
+    )
+    ranks = spread_ranks(subtask_count)
+    for offset in range(0, len(tasks), 100):
+        await SubtaskCollection.insert_many(
+            [
+                SubtaskDocument(task_id=task["_id"], title=f"Subtask {order}", order=order, rank=rank)
+                for task in tasks[offset : offset + 100]
+                for order, rank in enumerate(ranks)
+            ]
+        )
+    return str(project["_id"])
+
+
+async def _per_task_detail(project_id: str) -> dict:
+    """The load ``get_project_detail`` did before: sequential reads, one subtask query per task."""
+    project = await ProjectCollection.find_by_id(project_id)
+    tasks, _ = await TaskCollection.find_by_project(project_id)
+    enriched = []
+    for task in tasks:
+        subtasks, _ = await SubtaskService.list_subtasks(str(task["_id"]))
+        enriched.append({"task": mappers.map_task(task), "subtasks": subtasks})
+    activities = await ActivityService.recent_for_project(project_id, limit=20)
+    return {"project": mappers.map_project(project), "tasks": enriched, "activities": activities}
+
+
+async def main(*, sizes: list[int], subtasks: int, rounds: int, keep: bool) -> None:
+    async with bench_database(keep=keep):
+        for size in sizes:
+            project_id = await _seed(size, subtasks)
+            batched = await timed(lambda: ProjectService.get_project_detail(project_id), rounds)
+            per_task = await timed(lambda: _per_task_detail(project_id), rounds)
+            print(f"{size:>6} tasks  batched  {summary(batched)}")
+            print(f"{'':>12} per-task {summary(per_task)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", default="10,50,100,300", help="comma-separated task counts")
+    parser.add_argument("--subtasks", type=int, default=3, help="subtasks per task")
+    parser.add_argument("--rounds", type=int, default=20, help="timed runs per variant")
+    parser.add_argument("--keep", action="store_true", help="keep the bench database")
+    args = parser.parse_args()
+    asyncio.run(
+        main(
+            sizes=[int(size) for size in args.tasks.split(",")],
+            subtasks=args.subtasks,
+            rounds=args.rounds,
+            keep=args.keep,
+        )
+    )
@@ -0,0 +1,130 @@
+"""Time task text search against a synthetic corpus.
+
+Usage::
+
+    python -m app.scripts.benchmark_search                       # 1M tasks, then drop the corpus
+    python -m app.scripts.benchmark_search --tasks 200000 --keep  # smaller corpus, kept for reruns
+
+Seeds ``--tasks`` tasks into a separate ``<MONGO_DB_NAME>_search_bench`` database
+(skipped when it already holds that many), builds the same weighted text index
+as ``TaskCollection`` and reports latency percentiles of first and second pages
+for common, mid-frequency and rare words and for a filtered query.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+from app.collections.task_collection import TaskCollection
+from app.core.settings import settings
+from app.db.mongo_db import client
+from app.schemas.enums import TaskStatus
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.text_search import SEARCH_SORT, create_text_index, search_page
+
+_VOCABULARY_SIZE = 20000
+_PROJECTS = 2000
+_TAGS = [f"tag{index}" for index in range(50)]
+_WORDS = [f"w{index}" for index in range(_VOCABULARY_SIZE)]
+# Zipf-like frequencies so the corpus has very common and very rare words.
+_WEIGHTS = [1 / (rank + 1) for rank in range(_VOCABULARY_SIZE)]
+
+
+def _document(rng: random.Random, now: datetime) -> dict:
+    status = rng.choice(list(TaskStatus)).value
+    return {
+        "_id": ObjectId(),
+        "project_id": ObjectId(f"{rng.randrange(_PROJECTS):024x}"),
+        "title": " ".join(rng.choices(_WORDS, _WEIGHTS, k=rng.randint(3, 8))),
+        "description": " ".join(rng.choices(_WORDS, _WEIGHTS, k=rng.randint(10, 30))),
+        "content": " ".join(rng.choices(_WORDS, _WEIGHTS, k=rng.randint(20, 80))),
+        "tags": rng.sample(_TAGS, rng.randint(0, 3)),
+        "status": status,
+        "is_open": status != TaskStatus.done.value,
+        "created_at": now,
+        "updated_at": now - timedelta(minutes=rng.randrange(100000)),
+    }
+
+
+async def _seed(collection, count: int, batch_size: int) -> None:
+    existing = await collection.estimated_document_count()
+    if existing >= count:
+        print(f"reusing {existing} seeded tasks")
+        return
+    rng = random.Random(existing)
+    now = datetime.utcnow()
+    started = time.perf_counter()
+    for offset in range(existing, count, batch_size):
+        size = min(batch_size, count - offset)
+        await collection.insert_many(
+            [_document(rng, now) for _ in range(size)], ordered=False
+        )
+        print(f"\rseeded {offset + size}/{count}", end="", flush=True)
+    print(f"\nseeding took {time.perf_counter() - started:.1f}s")
+
+
+async def _time(collection, text: str, rounds: int, **filters) -> tuple[list[float], list[float]]:
+    first, second = [], []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        page = await search_page(
+            collection, 1, text, limit=21, projection={"title": 1, "status": 1}, **filters
+        )
+        first.append((time.perf_counter() - started) * 1000)
+        if len(page) > 20:
+            after = decode_cursor(encode_cursor(page[19], SEARCH_SORT), SEARCH_SORT)
+            started = time.perf_counter()
+            await search_page(
+                collection, 1, text, after=after, limit=21, projection={"title": 1}, **filters
+            )
+            second.append((time.perf_counter() - started) * 1000)
+    return first, second
+
+
+def _summary(samples: list[float]) -> str:
+    if not samples:
+        return "-"
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50={statistics.median(ordered):7.1f}ms p95={p95:7.1f}ms"
+
+
+async def main(*, tasks: int, batch_size: int, rounds: int, keep: bool) -> None:
+    database = client[f"{settings.MONGO_DB_NAME}_search_bench"]
+    collection = database["tasks"]
+    try:
+        await _seed(collection, tasks, batch_size)
+        started = time.perf_counter()
+        await create_text_index(collection, TaskCollection.SEARCH_WEIGHTS)
+        print(f"text index ready in {time.perf_counter() - started:.1f}s")
+        cases = {
+            "common word": ("w1", {}),
+            "mid word": ("w500", {}),
+            "rare word": ("w15000", {}),
+            "two words": ("w20 w700", {}),
+            "mid word + filters": (
+                "w500",
+                {"match": {"status": {"$in": [TaskStatus.todo.value]}, "tags": {"$all": ["tag3"]}}},
+            ),
+        }
+        for name, (text, filters) in cases.items():
+            first, second = await _time(collection, text, rounds, **filters)
+            print(f"{name:<20} page 1 {_summary(first)}   page 2 {_summary(second)}")
+    finally:
+        if not keep:
+            await client.drop_database(database.name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="number of synthetic tasks")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="tasks per insert_many")
+    parser.add_argument("--rounds", type=int, default=20, help="timed runs per query")
+    parser.add_argument("--keep", action="store_true", help="keep the corpus for the next run")
+    args = parser.parse_args()
+    asyncio.run(main(tasks=args.tasks, batch_size=args.batch_size, rounds=args.rounds, keep=args.keep))
@@ -0,0 +1,34 @@
+"""Check that the overdue/upcoming deadline queries are planned on the open-task index.
+
+Usage::
+
+    python -m app.scripts.check_deadline_indexes
+
+Read-only: runs ``explain`` for every deadline query against the configured
+database and exits non-zero when the ``due_date_open`` partial index is missing
+or a winning plan does not scan it, e.g. after an index was dropped or a query
+lost its ``is_open`` filter. Indexes are built by the application at startup,
+never by this script.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+from app.collections.task_collection import TaskCollection
+
+
+async def main() -> int:
+    if TaskCollection.OPEN_DUE_INDEX not in await TaskCollection.index_names():
+        print(f"FAIL  index {TaskCollection.OPEN_DUE_INDEX} is missing; start the application to build it")
+        return 1
+    plans = await TaskCollection.explain_deadline_queries(datetime.now(tz=timezone.utc))
+    failures = 0
+    for name, indexes in plans.items():
+        ok = TaskCollection.OPEN_DUE_INDEX in indexes
+        failures += not ok
+        print(f"{'ok' if ok else 'FAIL':<5} {name:<20} {', '.join(sorted(indexes)) or 'COLLSCAN'}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
@@ -0,0 +1,31 @@
+"""Rebuild the counters collection from scratch and report any drift.
+
+Usage::
+
+    python -m app.scripts.reconcile_counters            # report and repair
+    python -m app.scripts.reconcile_counters --dry-run  # report only
+"""
+
+import argparse
+import asyncio
+
+from app.services.counter_service import CounterService
+
+
+async def main(*, apply: bool) -> int:
+    drift = await CounterService.reconcile(apply=apply)
+    for item in drift:
+        print(
+            f"{item['kind']:<20} {item['scope']:<40} {item['key']:<30} "
+            f"stored={item['stored']} expected={item['expected']}"
+        )
+    verb = "repaired" if apply else "found"
+    print(f"{len(drift)} drifted counter(s) {verb}")
+    return 1 if drift and not apply else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="report drift without repairing it")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(apply=not args.dry_run)))
@@ -1,22 +1,67 @@
-﻿from bson import ObjectId
+﻿import asyncio
+import dataclasses
+import logging
+from contextlib import suppress
+from datetime import datetime, timedelta
+
+from bson import ObjectId
 
 from app.collections.activity_collection import ActivityCollection
+from app.collections.task_collection import TaskCollection
+from app.core.settings import settings
 from app.documents.activity_document import ActivityDocument
 from app.schemas.enums import ActivityAction
+from app.schemas.models import ActivityDTO
 from app.services import mappers
+from app.utils.batch_writer import BatchWriter
+from app.utils.cache import TTLCache
+
+_writer: BatchWriter[ActivityDocument] = BatchWriter(
+    "activities",
+    ActivityCollection.insert_many,
+    ActivityCollection.insert,
+    max_size=settings.ACTIVITY_QUEUE_MAX_SIZE,
+    batch_size=settings.ACTIVITY_FLUSH_BATCH_SIZE,
+    flush_interval_seconds=settings.ACTIVITY_FLUSH_INTERVAL_SECONDS,
+    overflow=settings.ACTIVITY_QUEUE_OVERFLOW,
+)
+_archiver: asyncio.Task[None] | None = None
+# A task never moves between projects, so its project id can be cached for long.
+_task_projects: TTLCache[str, ObjectId] = TTLCache(
+    "task_projects",
+    max_size=settings.TASK_PROJECT_CACHE_MAX_SIZE,
+    ttl_seconds=settings.TASK_PROJECT_CACHE_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _archiving() -> bool:
+    return settings.ACTIVITY_RETENTION_DAYS > 0 and settings.ACTIVITY_RETENTION_MODE == "archive"
+
+
+async def _archive_loop() -> None:
+    while True:
+        try:
+            moved = await ActivityService.archive_expired()
+            if moved:
+                logger.info("archived %d activity entries", moved)
+        except Exception:
+            logger.exception("activity archive run failed")
+        await asyncio.sleep(settings.ACTIVITY_ARCHIVE_INTERVAL_SECONDS)
 
 
 class ActivityService:
     @staticmethod
-    async def log(
+    def entry(
         *,
         project_id: str | None = None,
         task_id: str | None = None,
         actor_id: str | None = None,
         action: ActivityAction,
         detail: str | None = None,
-    ) -> None:
-        document = ActivityDocument(
+    ) -> ActivityDocument:
+        return ActivityDocument(
             project_id=ObjectId(project_id) if project_id else None,
             task_id=ObjectId(task_id) if task_id else None,
             actor_id=ObjectId(actor_id) if actor_id else None,
@@ -25,13 +70,130 @@ class ActivityService:
             created_by=actor_id,
             updated_by=actor_id,
         )
-        await ActivityCollection.insert(document)
+
+    @staticmethod
+    async def project_ids(task_ids: list[str]) -> dict[str, ObjectId]:
+        """Resolve task ids to project ids through the cached task -> project map."""
+        projects: dict[str, ObjectId] = {}
+        missing: list[str] = []
+        for task_id in task_ids:
+            cached = _task_projects.get(task_id)
+            if cached is None:
+                missing.append(task_id)
+            else:
+                projects[task_id] = cached
+        if missing:
+            for task_id, project_id in (await TaskCollection.project_ids(missing)).items():
+                _task_projects.set(task_id, project_id)
+                projects[task_id] = project_id
+        return projects
+
+    @staticmethod
+    async def _with_projects(entries: list[ActivityDocument]) -> list[ActivityDocument]:
+        """Fill in ``project_id`` on task-only entries so project feeds include them."""
+        missing: set[str] = set()
+        for entry in entries:
+            if entry.task_id is None:
+                continue
+            if entry.project_id is not None:
+                _task_projects.set(str(entry.task_id), entry.project_id)
+            else:
+                missing.add(str(entry.task_id))
+        if not missing:
+            return entries
+        projects = await ActivityService.project_ids(list(missing))
+        return [
+            dataclasses.replace(entry, project_id=projects[str(entry.task_id)])
+            if entry.project_id is None and str(entry.task_id) in projects
+            else entry
+            for entry in entries
+        ]
+
+    @staticmethod
+    async def log(
+        *,
+        project_id: str | None = None,
+        task_id: str | None = None,
+        actor_id: str | None = None,
+        action: ActivityAction,
+        detail: str | None = None,
+    ) -> None:
+        [entry] = await ActivityService._with_projects(
+            [
+                ActivityService.entry(
+                    project_id=project_id,
+                    task_id=task_id,
+                    actor_id=actor_id,
+                    action=action,
+                    detail=detail,
+                )
+            ]
+        )
+        await _writer.submit(entry)
+
+    @staticmethod
+    async def log_many(entries: list[ActivityDocument]) -> None:
+        """Queue entries built with :meth:`entry`; written with one ``insert_many`` when inline."""
+        await _writer.submit_many(await ActivityService._with_projects(entries))
+
+    @staticmethod
+    def start_writer() -> None:
+        _writer.start()
+
+    @staticmethod
+    async def stop_writer() -> None:
+        """Write every queued activity; called on application shutdown."""
+        await _writer.stop()
+
+    @staticmethod
+    def writer_stats() -> dict[str, int | str]:
+        return _writer.stats()
+
+    @staticmethod
+    def retention_ttl_seconds() -> int | None:
+        """TTL for the activity index when retention is handled by MongoDB, else ``None``."""
+        if settings.ACTIVITY_RETENTION_DAYS > 0 and settings.ACTIVITY_RETENTION_MODE == "ttl":
+            return int(timedelta(days=settings.ACTIVITY_RETENTION_DAYS).total_seconds())
+        return None
+
+    @staticmethod
+    async def archive_expired() -> int:
+        """Move entries past the retention window into the monthly archives (archive mode only)."""
+        if not _archiving():
+            return 0
+        cutoff = datetime.utcnow() - timedelta(days=settings.ACTIVITY_RETENTION_DAYS)
+        return await ActivityCollection.archive_before(cutoff)
+
+    @staticmethod
+    def start_archiver() -> None:
+        global _archiver
+        if _archiver is None and _archiving():
+            _archiver = asyncio.create_task(_archive_loop(), name="activity-archiver")
+
+    @staticmethod
+    async def stop_archiver() -> None:
+        global _archiver
+        if _archiver is None:
+            return
+        _archiver.cancel()
+        with suppress(asyncio.CancelledError):
+            await _archiver
+        _archiver = None
 
     @staticmethod
     async def recent_for_project(project_id: str, limit: int = 20):
         documents = await ActivityCollection.recent_for_project(project_id, limit)
         return [mappers.map_activity(doc) for doc in documents]
 
+    @staticmethod
+    async def list_for_task(
+        task_id: str, *, limit: int = 50, cursor: str | None = None
+    ) -> tuple[list[ActivityDTO], str | None]:
+        documents, next_cursor = await ActivityCollection.find_by_task(
+            task_id, limit=limit, cursor=cursor
+        )
+        return [mappers.map_activity(doc) for doc in documents], next_cursor
+
     @staticmethod
     async def recent(limit: int = 20):
         documents = await ActivityCollection.recent_global(limit)
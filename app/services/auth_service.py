@@ -10,7 +10,7 @@ from app.schemas.enums import UserRole
 from app.schemas.models import UserDTO
 from app.services import mappers
 from app.services.user_service import UserService
-from app.utils.security import create_access_token, hash_password
+from app.utils.security import create_access_token, hash_password_async
 
 
 class AuthService:
@@ -46,13 +46,7 @@ class AuthService:
             name=request.name,
             role=UserRole.member,
             department=request.department,
-            password_hash=hash_password(request.password),
+            password_hash=await hash_password_async(request.password),
         )
-        inserted_id = await UserCollection.insert(document)
-        created = await UserCollection.find_by_id(str(inserted_id))
-        if not created:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="사용자 정보를 불러오지 못했습니다.",
-            )
+        created = await UserCollection.insert(document)
         return mappers.map_user(created)
@@ -16,16 +16,15 @@ class CompanyService:
             created_by=actor_id,
             updated_by=actor_id,
         )
-        inserted_id = await CompanyCollection.insert(document)
-        created = await CompanyCollection.find_by_id(str(inserted_id))
-        if not created:
-            raise RuntimeError("Failed to load company after creation")
+        created = await CompanyCollection.insert(document)
         return mappers.map_company(created)
 
     @staticmethod
-    async def list_companies() -> list[CompanyDTO]:
-        documents = await CompanyCollection.find_many()
-        return [mappers.map_company(doc) for doc in documents]
+    async def list_companies(
+        *, limit: int = 500, cursor: str | None = None
+    ) -> tuple[list[CompanyDTO], str | None]:
+        documents, next_cursor = await CompanyCollection.find_many(limit=limit, cursor=cursor)
+        return [mappers.map_company(doc) for doc in documents], next_cursor
 
     @staticmethod
     async def get_company(company_id: str) -> CompanyDTO | None:
@@ -33,13 +32,16 @@ class CompanyService:
         return mappers.map_company(document) if document else None
 
     @staticmethod
-    async def update_company(company_id: str, request: CompanyUpdateRequest, *, actor_id: str | None = None) -> bool:
+    async def update_company(
+        company_id: str, request: CompanyUpdateRequest, *, actor_id: str | None = None
+    ) -> CompanyDTO | None:
         payload = request.model_dump(exclude_none=True)
         if not payload:
-            return True
+            return await CompanyService.get_company(company_id)
         if actor_id:
             payload["updated_by"] = actor_id
-        return await CompanyCollection.update(company_id, payload)
+        document = await CompanyCollection.update(company_id, payload)
+        return mappers.map_company(document) if document else None
 
     @staticmethod
     async def delete_company(company_id: str) -> bool:
@@ -0,0 +1,278 @@
+from collections import Counter
+from enum import Enum
+from typing import Any
+
+from app.collections.counter_collection import CounterCollection
+from app.collections.department_collection import DepartmentCollection
+from app.collections.project_collection import ProjectCollection
+from app.collections.subtask_collection import SubtaskCollection
+from app.collections.task_collection import TaskCollection
+from app.utils.cache import TTLCache
+
+CounterKey = tuple[str, str, str]
+
+# Departments never move between companies, nor projects between departments,
+# so both mappings can be cached for long.
+_department_companies: TTLCache[str, str] = TTLCache(
+    "department_companies", max_size=4096, ttl_seconds=3600
+)
+_project_departments: TTLCache[str, str] = TTLCache(
+    "project_departments", max_size=16384, ttl_seconds=3600
+)
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
+
+async def _company_for_department(department_id: str) -> str | None:
+    company_id = _department_companies.get(department_id)
+    if company_id is None:
+        department = await DepartmentCollection.find_by_id(department_id)
+        if not department:
+            return None
+        company_id = str(department["company_id"])
+        _department_companies.set(department_id, company_id)
+    return company_id
+
+
+async def _department_for_project(project_id: str) -> str | None:
+    department_id = _project_departments.get(project_id)
+    if department_id is None:
+        project = await ProjectCollection.find_by_id(project_id)
+        if not project:
+            return None
+        department_id = str(project["department_id"])
+        _project_departments.set(project_id, department_id)
+    return department_id
+
+
+async def _task_scopes(project_ids: set[str]) -> dict[str, list[str]]:
+    """Map each project id to the department and company scopes its tasks are counted in."""
+    scopes: dict[str, list[str]] = {}
+    for project_id in project_ids:
+        department_id = await _department_for_project(project_id)
+        company_id = await _company_for_department(department_id) if department_id else None
+        scopes[project_id] = [
+            f"{kind}:{scope_id}"
+            for kind, scope_id in (("department", department_id), ("company", company_id))
+            if scope_id
+        ]
+    return scopes
+
+
+async def _project_keys(project: dict[str, Any] | None) -> list[CounterKey]:
+    if not project:
+        return []
+    status = _text(project["status"])
+    department_id = _text(project["department_id"])
+    keys = [
+        ("project_status", "global", status),
+        ("project_status", f"department:{department_id}", status),
+        ("project_department", "global", department_id),
+    ]
+    company_id = await _company_for_department(department_id)
+    if company_id:
+        keys.append(("project_status", f"company:{company_id}", status))
+        keys.append(("project_department", f"company:{company_id}", department_id))
+    return keys
+
+
+def _task_keys(task: dict[str, Any] | None, scopes: dict[str, list[str]]) -> list[CounterKey]:
+    if not task:
+        return []
+    project_id = _text(task["project_id"])
+    status = _text(task["status"])
+    return [
+        ("task_status", "global", status),
+        ("task_status", f"project:{project_id}", status),
+        ("task_priority", f"project:{project_id}", _text(task["priority"])),
+        *(("task_status", scope, status) for scope in scopes.get(project_id, ())),
+    ]
+
+
+def _subtask_keys(subtask: dict[str, Any] | None) -> list[CounterKey]:
+    if not subtask:
+        return []
+    status = _text(subtask["status"])
+    return [
+        ("subtask_status", "global", status),
+        ("subtask_status", f"task:{_text(subtask['task_id'])}", status),
+    ]
+
+
+def _deltas(before: list[CounterKey], after: list[CounterKey]) -> dict[CounterKey, int]:
+    deltas: Counter[CounterKey] = Counter(after)
+    deltas.subtract(before)
+    return {key: delta for key, delta in deltas.items() if delta}
+
+
+def _distribution(items: list[dict[str, Any]], label: str) -> list[dict[str, Any]]:
+    return [{label: item["key"], "count": item["count"]} for item in items]
+
+
+class CounterService:
+    @staticmethod
+    async def project_changed(
+        before: dict[str, Any] | None, after: dict[str, Any] | None
+    ) -> None:
+        deltas = _deltas(await _project_keys(before), await _project_keys(after))
+        if before and not after:
+            # Tasks left behind by a deleted project no longer count toward its
+            # department and company, matching what ``reconcile`` rebuilds.
+            project_id = _text(before["_id"])
+            scopes = await _task_scopes({project_id})
+            _project_departments.invalidate(project_id)
+            for item in await CounterCollection.find("task_status", f"project:{project_id}"):
+                for scope in scopes[project_id]:
+                    deltas[("task_status", scope, item["key"])] = -item["count"]
+        await CounterCollection.increment(deltas)
+
+    @staticmethod
+    async def task_changed(before: dict[str, Any] | None, after: dict[str, Any] | None) -> None:
+        await CounterService.tasks_changed([(before, after)])
+
+    @staticmethod
+    async def tasks_changed(changes: list[tuple[dict[str, Any] | None, dict[str, Any] | None]]) -> None:
+        """Apply the summed counter deltas of many task changes in one ``bulk_write``."""
+        scopes = await _task_scopes(
+            {_text(task["project_id"]) for change in changes for task in change if task}
+        )
+        before = [key for previous, _ in changes for key in _task_keys(previous, scopes)]
+        after = [key for _, current in changes for key in _task_keys(current, scopes)]
+        await CounterCollection.increment(_deltas(before, after))
+
+    @staticmethod
+    async def subtask_changed(
+        before: dict[str, Any] | None, after: dict[str, Any] | None
+    ) -> None:
+        await CounterService.subtasks_changed([(before, after)])
+
+    @staticmethod
+    async def subtasks_changed(
+        changes: list[tuple[dict[str, Any] | None, dict[str, Any] | None]]
+    ) -> None:
+        """Apply the summed counter deltas of many subtask changes in one ``bulk_write``."""
+        before = [key for previous, _ in changes for key in _subtask_keys(previous)]
+        after = [key for _, current in changes for key in _subtask_keys(current)]
+        await CounterCollection.increment(_deltas(before, after))
+
+    @staticmethod
+    async def project_status_distribution(
+        *, company_id: str | None = None, department_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        if department_id:
+            scope = f"department:{department_id}"
+        elif company_id:
+            scope = f"company:{company_id}"
+        else:
+            scope = "global"
+        return _distribution(await CounterCollection.find("project_status", scope), "status")
+
+    @staticmethod
+    async def task_status_distribution(
+        *, company_id: str | None = None, department_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        if department_id:
+            scope = f"department:{department_id}"
+        elif company_id:
+            scope = f"company:{company_id}"
+        else:
+            scope = "global"
+        return _distribution(await CounterCollection.find("task_status", scope), "status")
+
+    @staticmethod
+    async def department_workload(*, company_id: str | None = None) -> list[dict[str, Any]]:
+        scope = f"company:{company_id}" if company_id else "global"
+        items = await CounterCollection.find("project_department", scope)
+        return _distribution(items, "department_id")
+
+    @staticmethod
+    async def task_distribution(project_id: str) -> dict[str, list[dict[str, Any]]]:
+        scope = f"project:{project_id}"
+        items = await CounterCollection.find_scopes(
+            [("task_status", scope), ("task_priority", scope)]
+        )
+        return {
+            "status": _distribution(
+                [item for item in items if item["kind"] == "task_status"], "status"
+            ),
+            "priority": _distribution(
+                [item for item in items if item["kind"] == "task_priority"], "priority"
+            ),
+        }
+
+    @staticmethod
+    async def global_distributions() -> dict[str, list[dict[str, Any]]]:
+        items = await CounterCollection.find_scopes(
+            [
+                ("project_status", "global"),
+                ("project_department", "global"),
+                ("task_status", "global"),
+            ]
+        )
+        grouped: dict[str, list[dict[str, Any]]] = {
+            "project_status": [],
+            "project_department": [],
+            "task_status": [],
+        }
+        for item in items:
+            grouped[item["kind"]].append(item)
+        return {
+            "project_status": _distribution(grouped["project_status"], "status"),
+            "department_workload": _distribution(
+                grouped["project_department"], "department_id"
+            ),
+            "task_status": _distribution(grouped["task_status"], "status"),
+        }
+
+    @staticmethod
+    async def reconcile(*, apply: bool = True) -> list[dict[str, Any]]:
+        """Rebuild every counter from the source collections and report the drift found."""
+        department_companies = await DepartmentCollection.company_map()
+        project_departments = await ProjectCollection.department_map()
+        expected: Counter[CounterKey] = Counter()
+        for row in await ProjectCollection.count_by_department_status():
+            department_id, status, count = row["department_id"], row["status"], row["count"]
+            expected[("project_status", "global", status)] += count
+            expected[("project_status", f"department:{department_id}", status)] += count
+            expected[("project_department", "global", department_id)] += count
+            company_id = department_companies.get(department_id)
+            if company_id:
+                expected[("project_status", f"company:{company_id}", status)] += count
+                expected[("project_department", f"company:{company_id}", department_id)] += count
+        for row in await TaskCollection.count_by_project("status"):
+            status, count = row["status"], row["count"]
+            expected[("task_status", "global", status)] += count
+            expected[("task_status", f"project:{row['project_id']}", status)] += count
+            department_id = project_departments.get(row["project_id"])
+            if department_id:
+                expected[("task_status", f"department:{department_id}", status)] += count
+                company_id = department_companies.get(department_id)
+                if company_id:
+                    expected[("task_status", f"company:{company_id}", status)] += count
+        for row in await TaskCollection.count_by_project("priority"):
+            scope = f"project:{row['project_id']}"
+            expected[("task_priority", scope, row["priority"])] += row["count"]
+        for row in await SubtaskCollection.count_by_task_status():
+            expected[("subtask_status", "global", row["status"])] += row["count"]
+            expected[("subtask_status", f"task:{row['task_id']}", row["status"])] += row["count"]
+
+        stored = await CounterCollection.find_all()
+        drift = [
+            {
+                "kind": kind,
+                "scope": scope,
+                "key": key,
+                "stored": stored.get((kind, scope, key), 0),
+                "expected": expected.get((kind, scope, key), 0),
+            }
+            for kind, scope, key in sorted(set(stored) | set(expected))
+            if stored.get((kind, scope, key), 0) != expected.get((kind, scope, key), 0)
+        ]
+        if apply and drift:
+            stale = [key for key in stored if key not in expected]
+            await CounterCollection.replace_all(dict(expected), stale)
+        return drift
@@ -1,35 +1,57 @@
-﻿from datetime import datetime, timezone
+﻿import asyncio
+from datetime import datetime, timezone
 
-from app.collections.project_collection import ProjectCollection
 from app.collections.task_collection import TaskCollection
+from app.core.settings import settings
+from app.db.event_bus import event_bus
 from app.schemas.enums import ProjectStatus
-from app.schemas.models import DashboardSummaryDTO
-from app.services import mappers
+from app.schemas.models import ActivityDTO, DashboardSummaryDTO
 from app.services.activity_service import ActivityService
+from app.services.counter_service import CounterService
+from app.utils.cache import VersionedValueCache
+
+_summary_cache: VersionedValueCache[DashboardSummaryDTO] = VersionedValueCache(
+    "dashboard_summary", max_age_seconds=settings.DASHBOARD_CACHE_MAX_AGE_SECONDS
+)
+# Project and task writes from any worker reach the summary through the event bus.
+# The services publish those events only after the counter ``$inc``, so a
+# recompute triggered by the invalidation already reads the new counters.
+event_bus.subscribe(("project", "task"), lambda event: _summary_cache.invalidate())
+# Nearly every write also logs an activity, so the recent feed is cached on its
+# own and only ages out; dropping the summary on each activity flush would
+# leave it almost never served from cache.
+_recent_activity_cache: VersionedValueCache[list[ActivityDTO]] = VersionedValueCache(
+    "dashboard_recent_activities", max_age_seconds=settings.DASHBOARD_ACTIVITY_MAX_AGE_SECONDS
+)
 
 
 class DashboardService:
     @staticmethod
     async def get_summary() -> DashboardSummaryDTO:
+        summary, recent_activities = await asyncio.gather(
+            _summary_cache.get_or_compute(DashboardService._compute_summary),
+            _recent_activity_cache.get_or_compute(lambda: ActivityService.recent(limit=15)),
+        )
+        return summary.model_copy(update={"recent_activities": recent_activities})
+
+    @staticmethod
+    async def _compute_summary() -> DashboardSummaryDTO:
         now = datetime.now(tz=timezone.utc)
-        total_projects = await ProjectCollection.count()
-        active_projects = await ProjectCollection.count(
-            {"status": {"$in": [ProjectStatus.planned.value, ProjectStatus.in_progress.value]}}
+        distributions, task_facets = await asyncio.gather(
+            CounterService.global_distributions(),
+            TaskCollection.dashboard_summary(now, upcoming_limit=10),
         )
-        overdue_tasks = await TaskCollection.count_overdue(now)
-        upcoming_deadlines = await TaskCollection.find_upcoming(now, limit=10)
-        project_status_distribution = await ProjectCollection.stats_by_status()
-        task_status_distribution = await TaskCollection.stats_all_status()
-        department_workload = await ProjectCollection.stats_by_department()
-        recent_raw = await ActivityService.recent(limit=15)
-        recent_activities = [mappers.map_activity(item) for item in recent_raw]
+        active_statuses = {ProjectStatus.planned.value, ProjectStatus.in_progress.value}
+        project_status = distributions["project_status"]
         return DashboardSummaryDTO(
-            project_total=total_projects,
-            active_projects=active_projects,
-            overdue_tasks=overdue_tasks,
-            upcoming_deadlines=upcoming_deadlines,
-            project_status_distribution=project_status_distribution,
-            task_status_distribution=task_status_distribution,
-            department_workload=department_workload,
-            recent_activities=recent_activities,
+            project_total=sum(item["count"] for item in project_status),
+            active_projects=sum(
+                item["count"] for item in project_status if item["status"] in active_statuses
+            ),
+            overdue_tasks=task_facets["overdue"],
+            upcoming_deadlines=task_facets["upcoming"],
+            project_status_distribution=project_status,
+            task_status_distribution=distributions["task_status"],
+            department_workload=distributions["department_workload"],
+            recent_activities=[],
         )
@@ -24,19 +24,22 @@ class DepartmentService:
             created_by=actor_id,
             updated_by=actor_id,
         )
-        inserted_id = await DepartmentCollection.insert(document)
-        created = await DepartmentCollection.find_by_id(str(inserted_id))
-        if not created:
-            raise RuntimeError("Failed to load department after creation")
+        created = await DepartmentCollection.insert(document)
         return mappers.map_department(created)
 
     @staticmethod
-    async def list_departments(*, company_id: str | None = None) -> list[DepartmentDTO]:
+    async def list_departments(
+        *, company_id: str | None = None, limit: int = 1000, cursor: str | None = None
+    ) -> tuple[list[DepartmentDTO], str | None]:
         if company_id:
-            documents = await DepartmentCollection.find_by_company(company_id)
+            documents, next_cursor = await DepartmentCollection.find_by_company(
+                company_id, limit=limit, cursor=cursor
+            )
         else:
-            documents = await DepartmentCollection.find_all()
-        return [mappers.map_department(doc) for doc in documents]
+            documents, next_cursor = await DepartmentCollection.find_all(
+                limit=limit, cursor=cursor
+            )
+        return [mappers.map_department(doc) for doc in documents], next_cursor
 
     @staticmethod
     async def get_department(department_id: str) -> DepartmentDTO | None:
@@ -46,11 +49,12 @@ class DepartmentService:
     @staticmethod
     async def update_department(
         department_id: str, request: DepartmentUpdateRequest, *, actor_id: str | None = None
-    ) -> bool:
+    ) -> DepartmentDTO | None:
         payload = request.model_dump(exclude_none=True)
         if actor_id:
             payload["updated_by"] = actor_id
-        return await DepartmentCollection.update(department_id, payload)
+        document = await DepartmentCollection.update(department_id, payload)
+        return mappers.map_department(document) if document else None
 
     @staticmethod
     async def delete_department(department_id: str) -> bool:
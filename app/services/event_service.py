@@ -0,0 +1,80 @@
+import json
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from app.core.settings import settings
+from app.db.event_bus import event_bus
+from app.services import mappers
+from app.services.activity_service import ActivityService
+from app.utils.event_bus import Event
+from app.utils.pubsub import PubSub, Subscription
+
+# Topics are project ids; messages are ready-to-send SSE frames, encoded once per event.
+_broker: PubSub[str] = PubSub("project-events", queue_size=settings.EVENT_STREAM_QUEUE_SIZE)
+
+_MAPPERS: dict[str, Callable[[dict[str, Any]], BaseModel]] = {
+    "project": mappers.map_project,
+    "task": mappers.map_task,
+    "subtask": mappers.map_subtask,
+}
+
+
+def _frame(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}\n\n"
+
+
+def _payload(event: Event) -> dict[str, Any] | None:
+    """Turn a bus event into the SSE data: the new DTO, the changed fields, or just the id."""
+    document = event["document"]
+    if event["op"] == "created":
+        return _MAPPERS[event["entity"]](document).model_dump(mode="json")
+    if event["op"] == "deleted":
+        return {"id": str(event["entity_id"])}
+    if event["op"] == "reordered":
+        return {"task_id": str(document["task_id"]), "ranks": document["ranks"]}
+    dto = _MAPPERS[event["entity"]](document).model_dump(mode="json")
+    changes = {key: dto[key] for key in event["changed"] or () if key in dto}
+    return {"id": dto["id"], "changes": changes} if changes else None
+
+
+class EventService:
+    @staticmethod
+    def subscribe(project_id: str) -> Subscription[str]:
+        return _broker.subscribe(project_id)
+
+    @staticmethod
+    def unsubscribe(subscription: Subscription[str]) -> None:
+        _broker.unsubscribe(subscription)
+
+    @staticmethod
+    async def _project_of(event: Event) -> str | None:
+        if event["entity"] == "project":
+            return str(event["entity_id"])
+        document = event["document"] or {}
+        if event["entity"] == "task":
+            return str(document["project_id"]) if "project_id" in document else None
+        if "task_id" not in document:
+            return None
+        task_id = str(document["task_id"])
+        project_id = (await ActivityService.project_ids([task_id])).get(task_id)
+        return str(project_id) if project_id is not None else None
+
+    @staticmethod
+    async def on_entity_event(event: Event) -> None:
+        """Forward a project, task or subtask change to the streams of its project."""
+        if not _broker.has_subscribers() or event["op"] != "deleted" and event["document"] is None:
+            return
+        project_id = await EventService._project_of(event)
+        if project_id is None or not _broker.has_subscribers(project_id):
+            return
+        data = _payload(event)
+        if data is not None:
+            _broker.publish(project_id, _frame(f"{event['entity']}.{event['op']}", data))
+
+    @staticmethod
+    def stats() -> dict[str, int | str]:
+        return _broker.stats()
+
+
+event_bus.subscribe(_MAPPERS, EventService.on_entity_event)
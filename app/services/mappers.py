@@ -1,4 +1,9 @@
-﻿from typing import Any
+﻿from enum import Enum
+from types import UnionType
+from typing import Any, Callable, Generic, TypeVar, Union, get_args, get_origin
+
+from bson import ObjectId
+from pydantic import BaseModel
 
 from app.schemas.models import (
     ActivityDTO,
@@ -7,133 +12,142 @@ from app.schemas.models import (
     ProjectDTO,
     SubtaskDTO,
     TaskDTO,
+    TombstoneDTO,
     UserDTO,
+    partial_model,
 )
 
-
-def _filter_payload(payload: dict[str, Any], allowed: set[str]) -> dict[str, Any]:
-    return {key: value for key, value in payload.items() if key in allowed}
+TModel = TypeVar("TModel", bound=BaseModel)
+Converter = Callable[[Any], Any]
+
+
+def _object_id(value: Any) -> Any:
+    return str(value) if isinstance(value, ObjectId) else value
+
+
+def _object_id_list(value: list[Any]) -> list[Any]:
+    return [str(item) if isinstance(item, ObjectId) else item for item in value]
+
+
+def _enum(enum_type: type[Enum]) -> Converter:
+    def convert(value: Any) -> Any:
+        return value if isinstance(value, enum_type) else enum_type(value)
+
+    return convert
+
+
+def _float(value: Any) -> Any:
+    return value if isinstance(value, float) else float(value)
+
+
+def _base_annotation(annotation: Any) -> Any:
+    if get_origin(annotation) in (Union, UnionType):
+        members = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(members) == 1:
+            return members[0]
+    return annotation
+
+
+class _DocumentMapper(Generic[TModel]):
+    """Builds ``model`` instances straight from raw BSON documents in a single pass.
+
+    Documents are written by this service, so pydantic validation is skipped via
+    ``model_construct``; only ObjectIds, enums and floats are coerced so the DTO
+    serializes exactly as a validated one would. A document missing a required
+    field (legacy or partial data) goes through ``model_validate`` instead, so it
+    is rejected rather than turned into a DTO without that attribute.
+    """
+
+    def __init__(
+        self,
+        model: type[TModel],
+        *,
+        object_ids: frozenset[str] = frozenset(),
+        object_id_lists: frozenset[str] = frozenset(),
+    ) -> None:
+        self.model = model
+        self._required = frozenset(
+            name for name, info in model.model_fields.items() if info.is_required()
+        )
+        self._plan: list[tuple[str, str, Converter | None]] = []
+        for name, info in model.model_fields.items():
+            annotation = _base_annotation(info.annotation)
+            converter: Converter | None = None
+            if name in object_ids:
+                converter = _object_id
+            elif name in object_id_lists:
+                converter = _object_id_list
+            elif isinstance(annotation, type) and issubclass(annotation, Enum):
+                converter = _enum(annotation)
+            elif annotation is float:
+                converter = _float
+            self._plan.append((name, "_id" if name == "id" else name, converter))
+
+    def __call__(self, raw: dict[str, Any], fields: frozenset[str] | None = None) -> Any:
+        values: dict[str, Any] = {}
+        for name, key, converter in self._plan:
+            if fields is not None and name not in fields:
+                continue
+            if key in raw:
+                value = raw[key]
+            elif name in raw:
+                value = raw[name]
+            else:
+                continue
+            values[name] = converter(value) if converter is not None and value is not None else value
+        model = partial_model(self.model, fields) if fields else self.model
+        missing = self._required.difference(values)
+        if missing and (fields is None or not missing.isdisjoint(fields)):
+            return model.model_validate(values)
+        return model.model_construct(**values)
+
+
+_company = _DocumentMapper(CompanyDTO, object_ids=frozenset({"id"}))
+_department = _DocumentMapper(
+    DepartmentDTO, object_ids=frozenset({"id", "company_id", "lead_id"})
+)
+_user = _DocumentMapper(UserDTO, object_ids=frozenset({"id", "department_id"}))
+_project = _DocumentMapper(
+    ProjectDTO,
+    object_ids=frozenset({"id", "department_id", "assignee_id"}),
+    object_id_lists=frozenset({"member_ids", "watcher_ids"}),
+)
+_task = _DocumentMapper(TaskDTO, object_ids=frozenset({"id", "project_id", "assignee_id"}))
+_subtask = _DocumentMapper(SubtaskDTO, object_ids=frozenset({"id", "task_id", "assignee_id"}))
+_activity = _DocumentMapper(
+    ActivityDTO, object_ids=frozenset({"id", "project_id", "task_id", "actor_id"})
+)
 
 
 def map_company(raw: dict[str, Any]) -> CompanyDTO:
-    allowed = {
-        "id",
-        "name",
-        "description",
-        "domain",
-        "tags",
-        "created_at",
-        "updated_at",
-    }
-    return CompanyDTO(**_filter_payload(raw, allowed))
+    return _company(raw)
 
 
 def map_department(raw: dict[str, Any]) -> DepartmentDTO:
-    allowed = {
-        "id",
-        "company_id",
-        "name",
-        "description",
-        "lead_id",
-        "tags",
-        "created_at",
-        "updated_at",
-    }
-    return DepartmentDTO(**_filter_payload(raw, allowed))
+    return _department(raw)
 
 
 def map_user(raw: dict[str, Any]) -> UserDTO:
-    allowed = {
-        "id",
-        "login_id",
-        "name",
-        "role",
-        "department",
-        "department_id",
-        "title",
-        "phone",
-        "avatar_url",
-        "is_active",
-        "timezone",
-        "created_at",
-        "updated_at",
-    }
-    return UserDTO(**_filter_payload(raw, allowed))
-
-
-def map_project(raw: dict[str, Any]) -> ProjectDTO:
-    allowed = {
-        "id",
-        "title",
-        "description",
-        "department_id",
-        "status",
-        "priority",
-        "risk_level",
-        "progress",
-        "start_date",
-        "end_date",
-        "assignee_id",
-        "content",
-        "references",
-        "tags",
-        "member_ids",
-        "watcher_ids",
-        "department_name",
-        "created_at",
-        "updated_at",
-    }
-    return ProjectDTO(**_filter_payload(raw, allowed))
-
-
-def map_task(raw: dict[str, Any]) -> TaskDTO:
-    allowed = {
-        "id",
-        "project_id",
-        "title",
-        "description",
-        "status",
-        "priority",
-        "progress",
-        "start_date",
-        "due_date",
-        "assignee_id",
-        "content",
-        "references",
-        "tags",
-        "checklist",
-        "created_at",
-        "updated_at",
-    }
-    return TaskDTO(**_filter_payload(raw, allowed))
+    return _user(raw)
+
+
+def map_project(
+    raw: dict[str, Any], fields: frozenset[str] | None = None
+) -> ProjectDTO | BaseModel:
+    return _project(raw, fields)
+
+
+def map_task(raw: dict[str, Any], fields: frozenset[str] | None = None) -> TaskDTO | BaseModel:
+    return _task(raw, fields)
 
 
 def map_subtask(raw: dict[str, Any]) -> SubtaskDTO:
-    allowed = {
-        "id",
-        "task_id",
-        "title",
-        "content",
-        "status",
-        "assignee_id",
-        "order",
-        "due_date",
-        "created_at",
-        "updated_at",
-    }
-    return SubtaskDTO(**_filter_payload(raw, allowed))
+    return _subtask(raw)
 
 
 def map_activity(raw: dict[str, Any]) -> ActivityDTO:
-    allowed = {
-        "id",
-        "project_id",
-        "task_id",
-        "actor_id",
-        "action",
-        "detail",
-        "occurred_at",
-        "created_at",
-        "updated_at",
-    }
-    return ActivityDTO(**_filter_payload(raw, allowed))
+    return _activity(raw)
+
+
+def map_tombstone(raw: dict[str, Any]) -> TombstoneDTO:
+    return TombstoneDTO(entity=raw["entity"], id=str(raw["entity_id"]), deleted_at=raw["deleted_at"])
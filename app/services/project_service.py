@@ -1,13 +1,18 @@
-﻿from bson import ObjectId
+﻿import asyncio
+
+from bson import ObjectId
+from pydantic import BaseModel
 
 from app.collections.project_collection import ProjectCollection
 from app.collections.task_collection import TaskCollection
+from app.db.event_bus import event_bus
 from app.documents.project_document import ProjectDocument
 from app.requests.project_request import ProjectCreateRequest, ProjectUpdateRequest
-from app.schemas.enums import ActivityAction
+from app.schemas.enums import PROJECT_PRIORITY_RANKS, ActivityAction, ProjectPriority
 from app.schemas.models import ProjectDTO
 from app.services import mappers
 from app.services.activity_service import ActivityService
+from app.services.counter_service import CounterService
 from app.services.subtask_service import SubtaskService
 
 
@@ -22,6 +27,7 @@ class ProjectService:
             department_id=ObjectId(request.department_id),
             status=request.status,
             priority=request.priority,
+            priority_rank=PROJECT_PRIORITY_RANKS[ProjectPriority(request.priority)],
             risk_level=request.risk_level,
             progress=request.progress,
             start_date=request.start_date,
@@ -36,12 +42,11 @@ class ProjectService:
             created_by=actor_id,
             updated_by=actor_id,
         )
-        inserted_id = await ProjectCollection.insert(document)
-        created = await ProjectCollection.find_by_id(str(inserted_id))
-        if not created:
-            raise RuntimeError("Failed to load project after creation")
+        created = await ProjectCollection.insert(document)
+        await CounterService.project_changed(None, created)
+        await event_bus.publish(event_bus.change("project", None, created))
         await ActivityService.log(
-            project_id=str(inserted_id),
+            project_id=document.id,
             actor_id=actor_id,
             action=ActivityAction.created,
             detail=f"Project '{request.title}' created",
@@ -50,12 +55,23 @@ class ProjectService:
 
     @staticmethod
     async def list_projects(
-        *, department_id: str | None = None, statuses: list[str] | None = None
-    ) -> list[ProjectDTO]:
-        documents = await ProjectCollection.find_many(
-            department_id=department_id, statuses=statuses
+        *,
+        department_id: str | None = None,
+        statuses: list[str] | None = None,
+        tags: list[str] | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> tuple[list[ProjectDTO | BaseModel], str | None]:
+        documents, next_cursor = await ProjectCollection.find_many(
+            department_id=department_id,
+            statuses=statuses,
+            tags=tags,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
         )
-        return [mappers.map_project(doc) for doc in documents]
+        return [mappers.map_project(doc, fields) for doc in documents], next_cursor
 
     @staticmethod
     async def get_project(project_id: str) -> ProjectDTO | None:
@@ -64,22 +80,27 @@ class ProjectService:
 
     @staticmethod
     async def get_project_detail(project_id: str) -> dict:
-        project = await ProjectCollection.find_by_id(project_id)
+        project, (tasks, _), activities = await asyncio.gather(
+            ProjectCollection.find_by_id(project_id),
+            TaskCollection.find_by_project(project_id),
+            ActivityService.recent_for_project(project_id, limit=20),
+        )
         if not project:
             raise ValueError("Project not found")
-        tasks = await TaskCollection.find_by_project(project_id)
+        subtasks_by_task = await SubtaskService.list_subtasks_for_tasks(
+            [str(task["_id"]) for task in tasks]
+        )
         enriched_tasks = []
         for task in tasks:
-            subtasks = await SubtaskService.list_subtasks(task["id"])
+            subtasks = subtasks_by_task.get(str(task["_id"]), [])
             enriched_tasks.append(
                 {
-                    "task": mappers.map_task(task).model_dump(),
-                    "subtasks": [subtask.model_dump() for subtask in subtasks],
+                    "task": mappers.map_task(task),
+                    "subtasks": subtasks,
                 }
             )
-        activities = await ActivityService.recent_for_project(project_id, limit=20)
         return {
-            "project": mappers.map_project(project).model_dump(),
+            "project": mappers.map_project(project),
             "tasks": enriched_tasks,
             "activities": activities,
         }
@@ -87,24 +108,33 @@ class ProjectService:
     @staticmethod
     async def update_project(
         project_id: str, request: ProjectUpdateRequest, *, actor_id: str | None = None
-    ) -> bool:
+    ) -> ProjectDTO | None:
         payload = request.model_dump(exclude_none=True)
+        if "priority" in payload:
+            payload["priority_rank"] = PROJECT_PRIORITY_RANKS[ProjectPriority(payload["priority"])]
         if actor_id:
             payload["updated_by"] = actor_id
-        updated = await ProjectCollection.update(project_id, payload)
-        if updated:
-            await ActivityService.log(
-                project_id=project_id,
-                actor_id=actor_id,
-                action=ActivityAction.updated,
-                detail=f"Project '{project_id}' updated",
-            )
-        return updated
+        images = await ProjectCollection.update(project_id, payload)
+        if images is None:
+            return None
+        previous, current = images
+        await CounterService.project_changed(previous, current)
+        await event_bus.publish(event_bus.change("project", previous, current))
+        await ActivityService.log(
+            project_id=project_id,
+            actor_id=actor_id,
+            action=ActivityAction.updated,
+            detail=f"Project '{project_id}' updated",
+        )
+        return mappers.map_project(current)
 
     @staticmethod
     async def delete_project(project_id: str) -> bool:
-        deleted = await ProjectCollection.delete(project_id)
-        if deleted:
+        removed = await ProjectCollection.delete(project_id)
+        deleted = removed is not None
+        if removed is not None:
+            await CounterService.project_changed(removed, None)
+            await event_bus.publish(event_bus.change("project", removed, None))
             await ActivityService.log(
                 project_id=project_id,
                 actor_id=None,
@@ -114,7 +144,16 @@ class ProjectService:
         return deleted
 
     @staticmethod
-    async def stats() -> dict:
-        status = await ProjectCollection.stats_by_status()
-        department = await ProjectCollection.stats_by_department()
-        return {"status": status, "department": department}
+    async def stats(
+        *, company_id: str | None = None, department_id: str | None = None
+    ) -> dict:
+        status, department, task_status = await asyncio.gather(
+            CounterService.project_status_distribution(
+                company_id=company_id, department_id=department_id
+            ),
+            CounterService.department_workload(company_id=company_id),
+            CounterService.task_status_distribution(
+                company_id=company_id, department_id=department_id
+            ),
+        )
+        return {"status": status, "department": department, "task_status": task_status}
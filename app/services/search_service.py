@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any
+
+from bson import ObjectId
+
+from app.collections.project_collection import ProjectCollection
+from app.collections.subtask_collection import SubtaskCollection
+from app.collections.task_collection import TaskCollection
+from app.schemas.enums import SearchType
+from app.schemas.models import SearchHitDTO
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.text_search import SEARCH_SORT
+
+# Position of each type in the merged order; also stored as ``kind`` on every hit.
+_KINDS = {SearchType.project: 0, SearchType.task: 1, SearchType.subtask: 2}
+_TYPES = {kind: search_type for search_type, kind in _KINDS.items()}
+
+
+def _to_hit(document: dict[str, Any]) -> SearchHitDTO:
+    def optional_id(field: str) -> str | None:
+        value = document.get(field)
+        return str(value) if value is not None else None
+
+    return SearchHitDTO(
+        type=_TYPES[document["kind"]],
+        id=str(document["_id"]),
+        title=document.get("title", ""),
+        status=str(document.get("status", "")),
+        score=document["score"],
+        project_id=optional_id("project_id"),
+        task_id=optional_id("task_id"),
+        department_id=optional_id("department_id"),
+    )
+
+
+class SearchService:
+    @staticmethod
+    async def search(
+        text: str,
+        *,
+        types: list[SearchType] | None = None,
+        department_id: str | None = None,
+        statuses: list[str] | None = None,
+        tags: list[str] | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> tuple[list[SearchHitDTO], str | None]:
+        """Rank text matches from projects, tasks and subtasks together, best first.
+
+        Each collection returns its next ``limit + 1`` hits after the cursor; the
+        merged page is cut to ``limit``. Subtasks have no tags, so a tag filter
+        leaves them out.
+        """
+        after = decode_cursor(cursor, SEARCH_SORT) if cursor else None
+        selected = set(types or _KINDS)
+        if tags:
+            selected.discard(SearchType.subtask)
+        project_ids: list[ObjectId] | None = None
+        if department_id and selected & {SearchType.task, SearchType.subtask}:
+            project_ids = await ProjectCollection.ids_for_department(department_id)
+        common = {"after": after, "limit": limit + 1, "statuses": statuses}
+        queries = []
+        if SearchType.project in selected:
+            queries.append(
+                ProjectCollection.search(
+                    text, kind=_KINDS[SearchType.project], department_id=department_id, tags=tags, **common
+                )
+            )
+        if SearchType.task in selected:
+            queries.append(
+                TaskCollection.search(
+                    text, kind=_KINDS[SearchType.task], project_ids=project_ids, tags=tags, **common
+                )
+            )
+        if SearchType.subtask in selected:
+            queries.append(
+                SubtaskCollection.search(
+                    text, kind=_KINDS[SearchType.subtask], project_ids=project_ids, **common
+                )
+            )
+        pages = await asyncio.gather(*queries)
+        hits = sorted(
+            (document for page in pages for document in page),
+            key=lambda document: (-document["score"], document["kind"], document["_id"]),
+        )
+        next_cursor = encode_cursor(hits[limit - 1], SEARCH_SORT) if len(hits) > limit else None
+        return [_to_hit(document) for document in hits[:limit]], next_cursor
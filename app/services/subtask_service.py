@@ -1,34 +1,76 @@
-﻿from bson import ObjectId
+﻿import asyncio
+
+from bson import ObjectId
 
 from app.collections.subtask_collection import SubtaskCollection
+from app.core.settings import settings
 from app.documents.subtask_document import SubtaskDocument
-from app.requests.subtask_request import SubtaskCreateRequest, SubtaskUpdateRequest
+from app.requests.subtask_request import (
+    SubtaskBulkUpdateItem,
+    SubtaskCreateRequest,
+    SubtaskUpdateRequest,
+)
 from app.schemas.enums import ActivityAction
-from app.schemas.models import SubtaskDTO
+from app.schemas.models import BulkItemResultDTO, SubtaskDTO
 from app.services import mappers
 from app.services.activity_service import ActivityService
+from app.services.counter_service import CounterService
+from app.utils.mongo_helpers import is_optional_object_id
+from app.utils.rank import rank_between
+
+# Background rebalances in flight, keyed by task id (also keeps the tasks referenced).
+_rebalances: dict[str, asyncio.Task[int]] = {}
 
 
 class SubtaskService:
     @staticmethod
-    async def create_subtask(
-        request: SubtaskCreateRequest, *, actor_id: str | None = None
-    ) -> SubtaskDTO:
-        document = SubtaskDocument(
+    def _build_document(
+        request: SubtaskCreateRequest, *, rank: str, actor_id: str | None
+    ) -> SubtaskDocument:
+        return SubtaskDocument(
             task_id=ObjectId(request.task_id),
             title=request.title,
             content=request.content,
             status=request.status,
             assignee_id=ObjectId(request.assignee_id) if request.assignee_id else None,
             order=request.order,
+            rank=rank,
             due_date=request.due_date,
             created_by=actor_id,
             updated_by=actor_id,
         )
-        inserted_id = await SubtaskCollection.insert(document)
-        created = await SubtaskCollection.find_by_id(str(inserted_id))
-        if not created:
-            raise RuntimeError("Failed to load subtask after creation")
+
+    @staticmethod
+    async def _append_ranks(requests: list[SubtaskCreateRequest]) -> list[str]:
+        """Return ranks placing each new subtask at the end of its task, in request order."""
+        last = await SubtaskCollection.last_ranks(list({request.task_id for request in requests}))
+        ranks = []
+        for request in requests:
+            rank = rank_between(last.get(request.task_id), None)
+            last[request.task_id] = rank
+            ranks.append(rank)
+        for task_id, rank in last.items():
+            if len(rank) > settings.SUBTASK_RANK_MAX_LENGTH:
+                SubtaskService.schedule_rebalance(task_id)
+        return ranks
+
+    @staticmethod
+    def schedule_rebalance(task_id: str) -> None:
+        running = _rebalances.get(task_id)
+        if running is not None and not running.done():
+            return
+        task = asyncio.create_task(SubtaskCollection.rebalance(task_id))
+        _rebalances[task_id] = task
+        task.add_done_callback(lambda _: _rebalances.pop(task_id, None))
+
+    @staticmethod
+    async def create_subtask(
+        request: SubtaskCreateRequest, *, actor_id: str | None = None
+    ) -> SubtaskDTO:
+        [rank] = await SubtaskService._append_ranks([request])
+        document = SubtaskService._build_document(request, rank=rank, actor_id=actor_id)
+        created = await SubtaskCollection.insert(document)
+        await CounterService.subtask_changed(None, created)
         await ActivityService.log(
             task_id=request.task_id,
             actor_id=actor_id,
@@ -37,45 +79,137 @@ class SubtaskService:
         )
         return mappers.map_subtask(created)
 
+    @staticmethod
+    async def create_subtasks(
+        requests: list[SubtaskCreateRequest], *, actor_id: str | None = None
+    ) -> list[BulkItemResultDTO[SubtaskDTO]]:
+        # Malformed ids are per-item errors and never reach the database.
+        valid = [
+            index
+            for index, request in enumerate(requests)
+            if ObjectId.is_valid(request.task_id) and is_optional_object_id(request.assignee_id)
+        ]
+        ranks = await SubtaskService._append_ranks([requests[index] for index in valid])
+        documents = [
+            SubtaskService._build_document(requests[index], rank=rank, actor_id=actor_id)
+            for index, rank in zip(valid, ranks)
+        ]
+        payloads, errors = await SubtaskCollection.insert_many(documents)
+        created = [payload for position, payload in enumerate(payloads) if position not in errors]
+        if created:
+            await CounterService.subtasks_changed([(None, payload) for payload in created])
+            await ActivityService.log_many(
+                [
+                    ActivityService.entry(
+                        task_id=str(payload["task_id"]),
+                        actor_id=actor_id,
+                        action=ActivityAction.created,
+                        detail=f"Subtask '{payload['title']}' created",
+                    )
+                    for payload in created
+                ]
+            )
+        results = [
+            BulkItemResultDTO[SubtaskDTO](index=index, error="Invalid id")
+            for index in range(len(requests))
+        ]
+        for position, (index, payload) in enumerate(zip(valid, payloads)):
+            results[index] = (
+                BulkItemResultDTO[SubtaskDTO](index=index, error=errors[position])
+                if position in errors
+                else BulkItemResultDTO[SubtaskDTO](
+                    index=index, id=str(payload["_id"]), data=mappers.map_subtask(payload)
+                )
+            )
+        return results
+
     @staticmethod
     async def get_subtask(subtask_id: str) -> SubtaskDTO | None:
         document = await SubtaskCollection.find_by_id(subtask_id)
         return mappers.map_subtask(document) if document else None
 
     @staticmethod
-    async def list_subtasks(task_id: str) -> list[SubtaskDTO]:
-        documents = await SubtaskCollection.find_by_task(task_id)
-        return [mappers.map_subtask(doc) for doc in documents]
+    async def list_subtasks(
+        task_id: str, *, limit: int = 1000, cursor: str | None = None
+    ) -> tuple[list[SubtaskDTO], str | None]:
+        documents, next_cursor = await SubtaskCollection.find_by_task(
+            task_id, limit=limit, cursor=cursor
+        )
+        return [mappers.map_subtask(doc) for doc in documents], next_cursor
+
+    @staticmethod
+    async def list_subtasks_for_tasks(task_ids: list[str]) -> dict[str, list[SubtaskDTO]]:
+        grouped: dict[str, list[SubtaskDTO]] = {task_id: [] for task_id in task_ids}
+        documents = await SubtaskCollection.find_by_tasks(task_ids)
+        for doc in documents:
+            grouped.setdefault(str(doc["task_id"]), []).append(mappers.map_subtask(doc))
+        return grouped
 
     @staticmethod
     async def update_subtask(
         subtask_id: str, request: SubtaskUpdateRequest, *, actor_id: str | None = None
-    ) -> bool:
-        existing = await SubtaskCollection.find_by_id(subtask_id)
-        if not existing:
-            return False
+    ) -> SubtaskDTO | None:
         payload = request.model_dump(exclude_none=True)
         if actor_id:
             payload["updated_by"] = actor_id
-        updated = await SubtaskCollection.update(subtask_id, payload)
-        if updated:
-            await ActivityService.log(
-                task_id=existing["task_id"],
-                actor_id=actor_id,
-                action=ActivityAction.updated,
-                detail=f"Subtask '{subtask_id}' updated",
+        images = await SubtaskCollection.update(subtask_id, payload)
+        if images is None:
+            return None
+        previous, current = images
+        await CounterService.subtask_changed(previous, current)
+        await ActivityService.log(
+            task_id=str(previous["task_id"]),
+            actor_id=actor_id,
+            action=ActivityAction.updated,
+            detail=f"Subtask '{subtask_id}' updated",
+        )
+        return mappers.map_subtask(current)
+
+    @staticmethod
+    async def update_subtasks(
+        items: list[SubtaskBulkUpdateItem], *, actor_id: str | None = None
+    ) -> list[BulkItemResultDTO[SubtaskDTO]]:
+        valid = [index for index, item in enumerate(items) if is_optional_object_id(item.assignee_id)]
+        updates = []
+        for index in valid:
+            payload = items[index].model_dump(exclude_none=True, exclude={"id"})
+            if actor_id:
+                payload["updated_by"] = actor_id
+            updates.append((items[index].id, payload))
+        outcomes: list[tuple[dict, dict] | str] = ["Invalid id"] * len(items)
+        for index, outcome in zip(valid, await SubtaskCollection.bulk_update(updates)):
+            outcomes[index] = outcome
+        changes = [outcome for outcome in outcomes if isinstance(outcome, tuple)]
+        if changes:
+            await CounterService.subtasks_changed(changes)
+            await ActivityService.log_many(
+                [
+                    ActivityService.entry(
+                        task_id=str(previous["task_id"]),
+                        actor_id=actor_id,
+                        action=ActivityAction.updated,
+                        detail=f"Subtask '{previous['_id']}' updated",
+                    )
+                    for previous, _ in changes
+                ]
             )
-        return updated
+        return [
+            BulkItemResultDTO[SubtaskDTO](index=index, id=item.id, error=outcome)
+            if isinstance(outcome, str)
+            else BulkItemResultDTO[SubtaskDTO](
+                index=index, id=item.id, data=mappers.map_subtask(outcome[1])
+            )
+            for index, (item, outcome) in enumerate(zip(items, outcomes))
+        ]
 
     @staticmethod
     async def delete_subtask(subtask_id: str) -> bool:
-        existing = await SubtaskCollection.find_by_id(subtask_id)
-        if not existing:
-            return False
-        deleted = await SubtaskCollection.delete(subtask_id)
-        if deleted:
+        removed = await SubtaskCollection.delete(subtask_id)
+        deleted = removed is not None
+        if removed is not None:
+            await CounterService.subtask_changed(removed, None)
             await ActivityService.log(
-                task_id=existing["task_id"],
+                task_id=str(removed["task_id"]),
                 actor_id=None,
                 action=ActivityAction.updated,
                 detail="Subtask deleted",
@@ -85,3 +219,71 @@ class SubtaskService:
     @staticmethod
     async def reorder(task_id: str, ordered_ids: list[str]) -> None:
         await SubtaskCollection.reorder(task_id, ordered_ids)
+
+    @staticmethod
+    async def _target_rank(
+        subtask_id: str, before_id: str | None, after_id: str | None
+    ) -> tuple[str, str | None] | None:
+        """Return ``(task_id, rank)`` for the move, with ``rank=None`` when the neighbours tie."""
+        documents = await SubtaskCollection.find_ranks(
+            [key for key in (subtask_id, before_id, after_id) if key]
+        )
+        subtask = documents.get(subtask_id)
+        if subtask is None:
+            return None
+        task_id = subtask["task_id"]
+        for key in (before_id, after_id):
+            if key and (key not in documents or documents[key]["task_id"] != task_id):
+                raise ValueError(f"Subtask '{key}' does not belong to the same task")
+        low = documents[before_id].get("rank") if before_id else None
+        high = documents[after_id].get("rank") if after_id else None
+        if before_id and not after_id:
+            high = await SubtaskCollection.adjacent_rank(
+                task_id, low, above=True, exclude=subtask["_id"]
+            )
+        elif after_id and not before_id:
+            low = await SubtaskCollection.adjacent_rank(
+                task_id, high, above=False, exclude=subtask["_id"]
+            )
+        if low is not None and high is not None and low >= high:
+            return str(task_id), None
+        return str(task_id), rank_between(low, high)
+
+    @staticmethod
+    async def move_subtask(
+        subtask_id: str,
+        *,
+        before_id: str | None = None,
+        after_id: str | None = None,
+        actor_id: str | None = None,
+    ) -> SubtaskDTO | None:
+        """Move one subtask between two neighbours by rewriting only its rank."""
+        if not before_id and not after_id:
+            raise ValueError("Provide before_id or after_id")
+        if subtask_id in (before_id, after_id):
+            raise ValueError("A subtask cannot be moved next to itself")
+        target = await SubtaskService._target_rank(subtask_id, before_id, after_id)
+        if target is None:
+            return None
+        task_id, rank = target
+        if rank is None:
+            # Concurrent appends can leave equal ranks; spread them out and retry once.
+            await SubtaskCollection.rebalance(task_id)
+            target = await SubtaskService._target_rank(subtask_id, before_id, after_id)
+            if target is None:
+                return None
+            task_id, rank = target
+            if rank is None:
+                raise ValueError("before_id must come before after_id")
+        document = await SubtaskCollection.set_rank(subtask_id, rank)
+        if document is None:
+            return None
+        if len(rank) > settings.SUBTASK_RANK_MAX_LENGTH:
+            SubtaskService.schedule_rebalance(task_id)
+        await ActivityService.log(
+            task_id=task_id,
+            actor_id=actor_id,
+            action=ActivityAction.updated,
+            detail=f"Subtask '{subtask_id}' moved",
+        )
+        return mappers.map_subtask(document)
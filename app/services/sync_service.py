@@ -0,0 +1,88 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any
+
+from bson import ObjectId
+
+from app.collections.project_collection import ProjectCollection
+from app.collections.subtask_collection import SubtaskCollection
+from app.collections.task_collection import TaskCollection
+from app.collections.tombstone_collection import TombstoneCollection
+from app.core.settings import settings
+from app.schemas.models import SyncDTO
+from app.services import mappers
+from app.utils.pagination import InvalidCursorError, decode_cursor, encode_cursor, encode_position
+
+# One position per feed, in this order: projects, tasks, subtasks, tombstones.
+_FEEDS = (ProjectCollection, TaskCollection, SubtaskCollection, TombstoneCollection)
+_TOKEN_SEPARATOR = "~"
+# Sorts after every real ObjectId: "everything up to this timestamp has been seen".
+_LAST_ID = ObjectId("f" * 24)
+
+
+class SyncExpiredError(ValueError):
+    """Raised when a watermark is older than the tombstones kept for sync."""
+
+
+class SyncService:
+    @staticmethod
+    def tombstone_ttl_seconds() -> int:
+        return int(timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS).total_seconds())
+
+    @staticmethod
+    def _decode(since: str | None) -> list[list[Any] | None]:
+        if not since:
+            return [None] * len(_FEEDS)
+        parts = since.split(_TOKEN_SEPARATOR)
+        if len(parts) != len(_FEEDS):
+            raise InvalidCursorError("Sync token does not match this listing")
+        positions = [decode_cursor(part, feed.SYNC_SORT) for part, feed in zip(parts, _FEEDS)]
+        if not all(isinstance(position[0], datetime) for position in positions):
+            raise InvalidCursorError("Sync token does not match this listing")
+        return positions
+
+    @staticmethod
+    async def changes(since: str | None, *, limit: int = 500) -> SyncDTO:
+        """Return what changed after the ``since`` watermark, at most ``limit`` items per kind.
+
+        Without ``since`` every live document is returned (deletions are skipped).
+        ``has_more`` asks the client to call again right away with ``next_since``.
+        """
+        positions = SyncService._decode(since)
+        now = datetime.utcnow()
+        horizon = now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        # Only the tombstone position says how much deletion history the client
+        # still needs; the live feeds legitimately page through old documents.
+        deletions = positions[-1]
+        if deletions is not None and deletions[0] < horizon:
+            raise SyncExpiredError("Watermark is older than the deletion history; resync from scratch")
+        # Writes stamped just before ``now`` may not be visible yet; leave them for the next call.
+        until = now - timedelta(seconds=settings.SYNC_SETTLE_SECONDS)
+
+        async def read(feed: Any, position: list[Any] | None) -> list[dict[str, Any]]:
+            if feed is TombstoneCollection and position is None:
+                return []
+            return await feed.find_changed(after=position, until=until, limit=limit)
+
+        pages = await asyncio.gather(
+            *(read(feed, position) for feed, position in zip(_FEEDS, positions))
+        )
+        tokens = []
+        has_more = False
+        for feed, position, items in zip(_FEEDS, positions, pages):
+            if len(items) == limit:
+                has_more = True
+                tokens.append(encode_cursor(items[-1], feed.SYNC_SORT))
+            elif position is not None and position[0] > until:
+                tokens.append(encode_position(position))
+            else:
+                tokens.append(encode_position([until, _LAST_ID]))
+        projects, tasks, subtasks, tombstones = pages
+        return SyncDTO(
+            projects=[mappers.map_project(doc) for doc in projects],
+            tasks=[mappers.map_task(doc) for doc in tasks],
+            subtasks=[mappers.map_subtask(doc) for doc in subtasks],
+            deleted=[mappers.map_tombstone(doc) for doc in tombstones],
+            next_since=_TOKEN_SEPARATOR.join(tokens),
+            has_more=has_more,
+        )
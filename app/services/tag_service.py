@@ -0,0 +1,100 @@
+import asyncio
+from typing import Any
+
+from bson import ObjectId
+
+from app.collections.department_collection import DepartmentCollection
+from app.collections.project_collection import ProjectCollection
+from app.collections.task_collection import TaskCollection
+from app.core.settings import settings
+from app.db.event_bus import event_bus
+from app.schemas.models import TagFacetDTO
+from app.utils.cache import TTLCache
+
+# Keyed by ``(scope, id)``; each entry holds every tag of the scope, sorted.
+_facet_cache: TTLCache[tuple[str, str | None], list[TagFacetDTO]] = TTLCache(
+    "tag_facets",
+    max_size=settings.TAG_FACET_CACHE_MAX_SIZE,
+    ttl_seconds=settings.TAG_FACET_CACHE_TTL_SECONDS,
+)
+# Bumped on every invalidation so counts computed across a write are not cached.
+_generation = 0
+# Updates that change a document's tags or move it into another scope.
+_SCOPE_FIELDS = frozenset({"tags", "department_id", "project_id", "company_id"})
+
+
+def _on_entity_event(event: dict[str, Any]) -> None:
+    global _generation
+    op = event.get("op")
+    if op == "created":
+        affected = bool((event.get("document") or {}).get("tags"))
+    elif op == "updated":
+        affected = not _SCOPE_FIELDS.isdisjoint(event.get("changed") or ())
+    else:
+        # Deletes carry at most the counted fields, never the tags.
+        affected = op == "deleted"
+    if affected:
+        _generation += 1
+        _facet_cache.clear()
+
+
+event_bus.subscribe(("project", "task", "department"), _on_entity_event)
+
+
+class TagService:
+    @staticmethod
+    async def facets(
+        *,
+        company_id: str | None = None,
+        department_id: str | None = None,
+        project_id: str | None = None,
+        limit: int = 50,
+    ) -> list[TagFacetDTO]:
+        """Project and task counts per tag within at most one scope, most used first."""
+        if company_id:
+            key: tuple[str, str | None] = ("company", company_id)
+        elif department_id:
+            key = ("department", department_id)
+        elif project_id:
+            key = ("project", project_id)
+        else:
+            key = ("all", None)
+        facets = _facet_cache.get(key)
+        if facets is None:
+            generation = _generation
+            facets = await TagService._compute(*key)
+            if generation == _generation:
+                _facet_cache.set(key, facets)
+        return facets[:limit]
+
+    @staticmethod
+    async def _compute(scope: str, scope_id: str | None) -> list[TagFacetDTO]:
+        if scope == "project":
+            project_query: dict[str, Any] = {"_id": ObjectId(scope_id)}
+            task_query: dict[str, Any] = {"project_id": ObjectId(scope_id)}
+        elif scope == "all":
+            project_query, task_query = {}, {}
+        else:
+            department_ids = (
+                await DepartmentCollection.ids_for_company(scope_id)
+                if scope == "company"
+                else [ObjectId(scope_id)]
+            )
+            project_query = {"department_id": {"$in": department_ids}}
+            task_query = {
+                "project_id": {"$in": await ProjectCollection.ids_for_departments(department_ids)}
+            }
+        projects, tasks = await asyncio.gather(
+            ProjectCollection.tag_counts(project_query), TaskCollection.tag_counts(task_query)
+        )
+        facets = [
+            TagFacetDTO(
+                tag=tag,
+                count=projects.get(tag, 0) + tasks.get(tag, 0),
+                projects=projects.get(tag, 0),
+                tasks=tasks.get(tag, 0),
+            )
+            for tag in projects.keys() | tasks.keys()
+        ]
+        facets.sort(key=lambda facet: (-facet.count, facet.tag))
+        return facets
@@ -1,25 +1,31 @@
 ﻿from datetime import datetime
 
 from bson import ObjectId
+from pydantic import BaseModel
 
 from app.collections.task_collection import TaskCollection
+from app.db.event_bus import event_bus
 from app.documents.task_document import TaskDocument
-from app.requests.task_request import TaskCreateRequest, TaskUpdateRequest
-from app.schemas.enums import ActivityAction
-from app.schemas.models import TaskDTO
+from app.requests.task_request import TaskBulkUpdateItem, TaskCreateRequest, TaskUpdateRequest
+from app.schemas.enums import TASK_PRIORITY_RANKS, ActivityAction, TaskPriority, TaskStatus
+from app.schemas.models import BulkItemResultDTO, TaskDTO
 from app.services import mappers
 from app.services.activity_service import ActivityService
+from app.services.counter_service import CounterService
+from app.utils.mongo_helpers import is_optional_object_id
 
 
 class TaskService:
     @staticmethod
-    async def create_task(request: TaskCreateRequest, *, actor_id: str | None = None) -> TaskDTO:
-        document = TaskDocument(
+    def _build_document(request: TaskCreateRequest, *, actor_id: str | None) -> TaskDocument:
+        return TaskDocument(
             project_id=ObjectId(request.project_id),
             title=request.title,
             description=request.description,
             status=request.status,
             priority=request.priority,
+            priority_rank=TASK_PRIORITY_RANKS[TaskPriority(request.priority)],
+            is_open=TaskStatus(request.status) != TaskStatus.done,
             progress=request.progress,
             start_date=request.start_date,
             due_date=request.due_date,
@@ -31,13 +37,27 @@ class TaskService:
             created_by=actor_id,
             updated_by=actor_id,
         )
-        inserted_id = await TaskCollection.insert(document)
-        created = await TaskCollection.find_by_id(str(inserted_id))
-        if not created:
-            raise RuntimeError("Failed to load task after creation")
+
+    @staticmethod
+    def _update_payload(request: TaskUpdateRequest, *, actor_id: str | None) -> dict:
+        payload = request.model_dump(exclude_none=True, exclude={"id"})
+        if "priority" in payload:
+            payload["priority_rank"] = TASK_PRIORITY_RANKS[TaskPriority(payload["priority"])]
+        if "status" in payload:
+            payload["is_open"] = TaskStatus(payload["status"]) != TaskStatus.done
+        if actor_id:
+            payload["updated_by"] = actor_id
+        return payload
+
+    @staticmethod
+    async def create_task(request: TaskCreateRequest, *, actor_id: str | None = None) -> TaskDTO:
+        document = TaskService._build_document(request, actor_id=actor_id)
+        created = await TaskCollection.insert(document)
+        await CounterService.task_changed(None, created)
+        await event_bus.publish(event_bus.change("task", None, created))
         await ActivityService.log(
             project_id=request.project_id,
-            task_id=str(inserted_id),
+            task_id=document.id,
             actor_id=actor_id,
             action=ActivityAction.created,
             detail=f"Task '{request.title}' created",
@@ -45,9 +65,59 @@ class TaskService:
         return mappers.map_task(created)
 
     @staticmethod
-    async def list_tasks(project_id: str) -> list[TaskDTO]:
-        documents = await TaskCollection.find_by_project(project_id)
-        return [mappers.map_task(doc) for doc in documents]
+    async def create_tasks(
+        requests: list[TaskCreateRequest], *, actor_id: str | None = None
+    ) -> list[BulkItemResultDTO[TaskDTO]]:
+        # Malformed ids are per-item errors and never reach the database.
+        valid = [
+            index
+            for index, request in enumerate(requests)
+            if ObjectId.is_valid(request.project_id) and is_optional_object_id(request.assignee_id)
+        ]
+        documents = [TaskService._build_document(requests[index], actor_id=actor_id) for index in valid]
+        payloads, errors = await TaskCollection.insert_many(documents)
+        created = [payload for position, payload in enumerate(payloads) if position not in errors]
+        if created:
+            await CounterService.tasks_changed([(None, payload) for payload in created])
+            await event_bus.publish(*(event_bus.change("task", None, payload) for payload in created))
+            await ActivityService.log_many(
+                [
+                    ActivityService.entry(
+                        project_id=str(payload["project_id"]),
+                        task_id=str(payload["_id"]),
+                        actor_id=actor_id,
+                        action=ActivityAction.created,
+                        detail=f"Task '{payload['title']}' created",
+                    )
+                    for payload in created
+                ]
+            )
+        results = [
+            BulkItemResultDTO[TaskDTO](index=index, error="Invalid id") for index in range(len(requests))
+        ]
+        for position, (index, payload) in enumerate(zip(valid, payloads)):
+            results[index] = (
+                BulkItemResultDTO[TaskDTO](index=index, error=errors[position])
+                if position in errors
+                else BulkItemResultDTO[TaskDTO](
+                    index=index, id=str(payload["_id"]), data=mappers.map_task(payload)
+                )
+            )
+        return results
+
+    @staticmethod
+    async def list_tasks(
+        project_id: str,
+        *,
+        tags: list[str] | None = None,
+        limit: int = 1000,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> tuple[list[TaskDTO | BaseModel], str | None]:
+        documents, next_cursor = await TaskCollection.find_by_project(
+            project_id, tags=tags, limit=limit, cursor=cursor, fields=fields
+        )
+        return [mappers.map_task(doc, fields) for doc in documents], next_cursor
 
     @staticmethod
     async def get_task(task_id: str) -> TaskDTO | None:
@@ -57,25 +127,67 @@ class TaskService:
     @staticmethod
     async def update_task(
         task_id: str, request: TaskUpdateRequest, *, actor_id: str | None = None
-    ) -> bool:
-        payload = request.model_dump(exclude_none=True)
-        if actor_id:
-            payload["updated_by"] = actor_id
-        updated = await TaskCollection.update(task_id, payload)
-        if updated:
-            await ActivityService.log(
-                task_id=task_id,
-                actor_id=actor_id,
-                action=ActivityAction.updated,
-                detail=f"Task '{task_id}' updated",
+    ) -> TaskDTO | None:
+        payload = TaskService._update_payload(request, actor_id=actor_id)
+        images = await TaskCollection.update(task_id, payload)
+        if images is None:
+            return None
+        previous, current = images
+        await CounterService.task_changed(previous, current)
+        await event_bus.publish(event_bus.change("task", previous, current))
+        await ActivityService.log(
+            project_id=str(previous["project_id"]),
+            task_id=task_id,
+            actor_id=actor_id,
+            action=ActivityAction.updated,
+            detail=f"Task '{task_id}' updated",
+        )
+        return mappers.map_task(current)
+
+    @staticmethod
+    async def update_tasks(
+        items: list[TaskBulkUpdateItem], *, actor_id: str | None = None
+    ) -> list[BulkItemResultDTO[TaskDTO]]:
+        valid = [index for index, item in enumerate(items) if is_optional_object_id(item.assignee_id)]
+        updates = [
+            (items[index].id, TaskService._update_payload(items[index], actor_id=actor_id))
+            for index in valid
+        ]
+        outcomes: list[tuple[dict, dict] | str] = ["Invalid id"] * len(items)
+        for index, outcome in zip(valid, await TaskCollection.bulk_update(updates)):
+            outcomes[index] = outcome
+        changes = [outcome for outcome in outcomes if isinstance(outcome, tuple)]
+        if changes:
+            await CounterService.tasks_changed(changes)
+            await event_bus.publish(*(event_bus.change("task", *change) for change in changes))
+            await ActivityService.log_many(
+                [
+                    ActivityService.entry(
+                        project_id=str(current["project_id"]),
+                        task_id=str(current["_id"]),
+                        actor_id=actor_id,
+                        action=ActivityAction.updated,
+                        detail=f"Task '{current['_id']}' updated",
+                    )
+                    for _, current in changes
+                ]
             )
-        return updated
+        return [
+            BulkItemResultDTO[TaskDTO](index=index, id=item.id, error=outcome)
+            if isinstance(outcome, str)
+            else BulkItemResultDTO[TaskDTO](index=index, id=item.id, data=mappers.map_task(outcome[1]))
+            for index, (item, outcome) in enumerate(zip(items, outcomes))
+        ]
 
     @staticmethod
     async def delete_task(task_id: str) -> bool:
-        deleted = await TaskCollection.delete(task_id)
-        if deleted:
+        removed = await TaskCollection.delete(task_id)
+        deleted = removed is not None
+        if removed is not None:
+            await CounterService.task_changed(removed, None)
+            await event_bus.publish(event_bus.change("task", removed, None))
             await ActivityService.log(
+                project_id=str(removed["project_id"]),
                 task_id=task_id,
                 actor_id=None,
                 action=ActivityAction.updated,
@@ -85,12 +197,18 @@ class TaskService:
 
     @staticmethod
     async def stats(project_id: str) -> dict:
-        return {
-            "status": await TaskCollection.stats_by_status(project_id),
-            "priority": await TaskCollection.stats_by_priority(project_id),
-        }
+        return await CounterService.task_distribution(project_id)
 
     @staticmethod
-    async def calendar(start: datetime, end: datetime) -> list[TaskDTO]:
-        documents = await TaskCollection.find_for_calendar(start, end)
-        return [mappers.map_task(doc) for doc in documents]
+    async def calendar(
+        start: datetime,
+        end: datetime,
+        *,
+        limit: int = 1000,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> tuple[list[TaskDTO | BaseModel], str | None]:
+        documents, next_cursor = await TaskCollection.find_for_calendar(
+            start, end, limit=limit, cursor=cursor, fields=fields
+        )
+        return [mappers.map_task(doc, fields) for doc in documents], next_cursor
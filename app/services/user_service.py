@@ -1,6 +1,8 @@
 from bson import ObjectId
 
 from app.collections.user_collection import UserCollection
+from app.core.settings import settings
+from app.db.event_bus import event_bus
 from app.documents.user_document import UserDocument
 from app.requests.user_request import (
     UserCreateRequest,
@@ -10,7 +12,16 @@ from app.requests.user_request import (
 from app.schemas.enums import UserRole
 from app.schemas.models import UserDTO
 from app.services import mappers
-from app.utils.security import hash_password, verify_password
+from app.utils.cache import TTLCache
+from app.utils.security import hash_password_async, verify_password_async
+
+_principal_cache: TTLCache[str, UserDTO] = TTLCache(
+    "principals",
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+# User writes, including the ones handled by other workers, evict the cached principal.
+event_bus.subscribe("user", lambda event: _principal_cache.invalidate(str(event["entity_id"])))
 
 
 class UserService:
@@ -28,51 +39,65 @@ class UserService:
             avatar_url=request.avatar_url,
             department=None,
             timezone=request.timezone,
-            password_hash=hash_password(request.password),
+            password_hash=await hash_password_async(request.password),
             created_by=actor_id,
             updated_by=actor_id,
         )
-        inserted_id = await UserCollection.insert(document)
-        created = await UserCollection.find_by_id(str(inserted_id))
-        if not created:
-            raise RuntimeError("Failed to load user after creation")
+        created = await UserCollection.insert(document)
         return mappers.map_user(created)
 
     @staticmethod
-    async def list_users(*, department_id: str | None = None) -> list[UserDTO]:
-        documents = await UserCollection.find_many(department_id=department_id)
-        return [mappers.map_user(doc) for doc in documents]
+    async def list_users(
+        *, department_id: str | None = None, limit: int = 1000, cursor: str | None = None
+    ) -> tuple[list[UserDTO], str | None]:
+        documents, next_cursor = await UserCollection.find_many(
+            department_id=department_id, limit=limit, cursor=cursor
+        )
+        return [mappers.map_user(doc) for doc in documents], next_cursor
 
     @staticmethod
     async def get_user(user_id: str) -> UserDTO | None:
         document = await UserCollection.find_by_id(user_id)
         return mappers.map_user(document) if document else None
 
+    @staticmethod
+    async def get_principal(user_id: str) -> UserDTO | None:
+        """Resolve the authenticated user, served from the principal cache when possible."""
+        cached = _principal_cache.get(user_id)
+        if cached is not None:
+            return cached
+        user = await UserService.get_user(user_id)
+        if user:
+            _principal_cache.set(user_id, user)
+        return user
+
     @staticmethod
     async def update_user(
         user_id: str, request: UserUpdateRequest, *, actor_id: str | None = None
-    ) -> bool:
+    ) -> UserDTO | None:
         payload = request.model_dump(exclude_none=True)
         if actor_id:
             payload["updated_by"] = actor_id
-        return await UserCollection.update(user_id, payload)
+        document = await UserCollection.update(user_id, payload)
+        return mappers.map_user(document) if document else None
 
     @staticmethod
     async def update_password(user_id: str, request: UserPasswordUpdateRequest) -> bool:
-        password_hash = hash_password(request.password)
-        return await UserCollection.update(user_id, {"password_hash": password_hash})
+        password_hash = await hash_password_async(request.password)
+        document = await UserCollection.update(user_id, {"password_hash": password_hash})
+        return document is not None
 
     @staticmethod
     async def delete_user(user_id: str) -> bool:
-        return await UserCollection.delete(user_id)
+        deleted = await UserCollection.delete(user_id)
+        return deleted
 
     @staticmethod
     async def authenticate(login_id: str, password: str) -> UserDTO | None:
-        raw_user = await UserCollection.find_raw_by_login_id(login_id)
-        if not raw_user:
+        document = await UserCollection.find_by_login_id(login_id)
+        if not document:
             return None
-        password_hash = raw_user.get("password_hash")
-        if not password_hash or not verify_password(password, password_hash):
+        password_hash = document.get("password_hash")
+        if not password_hash or not await verify_password_async(password, password_hash):
             return None
-        sanitized = await UserCollection.find_by_id(str(raw_user["_id"]))
-        return mappers.map_user(sanitized) if sanitized else None
+        return mappers.map_user(document)
@@ -0,0 +1,148 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, Literal, TypeVar
+
+TItem = TypeVar("TItem")
+
+OverflowPolicy = Literal["block", "drop", "sync"]
+
+logger = logging.getLogger(__name__)
+
+
+class BatchWriter(Generic[TItem]):
+    """Bounded in-memory queue flushed in the background in batches.
+
+    Items are written with ``write_many`` once ``batch_size`` items are queued or
+    ``flush_interval_seconds`` has passed since the first one. When the queue is
+    full, ``overflow`` decides what ``submit`` does: ``block`` waits for room,
+    ``drop`` discards the item and ``sync`` writes it inline with ``write_one``.
+    Until ``start`` is called (scripts, tests) items are written inline, and
+    ``submit_many`` then writes its whole list with one ``write_many``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        write_many: Callable[[list[TItem]], Awaitable[object]],
+        write_one: Callable[[TItem], Awaitable[object]],
+        *,
+        max_size: int,
+        batch_size: int,
+        flush_interval_seconds: float,
+        overflow: OverflowPolicy = "block",
+    ) -> None:
+        self.name = name
+        self._write_many = write_many
+        self._write_one = write_one
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_seconds
+        self._overflow = overflow
+        self._queue: asyncio.Queue[TItem] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+        self._listeners: list[Callable[[], None]] = []
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._stopping
+
+    def add_flush_listener(self, listener: Callable[[], None]) -> None:
+        self._listeners.append(listener)
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stopping = False
+        self._queue = asyncio.Queue(maxsize=self._max_size)
+        self._task = asyncio.create_task(self._run(), name=f"batch-writer:{self.name}")
+
+    async def stop(self) -> None:
+        """Stop accepting queued items and wait until everything queued is written."""
+        if self._task is None:
+            return
+        self._stopping = True
+        await self._task
+        self._task = None
+        self._queue = None
+
+    async def submit(self, item: TItem) -> None:
+        if not self.running or self._queue is None:
+            await self._write_one(item)
+            return
+        if self._overflow == "block":
+            await self._queue.put(item)
+            return
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if self._overflow == "drop":
+                self.dropped += 1
+                if self.dropped == 1 or self.dropped % 1000 == 0:
+                    logger.warning("%s queue is full, %d item(s) dropped so far", self.name, self.dropped)
+            else:
+                await self._write_one(item)
+
+    async def submit_many(self, items: list[TItem]) -> None:
+        if not items:
+            return
+        if not self.running:
+            await self._write_many(items)
+            return
+        for item in items:
+            await self.submit(item)
+
+    def stats(self) -> dict[str, int | str]:
+        return {
+            "name": self.name,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_size": self._max_size,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        while True:
+            batch = await self._next_batch(self._queue)
+            if batch:
+                await self._flush(batch)
+            elif self._stopping and self._queue.empty():
+                return
+
+    async def _next_batch(self, queue: asyncio.Queue[TItem]) -> list[TItem]:
+        if self._stopping:
+            batch: list[TItem] = []
+            while not queue.empty() and len(batch) < self._batch_size:
+                batch.append(queue.get_nowait())
+            return batch
+        try:
+            batch = [await asyncio.wait_for(queue.get(), self._flush_interval)]
+        except asyncio.TimeoutError:
+            return []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval
+        while len(batch) < self._batch_size and not self._stopping:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _flush(self, batch: list[TItem]) -> None:
+        try:
+            await self._write_many(batch)
+        except Exception:
+            self.failed += len(batch)
+            logger.exception("%s failed to write %d item(s)", self.name, len(batch))
+            return
+        self.written += len(batch)
+        for listener in self._listeners:
+            listener()
@@ -0,0 +1,135 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+TKey = TypeVar("TKey", bound=Hashable)
+TValue = TypeVar("TValue")
+
+_registry: dict[str, "TTLCache[Any, Any] | VersionedValueCache[Any]"] = {}
+
+
+class TTLCache(Generic[TKey, TValue]):
+    """Bounded in-process LRU cache whose entries expire after ``ttl_seconds``."""
+
+    def __init__(self, name: str, *, max_size: int, ttl_seconds: float) -> None:
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[TKey, tuple[float, TValue]] = OrderedDict()
+        _registry[name] = self
+
+    def get(self, key: TKey) -> TValue | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: TKey, value: TValue) -> None:
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: TKey) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class VersionedValueCache(Generic[TValue]):
+    """Single cached value tagged with a version and bounded by ``max_age_seconds``.
+
+    ``invalidate`` bumps the version so the next read recomputes; concurrent
+    misses for the same version share one in-flight computation.
+    """
+
+    def __init__(self, name: str, *, max_age_seconds: float) -> None:
+        self.name = name
+        self.max_age_seconds = max_age_seconds
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._value: TValue | None = None
+        self._value_version = -1
+        self._expires_at = 0.0
+        self._pending: asyncio.Future[TValue] | None = None
+        self._pending_version = -1
+        _registry[name] = self
+
+    async def get_or_compute(self, factory: Callable[[], Awaitable[TValue]]) -> TValue:
+        if (
+            self._value is not None
+            and self._value_version == self.version
+            and self._expires_at > time.monotonic()
+        ):
+            self.hits += 1
+            return self._value
+        self.misses += 1
+        if self._pending is not None and self._pending_version == self.version:
+            self.coalesced += 1
+        else:
+            self._pending = asyncio.ensure_future(self._compute(factory, self.version))
+            self._pending_version = self.version
+        return await asyncio.shield(self._pending)
+
+    async def _compute(self, factory: Callable[[], Awaitable[TValue]], version: int) -> TValue:
+        try:
+            value = await factory()
+            if version == self.version and self.max_age_seconds > 0:
+                self._value = value
+                self._value_version = version
+                self._expires_at = time.monotonic() + self.max_age_seconds
+            return value
+        finally:
+            if self._pending_version == version:
+                self._pending = None
+                self._pending_version = -1
+
+    def invalidate(self) -> None:
+        self.version += 1
+        self._value = None
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "version": self.version,
+            "cached": self._value is not None,
+            "max_age_seconds": self.max_age_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def cache_stats() -> dict[str, dict[str, Any]]:
+    return {name: cache.stats() for name, cache in _registry.items()}
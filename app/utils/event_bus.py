@@ -0,0 +1,267 @@
+import asyncio
+import inspect
+import logging
+import uuid
+from dataclasses import asdict
+from typing import Any, Awaitable, Callable, Iterable, Protocol
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import CursorType
+from pymongo.errors import CollectionInvalid
+
+from app.documents.entity_event_document import EntityEventDocument
+from app.utils.batch_writer import BatchWriter
+
+Event = dict[str, Any]
+EventHandler = Callable[[Event], Awaitable[None] | None]
+
+logger = logging.getLogger(__name__)
+
+
+class EventTransport(Protocol):
+    """Carries events between processes; local subscribers are served by :class:`EventBus` itself."""
+
+    async def start(self, deliver: Callable[[Event], Awaitable[None]], origin: str) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def publish(self, events: list[Event]) -> None: ...
+
+    def stats(self) -> dict[str, Any]: ...
+
+
+class MemoryTransport:
+    """Single-process transport: events only reach the publishing process."""
+
+    async def start(self, deliver: Callable[[Event], Awaitable[None]], origin: str) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    async def publish(self, events: list[Event]) -> None:
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        return {"transport": "memory"}
+
+
+class MongoCappedTransport:
+    """Shares events through a capped collection that every process tails.
+
+    Writes are batched through a :class:`BatchWriter`. Each process skips the
+    events it published itself, since those were already delivered locally.
+    """
+
+    _INIT_OP = "init"
+
+    def __init__(
+        self,
+        collection: AsyncIOMotorCollection,
+        *,
+        size_bytes: int,
+        flush_interval_seconds: float,
+        retry_seconds: float = 1.0,
+    ) -> None:
+        self._collection = collection
+        self._size_bytes = size_bytes
+        self._retry_seconds = retry_seconds
+        self._writer: BatchWriter[Event] = BatchWriter(
+            f"event-bus:{collection.name}",
+            self._insert_many,
+            self._insert_one,
+            max_size=10000,
+            batch_size=200,
+            flush_interval_seconds=flush_interval_seconds,
+            overflow="sync",
+        )
+        self._deliver: Callable[[Event], Awaitable[None]] | None = None
+        self._origin = ""
+        self._task: asyncio.Task[None] | None = None
+        self._ready = False
+        self.received = 0
+        self.reconnects = 0
+
+    async def _insert_many(self, events: list[Event]) -> None:
+        await self._collection.insert_many(events, ordered=False)
+
+    async def _insert_one(self, event: Event) -> None:
+        await self._collection.insert_one(event)
+
+    async def ensure_collection(self) -> None:
+        database = self._collection.database
+        if not await database.list_collection_names(filter={"name": self._collection.name}):
+            try:
+                await database.create_collection(
+                    self._collection.name, capped=True, size=self._size_bytes
+                )
+            except CollectionInvalid:
+                pass
+        # A tailable cursor on an empty capped collection dies immediately.
+        if await self._collection.estimated_document_count() == 0:
+            await self._collection.insert_one({"op": self._INIT_OP, "origin": ""})
+        self._ready = True
+
+    async def start(self, deliver: Callable[[Event], Awaitable[None]], origin: str) -> None:
+        if self._task is not None:
+            return
+        await self.ensure_collection()
+        self._deliver = deliver
+        self._origin = origin
+        self._writer.start()
+        self._task = asyncio.create_task(self._tail(), name=f"event-bus-tail:{self._collection.name}")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._writer.stop()
+
+    async def publish(self, events: list[Event]) -> None:
+        # Scripts publish without ``start``; the first insert must not create an uncapped collection.
+        if not self._ready:
+            await self.ensure_collection()
+        await self._writer.submit_many(events)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "transport": "mongo",
+            "collection": self._collection.name,
+            "received": self.received,
+            "reconnects": self.reconnects,
+            "writer": self._writer.stats(),
+        }
+
+    async def _tail(self) -> None:
+        newest = await self._collection.find_one({}, sort=[("$natural", -1)])
+        last = newest["_id"] if newest else None
+        while True:
+            try:
+                last = await self._follow(last)
+            except Exception:
+                logger.exception("tailing %s failed", self._collection.name)
+            self.reconnects += 1
+            await asyncio.sleep(self._retry_seconds)
+
+    async def _follow(self, last: ObjectId | None) -> ObjectId | None:
+        """Deliver events written after ``last`` until the cursor dies; return the last one seen."""
+        assert self._deliver is not None
+        cursor = self._collection.find(cursor_type=CursorType.TAILABLE_AWAIT)
+        caught_up = last is None
+        while cursor.alive:
+            async for event in cursor:
+                if not caught_up:
+                    caught_up = event["_id"] == last
+                    continue
+                last = event["_id"]
+                if event.get("op") == self._INIT_OP or event.get("origin") == self._origin:
+                    continue
+                self.received += 1
+                await self._deliver(event)
+            # The first pass over the collection ended without meeting ``last``:
+            # it was overwritten while disconnected, so continue from here.
+            caught_up = True
+        return last
+
+
+class EventBus:
+    """Publishes entity-changed events to in-process handlers and, via the transport, to other processes.
+
+    Handlers run inline on the publishing process before ``publish`` returns,
+    so caches are invalidated before the write's response is sent.
+    """
+
+    def __init__(self, transport: EventTransport) -> None:
+        self.origin = uuid.uuid4().hex
+        self._transport = transport
+        self._handlers: dict[str, list[EventHandler]] = {}
+        self.published = 0
+        self.failed = 0
+
+    def subscribe(self, entities: str | Iterable[str], handler: EventHandler) -> None:
+        for entity in [entities] if isinstance(entities, str) else entities:
+            self._handlers.setdefault(entity, []).append(handler)
+
+    def event(
+        self,
+        entity: str,
+        op: str,
+        entity_id: ObjectId,
+        *,
+        document: dict[str, Any] | None = None,
+        changed: list[str] | None = None,
+    ) -> Event:
+        return asdict(
+            EntityEventDocument(
+                origin=self.origin,
+                entity=entity,
+                op=op,
+                entity_id=entity_id,
+                document=document,
+                changed=changed,
+            )
+        )
+
+    def change(
+        self,
+        entity: str,
+        previous: dict[str, Any] | None,
+        current: dict[str, Any] | None,
+        *,
+        with_document: bool = True,
+    ) -> Event:
+        """Build the ``created``/``updated``/``deleted`` event for a pre/post-image pair."""
+        if previous is None:
+            assert current is not None
+            return self.event(
+                entity, "created", current["_id"], document=current if with_document else None
+            )
+        if current is None:
+            return self.event(
+                entity, "deleted", previous["_id"], document=previous if with_document else None
+            )
+        changed = sorted(key for key, value in current.items() if previous.get(key) != value)
+        return self.event(
+            entity,
+            "updated",
+            current["_id"],
+            document=current if with_document else None,
+            changed=changed,
+        )
+
+    async def publish(self, *events: Event) -> None:
+        if not events:
+            return
+        self.published += len(events)
+        for event in events:
+            await self._deliver(event)
+        await self._transport.publish(list(events))
+
+    async def start(self) -> None:
+        await self._transport.start(self._deliver, self.origin)
+
+    async def stop(self) -> None:
+        await self._transport.stop()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "origin": self.origin,
+            "published": self.published,
+            "failed": self.failed,
+            **self._transport.stats(),
+        }
+
+    async def _deliver(self, event: Event) -> None:
+        for handler in self._handlers.get(event.get("entity", ""), ()):
+            try:
+                result = handler(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                self.failed += 1
+                logger.exception("%s handler failed for %s event", event.get("entity"), event.get("op"))
@@ -1,7 +1,10 @@
-﻿import dataclasses
-from typing import Any, TypeVar
+﻿import asyncio
+import dataclasses
+from typing import Any, Iterable, TypeVar
 
 from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import BulkWriteError, OperationFailure
 
 TDocument = TypeVar("TDocument")
 
@@ -14,6 +17,138 @@ def to_object_id(value: str | ObjectId | None) -> ObjectId | None:
     return ObjectId(value)
 
 
+def is_optional_object_id(value: str | None) -> bool:
+    """``True`` for an empty value or a valid ObjectId string."""
+    return not value or ObjectId.is_valid(value)
+
+
+def to_projection(
+    fields: Iterable[str] | None, *, include: Iterable[str] = ()
+) -> dict[str, int] | None:
+    """Build a Mongo projection for DTO ``fields`` plus any ``include`` keys (e.g. sort keys)."""
+    if not fields:
+        return None
+    projection = {"_id" if field == "id" else field: 1 for field in fields}
+    projection.update({field: 1 for field in include})
+    return projection
+
+
+async def drop_indexes(collection: AsyncIOMotorCollection, names: Iterable[str]) -> None:
+    """Drop superseded indexes by name, ignoring the ones that do not exist."""
+    for name in names:
+        try:
+            await collection.drop_index(name)
+        except OperationFailure:
+            pass
+
+
+async def ensure_ttl_index(
+    collection: AsyncIOMotorCollection, field: str, expire_after_seconds: int | None
+) -> None:
+    """Keep a TTL index on ``field`` matching ``expire_after_seconds`` (``None`` removes it).
+
+    TTL indexes are single-field, so the index is rebuilt when the expiry changes.
+    """
+    name = f"{field}_1"
+    current = (await collection.index_information()).get(name)
+    if current is not None and current.get("expireAfterSeconds") != expire_after_seconds:
+        await drop_indexes(collection, [name])
+        current = None
+    if current is None and expire_after_seconds is not None:
+        await collection.create_index(field, name=name, expireAfterSeconds=expire_after_seconds)
+
+
+def rank_expression(field: str, ranks: dict[Any, int]) -> dict[str, Any]:
+    """Aggregation expression mapping the enum stored in ``field`` to its numeric rank."""
+    return {
+        "$switch": {
+            "branches": [
+                {"case": {"$eq": [f"${field}", getattr(key, "value", key)]}, "then": rank}
+                for key, rank in ranks.items()
+            ],
+            "default": 0,
+        }
+    }
+
+
+async def count_tags(collection: AsyncIOMotorCollection, query: dict[str, Any]) -> dict[str, int]:
+    """Count the documents matching ``query`` per tag.
+
+    ``tags > ""`` keeps untagged documents out through the multikey index
+    bounds, so callers only need an index whose scope keys precede ``tags``.
+    """
+    pipeline = [
+        {"$match": {**query, "tags": {"$gt": ""}}},
+        # A tag repeated on one document still counts that document once.
+        {"$project": {"_id": 0, "tags": {"$setUnion": ["$tags", []]}}},
+        {"$unwind": "$tags"},
+        {"$group": {"_id": "$tags", "count": {"$sum": 1}}},
+    ]
+    return {item["_id"]: item["count"] async for item in collection.aggregate(pipeline)}
+
+
+async def bulk_write_errors(
+    collection: AsyncIOMotorCollection, operations: list[Any]
+) -> dict[int, str]:
+    """Run ``operations`` unordered and return ``{operation index: error message}`` for failures."""
+    if not operations:
+        return {}
+    try:
+        await collection.bulk_write(operations, ordered=False)
+    except BulkWriteError as exc:
+        return {
+            error["index"]: error.get("errmsg", "Write failed")
+            for error in exc.details.get("writeErrors", [])
+        }
+    return {}
+
+
+async def bulk_set_by_id(
+    collection: AsyncIOMotorCollection, updates: list[tuple[str, dict[str, Any]]]
+) -> list[tuple[dict[str, Any], dict[str, Any]] | str]:
+    """Apply each ``(id, $set payload)`` and return ``(pre-image, post-image)`` or an error per item.
+
+    The pre-images come from a single ``$in`` read, and each write only matches
+    while ``updated_at`` still equals its pre-image's, so a returned pair is
+    exactly the transition that was applied. An item written by someone else in
+    between is left untouched and reported as a conflict to retry; this relies
+    on every writer bumping ``updated_at``. Repeats of an id are rejected.
+    """
+    results: list[tuple[dict[str, Any], dict[str, Any]] | str] = ["Invalid id"] * len(updates)
+    targets: dict[ObjectId, tuple[int, dict[str, Any]]] = {}
+    for index, (raw_id, data) in enumerate(updates):
+        if not ObjectId.is_valid(raw_id):
+            continue
+        object_id = ObjectId(raw_id)
+        if object_id in targets:
+            results[index] = "Duplicate id"
+            continue
+        targets[object_id] = (index, data)
+    previous = {
+        document["_id"]: document
+        async for document in collection.find({"_id": {"$in": list(targets)}})
+    }
+
+    async def apply(object_id: ObjectId, data: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]] | str:
+        before = previous.get(object_id)
+        if before is None:
+            return "Not found"
+        try:
+            result = await collection.update_one(
+                {"_id": object_id, "updated_at": before.get("updated_at")}, {"$set": data}
+            )
+        except OperationFailure as exc:
+            return (exc.details or {}).get("errmsg", "Write failed")
+        if result.matched_count == 0:
+            return "Modified concurrently; retry"
+        return before, {**before, **data}
+
+    outcomes = await asyncio.gather(*(apply(object_id, data) for object_id, (_, data) in targets.items()))
+    for (index, _), outcome in zip(targets.values(), outcomes):
+        results[index] = outcome
+    return results
+
+
 def document_asdict(document: Any) -> dict[str, Any]:
     data = dataclasses.asdict(document)
     data["_id"] = document._id
@@ -0,0 +1,104 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Any
+
+from bson import json_util
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+SortSpec = list[tuple[str, int]]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded for the requested sort order."""
+
+
+def encode_position(values: list[Any]) -> str:
+    raw = json_util.dumps(values).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def encode_cursor(document: dict[str, Any], sort: SortSpec) -> str:
+    return encode_position([document.get(field) for field, _ in sort])
+
+
+def decode_cursor(token: str, sort: SortSpec) -> list[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json_util.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+    if not isinstance(values, list) or len(values) != len(sort):
+        raise InvalidCursorError("Cursor does not match this listing")
+    return values
+
+
+def _after(direction: int, value: Any) -> dict[str, Any] | None:
+    # Nulls sort before every other value, so they are the first ascending
+    # key and the last descending one.
+    if direction == 1:
+        return {"$ne": None} if value is None else {"$gt": value}
+    if value is None:
+        return None
+    return {"$lt": value}
+
+
+def keyset_filter(sort: SortSpec, values: list[Any]) -> dict[str, Any]:
+    """Build the filter selecting documents strictly after ``values`` in ``sort`` order."""
+    branches: list[dict[str, Any]] = []
+    for index, (field, direction) in enumerate(sort):
+        after = _after(direction, values[index])
+        if after is None:
+            continue
+        branch = {prefix: values[position] for position, (prefix, _) in enumerate(sort[:index])}
+        if direction == -1:
+            branch["$or"] = [{field: after}, {field: None}]
+        else:
+            branch[field] = after
+        branches.append(branch)
+    return {"$or": branches} if branches else {"_id": {"$exists": False}}
+
+
+async def find_page(
+    collection: AsyncIOMotorCollection,
+    query: dict[str, Any],
+    sort: SortSpec,
+    *,
+    limit: int,
+    cursor: str | None = None,
+    projection: dict[str, Any] | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Return one page of raw documents plus the cursor of the next page, if any.
+
+    ``sort`` must end with ``_id`` so every position is unique.
+    """
+    if cursor:
+        query = {"$and": [query, keyset_filter(sort, decode_cursor(cursor, sort))]}
+    items = (
+        await collection.find(query, projection)
+        .sort(sort)
+        .limit(limit + 1)
+        .to_list(length=limit + 1)
+    )
+    if len(items) <= limit:
+        return items, None
+    page = items[:limit]
+    return page, encode_cursor(page[-1], sort)
+
+
+async def find_changed(
+    collection: AsyncIOMotorCollection,
+    sort: SortSpec,
+    *,
+    after: list[Any] | None,
+    until: datetime,
+    limit: int,
+) -> list[dict[str, Any]]:
+    """Return up to ``limit`` documents after position ``after`` whose first sort key is at most ``until``.
+
+    Used for change feeds: ``sort`` is a timestamp followed by ``_id``.
+    """
+    query: dict[str, Any] = {sort[0][0]: {"$lte": until}}
+    if after is not None:
+        query = {"$and": [query, keyset_filter(sort, after)]}
+    return await collection.find(query).sort(sort).limit(limit).to_list(length=limit)
@@ -0,0 +1,103 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Generic, TypeVar
+
+TMessage = TypeVar("TMessage")
+
+logger = logging.getLogger(__name__)
+
+_CLOSED = object()
+
+
+class Subscription(Generic[TMessage]):
+    """One subscriber's bounded inbox on a :class:`PubSub` topic."""
+
+    def __init__(self, topic: str, max_size: int) -> None:
+        self.topic = topic
+        self.evicted = False
+        self._queue: asyncio.Queue[object] = asyncio.Queue(maxsize=max_size)
+
+    def _offer(self, message: TMessage) -> bool:
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def _evict(self) -> None:
+        # Free the backlog straight away and leave only the close marker behind.
+        self.evicted = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(_CLOSED)
+
+    async def messages(self, *, idle_timeout: float) -> AsyncIterator[TMessage | None]:
+        """Yield messages as they arrive, ``None`` after ``idle_timeout`` quiet seconds, until evicted."""
+        while True:
+            try:
+                message = await asyncio.wait_for(self._queue.get(), idle_timeout)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if message is _CLOSED:
+                return
+            yield message  # type: ignore[misc]
+
+
+class PubSub(Generic[TMessage]):
+    """In-process fan-out of messages to the subscribers of a topic.
+
+    ``publish`` never waits: a subscriber whose inbox already holds
+    ``queue_size`` messages is evicted, so a stalled consumer costs at most one
+    full inbox of memory and never slows the publisher down.
+    """
+
+    def __init__(self, name: str, *, queue_size: int) -> None:
+        self.name = name
+        self._queue_size = queue_size
+        self._topics: dict[str, set[Subscription[TMessage]]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.evicted = 0
+
+    def subscribe(self, topic: str) -> Subscription[TMessage]:
+        subscription: Subscription[TMessage] = Subscription(topic, self._queue_size)
+        self._topics.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription[TMessage]) -> None:
+        subscribers = self._topics.get(subscription.topic)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._topics[subscription.topic]
+
+    def has_subscribers(self, topic: str | None = None) -> bool:
+        return bool(self._topics) if topic is None else topic in self._topics
+
+    def publish(self, topic: str, message: TMessage) -> int:
+        """Deliver ``message`` to every subscriber of ``topic``; return how many received it."""
+        self.published += 1
+        delivered = 0
+        for subscription in list(self._topics.get(topic, ())):
+            if subscription._offer(message):
+                delivered += 1
+                continue
+            subscription._evict()
+            self.unsubscribe(subscription)
+            self.evicted += 1
+            logger.warning("%s evicted a slow subscriber of %s", self.name, topic)
+        self.delivered += delivered
+        return delivered
+
+    def stats(self) -> dict[str, int | str]:
+        return {
+            "name": self.name,
+            "topics": len(self._topics),
+            "subscribers": sum(len(subscribers) for subscribers in self._topics.values()),
+            "queue_size": self._queue_size,
+            "published": self.published,
+            "delivered": self.delivered,
+            "evicted": self.evicted,
+        }
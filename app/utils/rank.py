@@ -0,0 +1,65 @@
+"""Lexicographic rank keys for user-ordered lists.
+
+A rank is a base-62 fraction written without its leading ``0.``, so plain string
+comparison orders items and a key can always be generated between two others.
+Keys never end with ``0``, which keeps room below every key.
+"""
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_BASE = len(DIGITS)
+_ZERO = DIGITS[0]
+
+
+def _midpoint(low: str, high: str | None) -> str:
+    if high is not None:
+        shared = 0
+        while shared < len(high) and (low[shared] if shared < len(low) else _ZERO) == high[shared]:
+            shared += 1
+        if shared:
+            return high[:shared] + _midpoint(low[shared:], high[shared:])
+    low_digit = DIGITS.index(low[0]) if low else 0
+    high_digit = DIGITS.index(high[0]) if high is not None else _BASE
+    if high_digit - low_digit > 1:
+        return DIGITS[(low_digit + high_digit + 1) // 2]
+    if high is not None and len(high) > 1:
+        return high[0]
+    return DIGITS[low_digit] + _midpoint(low[1:], None)
+
+
+def rank_between(before: str | None, after: str | None) -> str:
+    """Return a rank sorting strictly between ``before`` and ``after`` (``None`` is open-ended).
+
+    Appending and prepending step a single digit instead of halving the gap, so
+    keys built by repeated appends grow by one character every ~30 items.
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"Rank {before!r} does not sort before {after!r}")
+    if before is not None and after is None:
+        for index, char in enumerate(before):
+            digit = DIGITS.index(char)
+            if digit < _BASE - 1:
+                return before[:index] + DIGITS[digit + 1]
+        return before + DIGITS[_BASE // 2]
+    if after is not None and before is None:
+        for index, char in enumerate(after):
+            digit = DIGITS.index(char)
+            if digit > 1:
+                return after[:index] + DIGITS[digit - 1]
+    return _midpoint(before or "", after)
+
+
+def spread_ranks(count: int) -> list[str]:
+    """Return ``count`` short, evenly spaced ranks, leaving room around each one."""
+    width = 1
+    while _BASE**width < (count + 1) * _BASE:
+        width += 1
+    span = _BASE**width
+    ranks = []
+    for position in range(1, count + 1):
+        value = position * span // (count + 1)
+        digits = []
+        for _ in range(width):
+            value, remainder = divmod(value, _BASE)
+            digits.append(DIGITS[remainder])
+        ranks.append("".join(reversed(digits)).rstrip(_ZERO))
+    return ranks
@@ -1,14 +1,25 @@
+import asyncio
 import base64
 import hashlib
 import hmac
 import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 import jwt
 
 from app.core.settings import settings
 
+TResult = TypeVar("TResult")
+
+_hash_executor: Executor | None = None
+_hash_slots: asyncio.Semaphore | None = None
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """Raised when a hashing job waits longer than the configured queue timeout."""
+
 
 def _pbkdf2(password: str, salt: bytes, iterations: int = 390000) -> bytes:
     return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
@@ -31,6 +42,59 @@ def verify_password(password: str, encoded: str) -> bool:
     return hmac.compare_digest(candidate, digest)
 
 
+def _get_hash_executor() -> Executor:
+    global _hash_executor
+    if _hash_executor is None:
+        workers = max(settings.PASSWORD_HASH_WORKERS, 1)
+        if settings.PASSWORD_HASH_EXECUTOR == "process":
+            _hash_executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            _hash_executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="password-hash"
+            )
+    return _hash_executor
+
+
+def _get_hash_slots() -> asyncio.Semaphore:
+    global _hash_slots
+    if _hash_slots is None:
+        _hash_slots = asyncio.Semaphore(max(settings.PASSWORD_HASH_WORKERS, 1))
+    return _hash_slots
+
+
+async def _run_in_hash_pool(func: Callable[..., TResult], *args: Any) -> TResult:
+    slots = _get_hash_slots()
+    try:
+        await asyncio.wait_for(
+            slots.acquire(), timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError as exc:
+        raise PasswordHasherBusyError("Password hashing queue is full") from exc
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_hash_executor(), func, *args)
+    finally:
+        slots.release()
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash ``password`` in the worker pool so the event loop stays responsive."""
+    return await _run_in_hash_pool(hash_password, password)
+
+
+async def verify_password_async(password: str, encoded: str) -> bool:
+    """Verify ``password`` in the worker pool so the event loop stays responsive."""
+    return await _run_in_hash_pool(verify_password, password, encoded)
+
+
+def shutdown_password_hasher() -> None:
+    global _hash_executor, _hash_slots
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+    _hash_executor = None
+    _hash_slots = None
+
+
 def create_access_token(
     subject: str,
     *,
@@ -0,0 +1,68 @@
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import TEXT
+
+from app.utils.pagination import SortSpec
+
+# Hits from several collections are merged on this order; ``kind`` breaks score
+# ties between collections so the merged cursor stays stable.
+SEARCH_SORT: SortSpec = [("score", -1), ("kind", 1), ("_id", 1)]
+TEXT_INDEX = "search_text"
+
+
+async def create_text_index(collection: AsyncIOMotorCollection, weights: dict[str, int]) -> None:
+    """Create the collection's single weighted text index.
+
+    ``default_language="none"`` skips English stemming and stop words, which
+    would otherwise mangle Korean and mixed-language titles.
+    """
+    await collection.create_index(
+        [(field, TEXT) for field in weights],
+        name=TEXT_INDEX,
+        weights=weights,
+        default_language="none",
+    )
+
+
+def _after(kind: int, position: list[Any] | None) -> dict[str, Any] | None:
+    if position is None:
+        return None
+    score, last_kind, last_id = position
+    if kind < last_kind:
+        return {"score": {"$lt": score}}
+    if kind > last_kind:
+        return {"score": {"$lte": score}}
+    return {"$or": [{"score": {"$lt": score}}, {"score": score, "_id": {"$gt": last_id}}]}
+
+
+async def search_page(
+    collection: AsyncIOMotorCollection,
+    kind: int,
+    text: str,
+    *,
+    match: dict[str, Any] | None = None,
+    stages: list[dict[str, Any]] | None = None,
+    after: list[Any] | None = None,
+    limit: int,
+    projection: dict[str, int],
+) -> list[dict[str, Any]]:
+    """Return up to ``limit`` text matches after ``after`` in :data:`SEARCH_SORT` order.
+
+    ``match`` is combined with the ``$text`` stage; ``stages`` run right after it
+    for filters that need other collections.
+    """
+    pipeline: list[dict[str, Any]] = [
+        {"$match": {"$text": {"$search": text}, **(match or {})}},
+        *(stages or []),
+        {"$addFields": {"score": {"$meta": "textScore"}, "kind": kind}},
+    ]
+    keyset = _after(kind, after)
+    if keyset is not None:
+        pipeline.append({"$match": keyset})
+    pipeline += [
+        {"$sort": {"score": -1, "_id": 1}},
+        {"$limit": limit},
+        {"$project": {**projection, "score": 1, "kind": 1}},
+    ]
+    return await collection.aggregate(pipeline).to_list(length=limit)
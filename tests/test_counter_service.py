@@ -0,0 +1,60 @@
+import os
+import unittest
+from unittest import mock
+
+from bson import ObjectId
+
+os.environ.setdefault("MONGO_DB_URL", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET_KEY", "test")
+
+from app.collections.counter_collection import CounterCollection  # noqa: E402
+from app.collections.department_collection import DepartmentCollection  # noqa: E402
+from app.collections.project_collection import ProjectCollection  # noqa: E402
+from app.services.counter_service import CounterService  # noqa: E402
+
+
+class TaskCountersTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.project_id = ObjectId()
+        self.department_id = ObjectId()
+        self.company_id = ObjectId()
+        project = {"_id": self.project_id, "department_id": self.department_id}
+        department = {"_id": self.department_id, "company_id": self.company_id}
+        self.increment = mock.AsyncMock()
+        for patcher in (
+            mock.patch.object(ProjectCollection, "find_by_id", mock.AsyncMock(return_value=project)),
+            mock.patch.object(DepartmentCollection, "find_by_id", mock.AsyncMock(return_value=department)),
+            mock.patch.object(CounterCollection, "increment", self.increment),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_status_change_moves_company_and_department_counts(self) -> None:
+        task = {"_id": ObjectId(), "project_id": self.project_id, "status": "todo", "priority": "high"}
+        await CounterService.task_changed(task, {**task, "status": "done"})
+        deltas = self.increment.call_args.args[0]
+        scopes = (
+            "global",
+            f"project:{self.project_id}",
+            f"department:{self.department_id}",
+            f"company:{self.company_id}",
+        )
+        for scope in scopes:
+            with self.subTest(scope=scope):
+                self.assertEqual(deltas[("task_status", scope, "todo")], -1)
+                self.assertEqual(deltas[("task_status", scope, "done")], 1)
+
+    async def test_deleted_project_stops_counting_its_tasks(self) -> None:
+        project = {"_id": self.project_id, "department_id": self.department_id, "status": "planned"}
+        with mock.patch.object(
+            CounterCollection, "find", mock.AsyncMock(return_value=[{"key": "todo", "count": 3}])
+        ):
+            await CounterService.project_changed(project, None)
+        deltas = self.increment.call_args.args[0]
+        self.assertEqual(deltas[("task_status", f"department:{self.department_id}", "todo")], -3)
+        self.assertEqual(deltas[("task_status", f"company:{self.company_id}", "todo")], -3)
+        self.assertNotIn(("task_status", f"project:{self.project_id}", "todo"), deltas)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from dataclasses import asdict
+
+from bson import ObjectId
+from pydantic import ValidationError
+
+from app.documents.task_document import TaskDocument
+from app.schemas.models import TaskDTO
+from app.services import mappers
+
+
+class MapTaskTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.raw = asdict(TaskDocument(project_id=ObjectId(), title="Write docs", tags=["docs"]))
+
+    def test_matches_validated_dto(self) -> None:
+        expected = TaskDTO(
+            **{
+                **{key: value for key, value in self.raw.items() if key in TaskDTO.model_fields},
+                "id": str(self.raw["_id"]),
+                "project_id": str(self.raw["project_id"]),
+            }
+        )
+        self.assertEqual(mappers.map_task(self.raw).model_dump(mode="json"), expected.model_dump(mode="json"))
+
+    def test_document_missing_a_required_field_is_rejected(self) -> None:
+        del self.raw["priority"], self.raw["progress"]
+        with self.assertRaises(ValidationError):
+            mappers.map_task(self.raw)
+
+    def test_sparse_fields_only_require_the_selected_fields(self) -> None:
+        del self.raw["priority"]
+        task = mappers.map_task(self.raw, frozenset({"id", "title"}))
+        self.assertEqual(task.model_dump(), {"id": str(self.raw["_id"]), "title": "Write docs"})
+        with self.assertRaises(ValidationError):
+            mappers.map_task(self.raw, frozenset({"id", "priority"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
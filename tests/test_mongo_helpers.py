@@ -0,0 +1,77 @@
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+
+from bson import ObjectId
+
+from app.utils.mongo_helpers import bulk_set_by_id
+
+
+class _FakeCollection:
+    """Just enough of a Motor collection for :func:`bulk_set_by_id`."""
+
+    def __init__(self, documents: list[dict[str, Any]]) -> None:
+        self.documents = {document["_id"]: dict(document) for document in documents}
+        self.on_read = lambda: None
+
+    def find(self, query: dict[str, Any]):
+        ids = query["_id"]["$in"]
+        found = [dict(self.documents[object_id]) for object_id in ids if object_id in self.documents]
+        self.on_read()
+
+        async def iterate():
+            for document in found:
+                yield document
+
+        return iterate()
+
+    async def update_one(self, query: dict[str, Any], update: dict[str, Any]):
+        document = self.documents.get(query["_id"])
+        if document is None or document.get("updated_at") != query["updated_at"]:
+            return SimpleNamespace(matched_count=0)
+        document.update(update["$set"])
+        return SimpleNamespace(matched_count=1)
+
+
+class BulkSetByIdTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.first, self.second = ObjectId(), ObjectId()
+        self.collection = _FakeCollection(
+            [
+                {"_id": self.first, "status": "todo", "updated_at": datetime(2026, 1, 1)},
+                {"_id": self.second, "status": "todo", "updated_at": datetime(2026, 1, 1)},
+            ]
+        )
+
+    async def test_reports_invalid_missing_and_duplicate_ids_per_item(self) -> None:
+        results = await bulk_set_by_id(
+            self.collection,
+            [
+                (str(self.first), {"status": "done"}),
+                ("not-an-id", {"status": "done"}),
+                (str(ObjectId()), {"status": "done"}),
+                (str(self.first), {"status": "review"}),
+            ],
+        )
+        previous, current = results[0]
+        self.assertEqual((previous["status"], current["status"]), ("todo", "done"))
+        self.assertEqual(results[1:], ["Invalid id", "Not found", "Duplicate id"])
+        self.assertEqual(self.collection.documents[self.first]["status"], "done")
+
+    async def test_write_between_read_and_update_is_a_conflict(self) -> None:
+        def concurrent_write() -> None:
+            self.collection.documents[self.second].update(status="blocked", updated_at=datetime(2026, 1, 2))
+
+        self.collection.on_read = concurrent_write
+        results = await bulk_set_by_id(
+            self.collection,
+            [(str(self.first), {"status": "done"}), (str(self.second), {"status": "done"})],
+        )
+        self.assertIsInstance(results[0], tuple)
+        self.assertEqual(results[1], "Modified concurrently; retry")
+        self.assertEqual(self.collection.documents[self.second]["status"], "blocked")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import unittest
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Any
+from unittest import mock
+
+from bson import ObjectId
+
+os.environ.setdefault("MONGO_DB_URL", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET_KEY", "test")
+
+from app.collections.project_collection import ProjectCollection  # noqa: E402
+from app.collections.subtask_collection import SubtaskCollection  # noqa: E402
+from app.collections.task_collection import TaskCollection  # noqa: E402
+from app.collections.tombstone_collection import TombstoneCollection  # noqa: E402
+from app.documents.project_document import ProjectDocument  # noqa: E402
+from app.services.sync_service import SyncExpiredError, SyncService  # noqa: E402
+from app.utils.pagination import encode_position  # noqa: E402
+
+
+def _feed(documents: list[dict[str, Any]], field: str):
+    """In-memory stand-in for ``find_changed`` over ``documents`` sorted by ``(field, _id)``."""
+
+    async def find_changed(*, after: list[Any] | None, until: datetime, limit: int) -> list[dict[str, Any]]:
+        ordered = sorted(documents, key=lambda document: (document[field], document["_id"]))
+        return [
+            document
+            for document in ordered
+            if document[field] <= until
+            and (after is None or (document[field], document["_id"]) > tuple(after))
+        ][:limit]
+
+    return find_changed
+
+
+class SyncServiceTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        # Mongo keeps milliseconds, as do sync tokens.
+        old = (datetime.utcnow() - timedelta(days=90)).replace(microsecond=0)
+        self.projects = [
+            {
+                **asdict(ProjectDocument(title=f"Project {index}", description=None, department_id=ObjectId())),
+                "updated_at": old + timedelta(minutes=index),
+            }
+            for index in range(5)
+        ]
+        self.tombstones: list[dict[str, Any]] = []
+        for collection, documents, field in (
+            (ProjectCollection, self.projects, "updated_at"),
+            (TaskCollection, [], "updated_at"),
+            (SubtaskCollection, [], "updated_at"),
+            (TombstoneCollection, self.tombstones, "deleted_at"),
+        ):
+            patcher = mock.patch.object(collection, "find_changed", _feed(documents, field))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_full_sync_pages_through_documents_older_than_retention(self) -> None:
+        seen: list[str] = []
+        since = None
+        for _ in range(10):
+            page = await SyncService.changes(since, limit=2)
+            seen += [project.id for project in page.projects]
+            since = page.next_since
+            if not page.has_more:
+                break
+        self.assertEqual(seen, [str(project["_id"]) for project in self.projects])
+        # The finished watermark keeps working for the next delta call.
+        page = await SyncService.changes(since, limit=2)
+        self.assertEqual(page.projects, [])
+
+    async def test_watermark_older_than_deletion_history_expires(self) -> None:
+        stale = encode_position([datetime.utcnow() - timedelta(days=365), ObjectId()])
+        with self.assertRaises(SyncExpiredError):
+            await SyncService.changes("~".join([stale] * 4), limit=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import PyMongoError
+
+os.environ.setdefault("MONGO_DB_URL", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET_KEY", "test")
+
+from app.collections.task_collection import TaskCollection  # noqa: E402
+from app.core.settings import settings  # noqa: E402
+from app.documents.task_document import TaskDocument  # noqa: E402
+from app.schemas.enums import TaskStatus  # noqa: E402
+
+
+class DeadlineIndexTest(unittest.IsolatedAsyncioTestCase):
+    """Explains the deadline queries against a scratch ``<MONGO_DB_NAME>_test`` database.
+
+    Skipped when ``MONGO_DB_URL`` does not answer.
+    """
+
+    async def asyncSetUp(self) -> None:
+        self.client = AsyncIOMotorClient(settings.MONGO_DB_URL, serverSelectionTimeoutMS=2000)
+        self.addAsyncCleanup(self._close)
+        try:
+            await self.client.admin.command("ping")
+        except PyMongoError as error:
+            self.skipTest(f"MongoDB is not reachable: {error}")
+        self.database = self.client[f"{settings.MONGO_DB_NAME}_test"]
+        await self.client.drop_database(self.database.name)
+        patcher = mock.patch.object(TaskCollection, "_collection", self.database["tasks"])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        await TaskCollection.create_indexes()
+
+        # Mostly finished tasks, so a plan that does not use the partial index
+        # would have to read and discard most of the collection.
+        now = datetime.now(tz=timezone.utc)
+        project_id = ObjectId()
+        documents = [
+            TaskDocument(
+                project_id=project_id,
+                title=f"Task {index}",
+                status=TaskStatus.todo if index % 20 == 0 else TaskStatus.done,
+                is_open=index % 20 == 0,
+                due_date=now + timedelta(days=index % 60 - 30),
+            )
+            for index in range(2000)
+        ]
+        _, errors = await TaskCollection.insert_many(documents)
+        self.assertEqual(errors, {})
+
+    async def _close(self) -> None:
+        if hasattr(self, "database"):
+            await self.client.drop_database(self.database.name)
+        self.client.close()
+
+    async def test_deadline_queries_scan_the_open_due_index(self) -> None:
+        plans = await TaskCollection.explain_deadline_queries(datetime.now(tz=timezone.utc))
+        self.assertEqual(
+            set(plans), {"find_overdue", "find_upcoming", "count_overdue", "dashboard_summary"}
+        )
+        for name, indexes in plans.items():
+            with self.subTest(query=name):
+                self.assertIn(TaskCollection.OPEN_DUE_INDEX, indexes)
+
+
+if __name__ == "__main__":
+    unittest.main()
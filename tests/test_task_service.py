@@ -0,0 +1,70 @@
+import os
+import unittest
+from dataclasses import asdict
+from unittest import mock
+
+from bson import ObjectId
+
+os.environ.setdefault("MONGO_DB_URL", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET_KEY", "test")
+
+from app.collections.task_collection import TaskCollection  # noqa: E402
+from app.db.event_bus import event_bus  # noqa: E402
+from app.documents.task_document import TaskDocument  # noqa: E402
+from app.requests.task_request import TaskCreateRequest, TaskUpdateRequest  # noqa: E402
+from app.services.activity_service import ActivityService  # noqa: E402
+from app.services.counter_service import CounterService  # noqa: E402
+from app.services.task_service import TaskService  # noqa: E402
+
+
+class CreateTasksTest(unittest.IsolatedAsyncioTestCase):
+    async def test_malformed_ids_are_per_item_errors(self) -> None:
+        async def insert_many(documents):
+            return [asdict(document) for document in documents], {1: "Duplicate key"}
+
+        project_id = str(ObjectId())
+        requests = [
+            TaskCreateRequest(project_id=project_id, title="ok"),
+            TaskCreateRequest(project_id="bad", title="bad project"),
+            TaskCreateRequest(project_id=project_id, title="rejected by the database"),
+            TaskCreateRequest(project_id=project_id, title="bad assignee", assignee_id="nope"),
+        ]
+        with (
+            mock.patch.object(TaskCollection, "insert_many", side_effect=insert_many) as inserted,
+            mock.patch.object(CounterService, "tasks_changed", mock.AsyncMock()),
+            mock.patch.object(event_bus, "publish", mock.AsyncMock()),
+            mock.patch.object(ActivityService, "log_many", mock.AsyncMock()),
+        ):
+            results = await TaskService.create_tasks(requests)
+        self.assertEqual(len(inserted.call_args.args[0]), 2)
+        self.assertEqual([result.index for result in results], [0, 1, 2, 3])
+        self.assertEqual(results[0].data.title, "ok")
+        self.assertEqual(
+            [result.error for result in results], [None, "Invalid id", "Duplicate key", "Invalid id"]
+        )
+
+
+class UpdateTaskTest(unittest.IsolatedAsyncioTestCase):
+    async def test_event_is_published_after_the_counters(self) -> None:
+        previous = asdict(TaskDocument(project_id=ObjectId(), title="Review"))
+        task_id = previous["_id"]
+        calls: list[str] = []
+
+        async def update(_, data):
+            return previous, {**previous, **data}
+
+        with (
+            mock.patch.object(TaskCollection, "update", side_effect=update),
+            mock.patch.object(
+                CounterService, "task_changed", mock.AsyncMock(side_effect=lambda *_: calls.append("counters"))
+            ),
+            mock.patch.object(event_bus, "publish", mock.AsyncMock(side_effect=lambda *_: calls.append("event"))),
+            mock.patch.object(ActivityService, "log", mock.AsyncMock()),
+        ):
+            await TaskService.update_task(str(task_id), TaskUpdateRequest(status="done"))
+        # Publishing invalidates the dashboard summary, which must not be recomputed from old counters.
+        self.assertEqual(calls, ["counters", "event"])
+
+
+if __name__ == "__main__":
+    unittest.main()
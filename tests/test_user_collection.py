@@ -0,0 +1,79 @@
+import os
+import unittest
+from types import SimpleNamespace
+from typing import Any
+from unittest import mock
+
+from bson import ObjectId
+
+os.environ.setdefault("MONGO_DB_URL", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET_KEY", "test")
+
+from app.collections.user_collection import UserCollection  # noqa: E402
+
+
+class _Cursor:
+    def __init__(self, documents: list[dict[str, Any]]) -> None:
+        self.documents = documents
+
+    async def to_list(self, length: int | None) -> list[dict[str, Any]]:
+        return self.documents
+
+    def __aiter__(self):
+        async def iterate():
+            for document in self.documents:
+                yield document
+
+        return iterate()
+
+
+class _FakeUsers:
+    """Just enough of a Motor collection for :meth:`UserCollection.backfill_login_ids`."""
+
+    def __init__(self, documents: list[dict[str, Any]]) -> None:
+        self.documents = documents
+
+    def find(self, query: dict[str, Any], projection: dict[str, Any]) -> _Cursor:
+        if "email" in query:
+            return _Cursor([document for document in self.documents if "email" in document])
+        logins = query["login_id"]["$in"]
+        return _Cursor([document for document in self.documents if document.get("login_id") in logins])
+
+    async def update_many(self, query: dict[str, Any], pipeline: list[dict[str, Any]]):
+        skipped = query["_id"]["$nin"]
+        modified = 0
+        for document in self.documents:
+            if "email" in document and document["_id"] not in skipped:
+                email = document.pop("email")
+                if document.get("login_id") is None:
+                    document["login_id"] = email
+                modified += 1
+        return SimpleNamespace(modified_count=modified)
+
+
+class BackfillLoginIdsTest(unittest.IsolatedAsyncioTestCase):
+    async def test_conflicting_emails_are_skipped(self) -> None:
+        users = _FakeUsers(
+            [
+                {"_id": ObjectId(), "login_id": "kim"},
+                {"_id": ObjectId(), "email": "kim"},
+                {"_id": ObjectId(), "email": "lee"},
+                {"_id": ObjectId(), "email": "lee"},
+                {"_id": ObjectId(), "email": "park"},
+                {"_id": ObjectId(), "login_id": "choi", "email": "choi@example.com"},
+            ]
+        )
+        with (
+            mock.patch.object(UserCollection, "_collection", users),
+            self.assertLogs("app.collections.user_collection", "WARNING"),
+        ):
+            modified = await UserCollection.backfill_login_ids()
+        self.assertEqual(modified, 2)
+        self.assertEqual(
+            [(document.get("login_id"), document.get("email")) for document in users.documents],
+            [("kim", None), (None, "kim"), (None, "lee"), (None, "lee"), ("park", None), ("choi", None)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,6 +31,7 @@ const App = () => {
     fetchDashboard,
     fetchProjects,
     fetchTasks,
+    subscribeProject,
   } = useProjectStore((state) => ({
     projects: state.projects,
     dashboard: state.dashboard,
@@ -40,6 +41,7 @@ const App = () => {
     fetchDashboard: state.fetchDashboard,
     fetchProjects: state.fetchProjects,
     fetchTasks: state.fetchTasks,
+    subscribeProject: state.subscribeProject,
   }));
 
   useEffect(() => {
@@ -57,6 +59,18 @@ const App = () => {
     });
   }, [projects, tasks, fetchTasks, user]);
 
+  // Project updates replace the array, so subscriptions follow the ids rather than the objects.
+  const streamedProjectIds = projects
+    .slice(0, 4)
+    .map((project) => project.id)
+    .join(",");
+
+  useEffect(() => {
+    if (!user || !streamedProjectIds) return;
+    const unsubscribes = streamedProjectIds.split(",").map((projectId) => subscribeProject(projectId));
+    return () => unsubscribes.forEach((unsubscribe) => unsubscribe());
+  }, [streamedProjectIds, subscribeProject, user]);
+
   const allTasks = useMemo(() => Object.values(tasks).flat(), [tasks]);
 
   const content = user ? (
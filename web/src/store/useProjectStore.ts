@@ -25,11 +25,32 @@ interface ProjectStoreState {
   fetchTasks: (projectId: string) => Promise<void>;
   fetchSubtasks: (taskId: string) => Promise<void>;
   createProject: (input: { title: string; description?: string; department_id: string }) => Promise<Project | null>;
+  subscribeProject: (projectId: string) => () => void;
 }
 
+interface ChangeEvent<T> {
+  id: string;
+  changes: Partial<T>;
+}
+
+const applyChanges = <T extends { id: string }>(items: T[], { id, changes }: ChangeEvent<T>): T[] =>
+  items.map((item) => (item.id === id ? { ...item, ...changes } : item));
+
+const byRank = (a: Subtask, b: Subtask): number => {
+  const left = a.rank ?? "";
+  const right = b.rank ?? "";
+  return left < right ? -1 : left > right ? 1 : 0;
+};
+
+const mapSubtaskLists = (
+  lists: Record<string, Subtask[]>,
+  update: (items: Subtask[]) => Subtask[],
+): Record<string, Subtask[]> =>
+  Object.fromEntries(Object.entries(lists).map(([taskId, items]) => [taskId, update(items)]));
+
 const DEFAULT_PROJECT_ERROR = "\uD504\uB85C\uC81D\uD2B8 \uC815\uBCF4\uB97C \uBD88\uB7EC\uC624\uC9C0 \uBABB\uD588\uC2B5\uB2C8\uB2E4.";
 
-export const useProjectStore = create<ProjectStoreState>((set) => ({
+export const useProjectStore = create<ProjectStoreState>((set, get) => ({
   projects: [],
   tasks: {},
   subtasks: {},
@@ -97,4 +118,59 @@ export const useProjectStore = create<ProjectStoreState>((set) => ({
       return null;
     }
   },
+  subscribeProject(projectId) {
+    // Live changes replace polling; after a reconnect (e.g. the server dropped a
+    // slow stream) the task list is refetched once to catch up.
+    const source = new EventSource(`${api.defaults.baseURL}/projects/${projectId}/events`);
+    let connected = false;
+    source.onopen = () => {
+      if (connected) {
+        void get().fetchTasks(projectId);
+      }
+      connected = true;
+    };
+    const on = <T,>(event: string, handler: (data: T) => void) =>
+      source.addEventListener(event, (message) => handler(JSON.parse((message as MessageEvent).data) as T));
+
+    const updateTasks = (update: (items: Task[]) => Task[]) =>
+      set((state) => ({ tasks: { ...state.tasks, [projectId]: update(state.tasks[projectId] ?? []) } }));
+    on<Task>("task.created", (task) => updateTasks((items) => [...items, task]));
+    on<ChangeEvent<Task>>("task.updated", (change) => updateTasks((items) => applyChanges(items, change)));
+    on<{ id: string }>("task.deleted", ({ id }) => updateTasks((items) => items.filter((task) => task.id !== id)));
+
+    on<Subtask>("subtask.created", (subtask) =>
+      set((state) => ({
+        subtasks: { ...state.subtasks, [subtask.task_id]: [...(state.subtasks[subtask.task_id] ?? []), subtask] },
+      })),
+    );
+    on<ChangeEvent<Subtask>>("subtask.updated", (change) =>
+      set((state) => ({
+        subtasks: mapSubtaskLists(state.subtasks, (items) => {
+          const updated = applyChanges(items, change);
+          return change.changes.rank === undefined ? updated : updated.sort(byRank);
+        }),
+      })),
+    );
+    on<{ id: string }>("subtask.deleted", ({ id }) =>
+      set((state) => ({
+        subtasks: mapSubtaskLists(state.subtasks, (items) => items.filter((subtask) => subtask.id !== id)),
+      })),
+    );
+    on<{ task_id: string; ranks: Record<string, string> }>("subtask.reordered", ({ task_id, ranks }) =>
+      set((state) => {
+        const items = (state.subtasks[task_id] ?? [])
+          .map((subtask) => (subtask.id in ranks ? { ...subtask, rank: ranks[subtask.id] } : subtask))
+          .sort(byRank);
+        return { subtasks: { ...state.subtasks, [task_id]: items } };
+      }),
+    );
+
+    on<ChangeEvent<Project>>("project.updated", (change) =>
+      set((state) => ({ projects: applyChanges(state.projects, change) })),
+    );
+    on<{ id: string }>("project.deleted", ({ id }) =>
+      set((state) => ({ projects: state.projects.filter((project) => project.id !== id) })),
+    );
+    return () => source.close();
+  },
 }));
\ No newline at end of file
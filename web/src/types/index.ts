@@ -100,6 +100,7 @@ export interface Subtask extends BaseEntity {
   status: SubtaskStatus;
   assignee_id?: string | null;
   order: number;
+  rank?: string | null;
   due_date?: string | null;
 }
 
@@ -127,6 +128,7 @@ export interface ApiResponse<T> {
   status_code: number;
   detail: string;
   data: T;
+  next_cursor?: string | null;
 }
 
 export interface AuthUser {